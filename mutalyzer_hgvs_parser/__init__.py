@@ -1,31 +1,60 @@
 from __future__ import annotations
 
-from importlib.metadata import metadata
+import functools
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .convert import to_model
-from .hgvs_parser import parse
+if TYPE_CHECKING:
+    from importlib.metadata import PackageMetadata
 
-__all__ = ["parse", "to_model"]
+    from .convert import to_model, to_model_many
+    from .hgvs_parser import parse, parse_many
+
+__all__ = ["parse", "parse_many", "to_model", "to_model_many"]
+
+# Imported on first access, so that importing the package does not
+# import lark and the grammar related modules.
+_LAZY_ATTRIBUTES = {
+    "parse": "hgvs_parser",
+    "parse_many": "hgvs_parser",
+    "to_model": "convert",
+    "to_model_many": "convert",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name == "usage":
+        return [_get_metadata("Summary"), _copyright_notice()]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache
+def _metadata() -> PackageMetadata:
+    from importlib.metadata import metadata
+
+    return metadata(__package__)
 
 
 def _get_metadata(name: str) -> str:
-    meta = metadata(__package__)
-    values = meta.get_all(name)
+    values = _metadata().get_all(name)
     return values[0] if values else ""
 
 
 def _get_homepage() -> str:
-    meta = metadata(__package__)
-    for project_url in meta.get_all("Project-URL") or []:
+    for project_url in _metadata().get_all("Project-URL") or []:
         label, url = project_url.split(", ", 1)
         if label == "Homepage":
             return url
     return ""
 
 
-_copyright_notice = "Copyright (c) {}".format(_get_metadata("Author-email"))
-
-usage = [_get_metadata("Summary"), _copyright_notice]
+def _copyright_notice() -> str:
+    return "Copyright (c) {}".format(_get_metadata("Author-email"))
 
 
 def doc_split(func: object) -> str:
@@ -36,6 +65,6 @@ def version(name: str) -> str:
     return "{} version {}\n\n{}\nHomepage: {}".format(
         _get_metadata("Name"),
         _get_metadata("Version"),
-        _copyright_notice,
+        _copyright_notice(),
         _get_homepage(),
     )
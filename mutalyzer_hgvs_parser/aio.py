@@ -0,0 +1,245 @@
+"""
+Module for parsing and converting descriptions from asyncio code, without
+blocking the event loop.
+
+.. code:: python
+
+    >>> model = await ato_model("NM_004006.2:c.4375C>T")
+    >>> async for model in ato_model_many(descriptions):
+    ...     pass
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import os
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable
+
+from lark import Tree
+
+from .convert import ModelResult, _init_worker, _to_model_chunk, to_model
+from .hgvs_parser import Limits, parse
+
+
+class AsyncConverter:
+    """
+    Runs the parsing and the conversion on a bounded executor, either
+    threads sharing the parsers, or processes, each with its own parsers.
+
+    At most `max_pending` calls (or batch chunks) of an event loop are
+    submitted to the executor at any time, further calls wait for their
+    turn, and a cancelled call that did not start yet is not run.
+    """
+
+    def __init__(self, workers: int | None = None, processes: bool = False, max_pending: int | None = None):
+        """
+        :arg int workers: Number of worker threads or processes (by default
+            the number of CPUs, at most 4).
+        :arg bool processes: Use worker processes instead of threads.
+        :arg int max_pending: Maximum number of calls (or batch chunks)
+            submitted at once per event loop (by default twice the number
+            of workers).
+        """
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending or 2 * self.workers
+        self._executor: Executor
+        if processes:
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(None,))
+        else:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="mutalyzer_hgvs_parser")
+        # A semaphore is bound to the event loop it is first used in, so
+        # there is one per loop, created on first use within it.
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._semaphores_lock = threading.Lock()
+
+    async def __aenter__(self) -> AsyncConverter:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut the executor down, without waiting for the calls in progress.
+        """
+        self._executor.shutdown(wait=False)
+
+    async def parse(
+        self,
+        description: str,
+        grammar_path: str | None = None,
+        start_rule: str | None = None,
+        limits: Limits | None = None,
+    ) -> Tree:
+        """
+        Asynchronous equivalent of `parse()`.
+
+        :arg str description: Description (or description part) to be parsed.
+        :arg str grammar_path: Path towards a different grammar file.
+        :arg str start_rule: Alternative start rule for the grammar.
+        :arg Limits limits: Limits on the description.
+        :returns: Parse tree.
+        :rtype: lark.Tree
+        :raises LimitExceeded: If the description exceeds a limit.
+        """
+        return await self._run(parse, description, grammar_path, start_rule, limits)
+
+    async def to_model(self, description: str, start_rule: str | None = None, limits: Limits | None = None) -> dict:
+        """
+        Asynchronous equivalent of `to_model()`.
+
+        :arg str description: HGVS description.
+        :arg str start_rule: Alternative start rule.
+        :arg Limits limits: Limits on the description.
+        :returns: Description dictionary model.
+        :rtype: dict
+        :raises LimitExceeded: If the description exceeds a limit.
+        """
+        return await self._run(to_model, description, start_rule, limits)
+
+    async def to_model_many(
+        self,
+        descriptions: Iterable[str] | AsyncIterable[str],
+        start_rule: str | None = None,
+        chunk_size: int = 20,
+        limits: Limits | None = None,
+    ) -> AsyncIterator[ModelResult]:
+        """
+        Asynchronous equivalent of `to_model_many()`. The descriptions are
+        read only as the models are consumed, with at most `max_pending`
+        chunks in progress, shared with the other calls in the event loop.
+        Closing the iterator (or cancelling the task consuming it) cancels
+        the chunks in progress.
+
+        :arg iterable descriptions: HGVS descriptions (possibly
+            asynchronous).
+        :arg str start_rule: Alternative start rule.
+        :arg int chunk_size: Number of descriptions submitted at once.
+        :arg Limits limits: Limits on every description.
+        :returns: Description dictionary models or errors.
+        :rtype: async iterator
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore()
+        pending: deque[asyncio.Future] = deque()
+        try:
+            async for chunk in _chunks(descriptions, chunk_size):
+                await semaphore.acquire()
+                future = loop.run_in_executor(self._executor, _to_model_chunk, chunk, start_rule, limits)
+                # Released when the chunk is done (or cancelled), not when
+                # its models are consumed, so that other calls can proceed.
+                future.add_done_callback(lambda _: semaphore.release())
+                pending.append(future)
+                if len(pending) >= self.max_pending:
+                    for model in await pending.popleft():
+                        yield model
+            while pending:
+                for model in await pending.popleft():
+                    yield model
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _run(self, function: Callable, *args: Any) -> Any:
+        async with self._semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(function, *args))
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._semaphores_lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_pending)
+        return semaphore
+
+
+async def _chunks(descriptions: Iterable[str] | AsyncIterable[str], chunk_size: int) -> AsyncIterator[list[str]]:
+    if isinstance(descriptions, AsyncIterable):
+        chunk = []
+        async for description in descriptions:
+            chunk.append(description)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    else:
+        iterator = iter(descriptions)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                break
+            yield chunk
+
+
+_converter: AsyncConverter | None = None
+_converter_lock = threading.Lock()
+
+
+def _get_converter() -> AsyncConverter:
+    global _converter
+    if _converter is None:
+        with _converter_lock:
+            if _converter is None:
+                _converter = AsyncConverter()
+    return _converter
+
+
+async def aparse(
+    description: str, grammar_path: str | None = None, start_rule: str | None = None, limits: Limits | None = None
+) -> Tree:
+    """
+    Asynchronous equivalent of `parse()`, run on a shared thread pool.
+
+    :arg str description: Description (or description part) to be parsed.
+    :arg str grammar_path: Path towards a different grammar file.
+    :arg str start_rule: Alternative start rule for the grammar.
+    :arg Limits limits: Limits on the description.
+    :returns: Parse tree.
+    :rtype: lark.Tree
+    :raises LimitExceeded: If the description exceeds a limit.
+    """
+    return await _get_converter().parse(description, grammar_path, start_rule, limits)
+
+
+async def ato_model(description: str, start_rule: str | None = None, limits: Limits | None = None) -> dict:
+    """
+    Asynchronous equivalent of `to_model()`, run on a shared thread pool.
+
+    :arg str description: HGVS description.
+    :arg str start_rule: Alternative start rule.
+    :arg Limits limits: Limits on the description.
+    :returns: Description dictionary model.
+    :rtype: dict
+    :raises LimitExceeded: If the description exceeds a limit.
+    """
+    return await _get_converter().to_model(description, start_rule, limits)
+
+
+def ato_model_many(
+    descriptions: Iterable[str] | AsyncIterable[str],
+    start_rule: str | None = None,
+    chunk_size: int = 20,
+    limits: Limits | None = None,
+) -> AsyncIterator[ModelResult]:
+    """
+    Asynchronous equivalent of `to_model_many()`, run on a shared thread
+    pool.
+
+    :arg iterable descriptions: HGVS descriptions (possibly asynchronous).
+    :arg str start_rule: Alternative start rule.
+    :arg int chunk_size: Number of descriptions submitted at once.
+    :arg Limits limits: Limits on every description.
+    :returns: Description dictionary models or errors.
+    :rtype: async iterator
+    """
+    return _get_converter().to_model_many(descriptions, start_rule, chunk_size, limits)
@@ -0,0 +1,182 @@
+"""
+Module for converting alleles with many variants, e.g.,
+`NM_000088.3:c.[100del;200dup;5000A>G]`, variant by variant.
+
+The variants list is split at its top level semicolons, and every variant
+is converted on its own, as a single variant description with a stand-in
+reference. The conversion time is then linear in the number of variants,
+the models of the variants repeated across alleles are cached, and the
+variants can be converted in parallel.
+"""
+
+from __future__ import annotations
+
+import copy
+
+from .cache import ResultCache
+from .convert import to_model, to_model_many
+from .header import scan_header
+from .hgvs_parser import Limits
+
+# Stand-in reference of the single variant descriptions, so that their
+# models are cached independently of the allele reference.
+_REFERENCE = "R"
+
+_WS = " \t\f\r\n"
+
+# Shared by default between the calls.
+_variant_cache = ResultCache(max_size=100000)
+
+
+def split_allele(description: str) -> tuple[dict, list[str]] | None:
+    """
+    Split an HGVS allele description in its header (the reference and the
+    coordinate system) and its variants. The variants are not validated.
+
+    :arg str description: HGVS description.
+    :returns: The header model and the variants, or `None` if the
+        description is not an allele with at least two variants and an
+        explicit coordinate system.
+    :rtype: tuple
+    """
+    scanned = scan_header(description)
+    if scanned is None:
+        return None
+    header, position = scanned
+    if "coordinate_system" not in header:
+        return None
+
+    variants_list = description[position:].rstrip(_WS)
+    if not (variants_list.startswith("[") and variants_list.endswith("]")):
+        return None
+    variants = _split(variants_list[1:-1])
+    if variants is None or len(variants) < 2:
+        return None
+    return header, variants
+
+
+def _split(variants_list: str) -> list[str] | None:
+    """
+    The semicolons in brackets, e.g., in inserted lists or in nested
+    descriptions, do not separate variants. Returns `None` if the brackets
+    are not balanced.
+    """
+    variants = []
+    depth = start = 0
+    for i, character in enumerate(variants_list):
+        if character in "([":
+            depth += 1
+        elif character in ")]":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif character == ";" and depth == 0:
+            variants.append(variants_list[start:i].strip(_WS))
+            start = i + 1
+    if depth:
+        return None
+    variants.append(variants_list[start:].strip(_WS))
+    return variants
+
+
+def to_allele_model(
+    description: str,
+    cache: ResultCache | None = None,
+    workers: int | None = None,
+    chunk_size: int = 100,
+    limits: Limits | None = None,
+) -> dict:
+    """
+    Convert an HGVS description to a nested dictionary model, identical to
+    the `to_model()` output, converting the variants of an allele
+    separately. Other descriptions are converted by `to_model()`, as are
+    the alleles with a variant that cannot be converted on its own, so
+    that the same errors are raised.
+
+    The length and the depth limits apply to the whole description, the
+    ambiguities and the timeout limits to every variant (an allele with a
+    variant exceeding them is converted by `to_model()`, with the same
+    limits).
+
+    :arg str description: HGVS description.
+    :arg ResultCache cache: Cache for the variant models (a cache shared
+        between the calls by default).
+    :arg int workers: Number of worker processes to distribute the variants
+        over (by default they are converted in the current process).
+    :arg int chunk_size: Number of variants sent at once to a worker.
+    :arg Limits limits: Limits on the description.
+    :returns: Description dictionary model.
+    :rtype: dict
+    :raises LimitExceeded: If the description exceeds a limit.
+    """
+    allele = split_allele(description)
+    if allele is None:
+        return to_model(description, limits=limits)
+    header, variants = allele
+    if limits is not None:
+        limits.check(description)
+
+    models = _variant_models(
+        variants, header["coordinate_system"], _variant_cache if cache is None else cache, workers, chunk_size, limits
+    )
+    if models is None:
+        return to_model(description, limits=limits)
+
+    model: dict = {"type": "description_protein" if header["coordinate_system"] == "p" else "description_dna"}
+    model.update(header)
+    model["variants"] = models
+    return model
+
+
+def _variant_models(
+    variants: list[str],
+    coordinate_system: str,
+    cache: ResultCache,
+    workers: int | None,
+    chunk_size: int,
+    limits: Limits | None,
+) -> list[dict] | None:
+    """
+    The variants are converted only once per allele, and only if not
+    cached. Returns `None` if a variant is not valid on its own.
+    """
+    keys = [_key(variant, coordinate_system) for variant in variants]
+    models = {}
+    missing = []
+    for key in dict.fromkeys(keys):
+        model = cache.get(("to_model", *key, limits))
+        if model is not None:
+            models[key] = model
+        else:
+            missing.append(key)
+
+    for start_rule in {start_rule for _, start_rule in missing}:
+        group = [key for key in missing if key[1] == start_rule]
+        descriptions = [description for description, _ in group]
+        for key, model in zip(group, to_model_many(descriptions, start_rule, workers, chunk_size, limits)):
+            if not isinstance(model, dict):
+                return None
+            cache.put(("to_model", *key, limits), model)
+            # The cached entry is not returned, as it could be modified.
+            models[key] = copy.deepcopy(model)
+
+    output = []
+    converted = set()
+    for key in keys:
+        # A repeated variant gets its own copy.
+        model = copy.deepcopy(models[key]) if key in converted else models[key]
+        converted.add(key)
+        output.append(model if key[1] is not None else model["variants"][0])
+    return output
+
+
+def _key(variant: str, coordinate_system: str) -> tuple[str, str | None]:
+    """
+    A variant is converted as a single variant description (which takes
+    the fast path or the LALR parser if possible), unless that description
+    would not consist of exactly this variant, i.e., for a predicted
+    variant, or for `=`.
+    """
+    if variant.startswith("(") or variant == "=":
+        return variant, "p_variant" if coordinate_system == "p" else "variant"
+    return f"{_REFERENCE}:{coordinate_system}.{variant}", None
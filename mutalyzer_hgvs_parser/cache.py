@@ -0,0 +1,137 @@
+"""
+Module for memoizing the parse trees and the models of repeated
+descriptions.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+from lark import Tree
+
+from .convert import to_model
+from .hgvs_parser import Limits, parse
+
+
+class ResultCache:
+    """
+    Bounded least recently used cache in front of `parse()` and
+    `to_model()`, keyed on the description, the start rule, and the
+    limits.
+
+    Copies of the cached entries are returned, so that callers cannot
+    modify them. Errors are not cached.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """
+        :arg int max_size: Maximum number of cached entries.
+        """
+        if max_size < 1:
+            raise ValueError("The cache size should be at least 1.")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, description: str, start_rule: str | None = None, limits: Limits | None = None) -> Tree:
+        """
+        Cached equivalent of `parse()`.
+
+        :arg str description: Description (or description part) to be parsed.
+        :arg str start_rule: Alternative start rule for the grammar.
+        :arg Limits limits: Limits on the description.
+        :returns: Parse tree.
+        :rtype: lark.Tree
+        :raises LimitExceeded: If the description exceeds a limit.
+        """
+        return self._get(
+            ("parse", description, start_rule, limits), lambda: parse(description, start_rule=start_rule, limits=limits)
+        )
+
+    def to_model(self, description: str, start_rule: str | None = None, limits: Limits | None = None) -> dict:
+        """
+        Cached equivalent of `to_model()`.
+
+        :arg str description: HGVS description.
+        :arg str start_rule: Alternative start rule.
+        :arg Limits limits: Limits on the description.
+        :returns: Description dictionary model.
+        :rtype: dict
+        :raises LimitExceeded: If the description exceeds a limit.
+        """
+        return self._get(
+            ("to_model", description, start_rule, limits), lambda: to_model(description, start_rule, limits)
+        )
+
+    def stats(self) -> dict:
+        """
+        Get the cache counters.
+
+        :returns: Hits, misses, evictions, size, and maximum size.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+    def clear(self) -> None:
+        """
+        Remove all the entries and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: tuple) -> Any:
+        """
+        Get a copy of a cached entry.
+
+        :arg tuple key: The function name (`parse` or `to_model`), the
+            description, the start rule, and the limits.
+        :returns: The entry, or `None` if it is not cached.
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return copy.deepcopy(self._entries[key])
+            self.misses += 1
+        return None
+
+    def put(self, key: tuple, value: Any) -> None:
+        """
+        Cache an entry, e.g., computed in another process. The entry is
+        not copied, so it should not be modified afterwards.
+
+        :arg tuple key: The function name (`parse` or `to_model`), the
+            description, the start rule, and the limits.
+        :arg value: The parse tree or the model.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _get(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        # Computed outside the lock, so other threads are not blocked.
+        value = compute()
+
+        self.put(key, value)
+        return copy.deepcopy(value)
@@ -5,20 +5,25 @@ CLI entry point.
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
+import sys
+from typing import TYPE_CHECKING, Any, TextIO
 
-from lark import Tree
-from lark.tree import pydot__tree_to_png
+from . import version
 
-from . import usage, version
-from .convert import parse_tree_to_model
-from .hgvs_parser import get_parser, parse
+# The parser modules (and lark) are imported when parsing, so that, e.g.,
+# `-v` and `--help` do not wait for them.
+if TYPE_CHECKING:
+    from lark import Tree
 
 
 def _parse(description: str, grammar_path: str | None, start_rule: str | None) -> Tree:
     """
     CLI wrapper for parsing with no conversion to model.
     """
+    from .hgvs_parser import parse
+
     parse_tree = parse(description, grammar_path, start_rule)
     print("Successfully parsed:\n {}".format(description))
     return parse_tree
@@ -28,6 +33,9 @@ def _to_model(description: str, start_rule: str | None) -> Tree:
     """
     CLI wrapper for parsing, converting, and printing the model.
     """
+    from .convert import parse_tree_to_model
+    from .hgvs_parser import parse
+
     parse_tree = parse(description, start_rule=start_rule)
     model = parse_tree_to_model(parse_tree)
     if isinstance(model, (dict, list)):
@@ -38,20 +46,101 @@ def _to_model(description: str, start_rule: str | None) -> Tree:
 
 
 def _parse_raw(description: str, grammar_path: str | None, start_rule: str | None) -> Tree:
+    from .hgvs_parser import get_parser
+
     return get_parser(grammar_path, start_rule).parse(description)
 
 
+def _to_model_stream(input_file: TextIO, start_rule: str | None, workers: int | None) -> None:
+    """
+    CLI wrapper for converting one description per line and printing
+    the models, or the errors, as JSON Lines.
+    """
+    from .convert import to_model_many
+
+    descriptions, inputs = itertools.tee(
+        description for description in (line.strip() for line in input_file) if description
+    )
+    for description, model in zip(inputs, to_model_many(descriptions, start_rule, workers)):
+        if isinstance(model, Exception):
+            output = {"input": description, "error": _serialize_error(model)}
+        else:
+            output = {"input": description, "model": model}
+        print(json.dumps(output))
+
+
+def _serialize_error(error: Exception) -> dict:
+    output = {"type": error.__class__.__name__}
+    serialize = getattr(error, "serialize", None)
+    if serialize:
+        output.update(serialize())
+    return output
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """
+    Reads the package metadata for the description and epilog only when
+    they are used, e.g., when the help is printed or the documentation
+    is built, and not when the arguments are parsed.
+    """
+
+    _description: str | None = None
+    _epilog: str | None = None
+
+    @property
+    def description(self) -> str | None:
+        from . import usage
+
+        return self._description or usage[0]
+
+    @description.setter
+    def description(self, description: str | None) -> None:
+        self._description = description
+
+    @property
+    def epilog(self) -> str | None:
+        from . import usage
+
+        return self._epilog or usage[1]
+
+    @epilog.setter
+    def epilog(self, epilog: str | None) -> None:
+        self._epilog = epilog
+
+
+class _VersionAction(argparse.Action):
+    """
+    Reads the package metadata only when the version is printed.
+    """
+
+    def __init__(self, option_strings: list[str], dest: str = argparse.SUPPRESS, help: str | None = None):
+        super().__init__(option_strings, dest, nargs=0, default=argparse.SUPPRESS, help=help)
+
+    def __call__(self, parser: argparse.ArgumentParser, *args: Any) -> None:
+        print(version(parser.prog))
+        parser.exit()
+
+
 def _arg_parser() -> argparse.ArgumentParser:
     """
     Command line argument parsing.
     """
-    parser = argparse.ArgumentParser(
-        description=usage[0],
-        epilog=usage[1],
-        formatter_class=argparse.RawDescriptionHelpFormatter,
+    parser = _ArgumentParser(formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument(
+        "description", nargs="?", help="the HGVS variant description to be parsed"
     )
 
-    parser.add_argument("description", help="the HGVS variant description to be parsed")
+    parser.add_argument(
+        "--input",
+        metavar="FILE",
+        type=argparse.FileType("r"),
+        help="convert one description per line from FILE ('-' for stdin) to JSON Lines",
+    )
+
+    parser.add_argument(
+        "-w", type=int, help="number of worker processes (with --input)"
+    )
 
     alt = parser.add_mutually_exclusive_group()
 
@@ -73,12 +162,16 @@ def _arg_parser() -> argparse.ArgumentParser:
         "-i", help="save the parse tree as a PNG image (pydot required!)"
     )
 
-    parser.add_argument("-v", action="version", version=version(parser.prog))
+    parser.add_argument("-v", action=_VersionAction, help="show program's version number and exit")
 
     return parser
 
 
 def _cli(args: argparse.Namespace) -> None:
+    if args.input:
+        _to_model_stream(args.input, args.r, args.w)
+        return
+
     if args.c:
         parse_tree = _to_model(args.description, args.r)
     elif args.p:
@@ -88,6 +181,8 @@ def _cli(args: argparse.Namespace) -> None:
         parse_tree = _parse(args.description, args.g, args.r)
 
     if args.i and parse_tree:
+        from lark.tree import pydot__tree_to_png
+
         pydot__tree_to_png(parse_tree, args.i)
         print("Parse tree image saved to:\n {}".format(args.i))
 
@@ -98,7 +193,16 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    _cli(args)
+    if (args.description is None) == (args.input is None):
+        parser.error("either a description or --input is required")
+    if args.input and (args.g or args.p or args.i):
+        parser.error("--input cannot be combined with -g, -p, or -i")
+
+    try:
+        _cli(args)
+    except BrokenPipeError:
+        # E.g., the output is piped into `head`.
+        sys.stderr.close()
 
 
 if __name__ == "__main__":
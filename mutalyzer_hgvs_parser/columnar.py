@@ -0,0 +1,218 @@
+"""
+Module for converting many HGVS descriptions at once to a columnar, table
+like, output, with one row per variant.
+
+The numeric columns are `array.array` objects, which can be used without
+copying as NumPy arrays, e.g., `numpy.frombuffer(columns.start, "int64")`,
+and `columns.as_dict()` can be passed to `pandas.DataFrame`.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable
+
+from .convert import to_model_many
+
+# Value of the numeric columns when not applicable, e.g., the end of a
+# point location, or when the variant is complex.
+MISSING = -(2**63)
+
+_OUTSIDE_CDS = {None: 0, "upstream": -1, "downstream": 1}
+
+
+class VariantColumns:
+    """
+    One row per variant, with the columns:
+
+    - `description`: index of the description in the input.
+    - `variant`: index of the variant in the description, or `-1` for
+      the single row of a description without variants (e.g., `g.=`).
+    - `reference`, `selector`, `coordinate_system`, `type`: strings (or
+      `None`).
+    - `start`, `start_offset`, `end`, `end_offset`: signed 64 bit
+      integers, `MISSING` if not applicable.
+    - `start_outside_cds`, `end_outside_cds`: `-1` (upstream), `0`, or
+      `1` (downstream).
+    - `deleted`, `inserted`: plain sequences (or `None`).
+    - `predicted`: `0` or `1`.
+    - `model`: index in `models` of the full description model, for the
+      variants that the columns cannot represent (uncertain or protein
+      locations, nested selectors, inserts other than a plain sequence,
+      etc.), and for the descriptions without variants, or `-1`.
+
+    Descriptions that could not be parsed are in `errors`, by input index.
+    """
+
+    COLUMNS = (
+        "description",
+        "variant",
+        "reference",
+        "selector",
+        "coordinate_system",
+        "type",
+        "start",
+        "start_offset",
+        "start_outside_cds",
+        "end",
+        "end_offset",
+        "end_outside_cds",
+        "deleted",
+        "inserted",
+        "predicted",
+        "model",
+    )
+
+    def __init__(self) -> None:
+        self.description = array("q")
+        self.variant = array("q")
+        self.reference: list[str] = []
+        self.selector: list[str | None] = []
+        self.coordinate_system: list[str | None] = []
+        self.type: list[str | None] = []
+        self.start = array("q")
+        self.start_offset = array("q")
+        self.start_outside_cds = array("b")
+        self.end = array("q")
+        self.end_offset = array("q")
+        self.end_outside_cds = array("b")
+        self.deleted: list[str | None] = []
+        self.inserted: list[str | None] = []
+        self.predicted = array("b")
+        self.model = array("q")
+        self.models: list[dict] = []
+        self.errors: dict[int, Exception] = {}
+
+    def __len__(self) -> int:
+        return len(self.description)
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Get the columns by name.
+
+        :returns: The columns.
+        :rtype: dict
+        """
+        return {name: getattr(self, name) for name in self.COLUMNS}
+
+    def row(self, index: int) -> dict[str, Any]:
+        """
+        Get a row by index.
+
+        :arg int index: Row index.
+        :returns: The row values by column name.
+        :rtype: dict
+        """
+        return {name: column[index] for name, column in self.as_dict().items()}
+
+    def append(self, index: int, model: dict) -> None:
+        """
+        Add the rows of the variants of a description model, or a row
+        without a variant, pointing to the model, if there are none.
+
+        :arg int index: Index of the description in the input.
+        :arg dict model: Description dictionary model.
+        """
+        reference = model["reference"]
+        selector = reference.get("selector")
+        model_index = -1
+        variants = list(enumerate(model.get("variants") or [])) or [(-1, None)]
+        for variant_index, variant in variants:
+            values = None
+            if variant is not None and not (selector and "selector" in selector):
+                values = _variant(variant)
+            if values is None:
+                if model_index == -1:
+                    model_index = len(self.models)
+                    self.models.append(model)
+                values = _EMPTY_VARIANT
+
+            self.description.append(index)
+            self.variant.append(variant_index)
+            self.reference.append(reference["id"])
+            self.selector.append(selector["id"] if selector else None)
+            self.coordinate_system.append(model.get("coordinate_system"))
+            self.type.append(variant.get("type") if variant is not None else None)
+            self.start.append(values[0])
+            self.start_offset.append(values[1])
+            self.start_outside_cds.append(values[2])
+            self.end.append(values[3])
+            self.end_offset.append(values[4])
+            self.end_outside_cds.append(values[5])
+            self.deleted.append(values[6])
+            self.inserted.append(values[7])
+            self.predicted.append(bool(model.get("predicted") or variant is not None and variant.get("predicted")))
+            self.model.append(-1 if values is not _EMPTY_VARIANT else model_index)
+
+
+_EMPTY_VARIANT = (MISSING, MISSING, 0, MISSING, MISSING, 0, None, None)
+
+
+class _Complex(Exception):
+    """
+    Raised for the values that the columns cannot represent.
+    """
+
+
+def _variant(variant: dict) -> tuple | None:
+    """
+    The location and sequences columns values, or `None` if not
+    representable.
+    """
+    try:
+        return _location(variant.get("location")) + (
+            _sequence(variant.get("deleted")),
+            _sequence(variant.get("inserted")),
+        )
+    except _Complex:
+        return None
+
+
+def _point(point: dict) -> tuple:
+    if point.get("type") != "point" or not isinstance(point.get("position"), int):
+        raise _Complex()
+    if point.keys() - {"type", "position", "offset", "outside_cds"}:
+        raise _Complex()
+    offset = point.get("offset", {"value": MISSING})
+    if "value" not in offset:
+        raise _Complex()
+    return point["position"], offset["value"], _OUTSIDE_CDS[point.get("outside_cds")]
+
+
+def _location(location: dict | None) -> tuple:
+    if location is None:
+        raise _Complex()
+    if location.get("type") == "range":
+        if location.keys() - {"type", "start", "end"}:
+            raise _Complex()
+        return _point(location["start"]) + _point(location["end"])
+    return _point(location) + (MISSING, MISSING, 0)
+
+
+def _sequence(inserted: list | None) -> str | None:
+    if inserted is None:
+        return None
+    if len(inserted) == 1 and inserted[0].keys() == {"sequence", "source"}:
+        return inserted[0]["sequence"]
+    raise _Complex()
+
+
+def to_columns(descriptions: Iterable[str], workers: int | None = None, chunk_size: int = 100) -> VariantColumns:
+    """
+    Convert the provided HGVS `descriptions` to columns, with one row per
+    variant.
+
+    :arg iterable descriptions: HGVS descriptions.
+    :arg int workers: Number of worker processes to distribute the
+        conversion over (by default it runs in the current process).
+    :arg int chunk_size: Number of descriptions sent at once to a worker.
+    :returns: The columns.
+    :rtype: VariantColumns
+    """
+    columns = VariantColumns()
+    for index, model in enumerate(to_model_many(descriptions, workers=workers, chunk_size=chunk_size)):
+        if isinstance(model, Exception):
+            columns.errors[index] = model
+        else:
+            columns.append(index, model)
+    return columns
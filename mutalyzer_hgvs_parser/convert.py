@@ -5,17 +5,22 @@ to their equivalent dictionary models.
 
 from __future__ import annotations
 
-from typing import Any
+import itertools
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, Union
 
 from lark import Token, Transformer, Tree
 from lark.exceptions import VisitError
 
-from .exceptions import NestedDescriptions
-from .hgvs_parser import parse
+from .exceptions import LimitExceeded, NestedDescriptions, UnexpectedCharacter, UnexpectedEnd
+from .fast_path import fast_to_model
+from .hgvs_parser import HgvsParser, Limits, _limited_parser, _parse_resolved, get_parser
+from .profiling import current_call, profiled, stage
 from .util import get_only_value, to_dict
 
 
-def to_model(description: str, start_rule: str | None = None) -> dict:
+def to_model(description: str, start_rule: str | None = None, limits: Limits | None = None) -> dict:
     """
     Convert an  HGVS description, or parts of it, e.g., a location,
     a variants list, etc., if an appropriate alternative `start_rule`
@@ -23,11 +28,104 @@ def to_model(description: str, start_rule: str | None = None) -> dict:
 
     :arg str description: HGVS description.
     :arg str start_rule: Alternative start rule.
+    :arg Limits limits: Limits on the description.
     :returns: Description dictionary model.
     :rtype: dict
+    :raises LimitExceeded: If the description exceeds a limit.
     """
-    parse_tree = parse(description, start_rule=start_rule)
-    return parse_tree_to_model(parse_tree)
+    return _to_model(description, start_rule, Converter(), _limited_parser(None, start_rule, limits))
+
+
+@profiled("to_model")
+def _to_model(
+    description: str, start_rule: str | None, converter: Converter, parser: HgvsParser | None = None
+) -> dict:
+    call = current_call()
+    if parser is not None:
+        # The fast path does not bypass the parser limits.
+        parser.limits.check(description)
+    if start_rule in (None, "description"):
+        with stage(call, "fast_path"):
+            model = fast_to_model(description)
+        if model is not None:
+            if call is not None:
+                call.record["start_rule"] = start_rule
+                call.record["parser"] = "fast_path"
+            return model
+    parse_tree = _parse_resolved(description, start_rule=start_rule, parser=parser)
+    with stage(call, "conversion"):
+        return _convert(parse_tree, converter)
+
+
+ModelResult = Union[dict, UnexpectedCharacter, UnexpectedEnd, NestedDescriptions, LimitExceeded]
+
+
+def to_model_many(
+    descriptions: Iterable[str],
+    start_rule: str | None = None,
+    workers: int | None = None,
+    chunk_size: int = 100,
+    limits: Limits | None = None,
+) -> Iterator[ModelResult]:
+    """
+    Convert the provided HGVS `descriptions` lazily to nested dictionary
+    models, yielded in the input order. Syntax errors, nested descriptions,
+    and exceeded limits are yielded, instead of raised, in place of the
+    corresponding models, so that one invalid description does not abort
+    the batch.
+
+    :arg iterable descriptions: HGVS descriptions.
+    :arg str start_rule: Alternative start rule.
+    :arg int workers: Number of worker processes to distribute the
+        conversion over (by default it runs in the current process).
+    :arg int chunk_size: Number of descriptions sent at once to a worker.
+    :arg Limits limits: Limits on every description.
+    :returns: Description dictionary models or errors.
+    :rtype: iterator
+    """
+    if workers:
+        yield from _to_model_many_parallel(descriptions, start_rule, workers, chunk_size, limits)
+        return
+
+    converter = Converter()
+    parser = _limited_parser(None, start_rule, limits)
+    for description in descriptions:
+        try:
+            yield _to_model(description, start_rule, converter, parser)
+        except (UnexpectedCharacter, UnexpectedEnd, NestedDescriptions, LimitExceeded) as e:
+            yield e
+
+
+def _to_model_many_parallel(
+    descriptions: Iterable[str], start_rule: str | None, workers: int, chunk_size: int, limits: Limits | None
+) -> Iterator[ModelResult]:
+    """
+    Only a bounded number of chunks is in flight at any time, so the
+    input is consumed incrementally, and the results are yielded in order.
+    """
+    # Built (or loaded from the cache) before the workers start, so that
+    # forked workers inherit it, and the others find it in the cache.
+    get_parser(start_rule=start_rule)
+
+    descriptions = iter(descriptions)
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(start_rule,)) as executor:
+        while True:
+            chunk = list(itertools.islice(descriptions, chunk_size))
+            if chunk:
+                pending.append(executor.submit(_to_model_chunk, chunk, start_rule, limits))
+            if pending and (not chunk or len(pending) >= 2 * workers):
+                yield from pending.popleft().result()
+            elif not chunk:
+                break
+
+
+def _init_worker(start_rule: str | None) -> None:
+    get_parser(start_rule=start_rule)
+
+
+def _to_model_chunk(descriptions: list[str], start_rule: str | None, limits: Limits | None = None) -> list[ModelResult]:
+    return list(to_model_many(descriptions, start_rule, limits=limits))
 
 
 def parse_tree_to_model(parse_tree: Tree) -> dict:
@@ -38,8 +136,12 @@ def parse_tree_to_model(parse_tree: Tree) -> dict:
     :returns: Description dictionary model.
     :rtype: dict
     """
+    return _convert(parse_tree, Converter())
+
+
+def _convert(parse_tree: Tree, converter: Converter) -> dict:
     try:
-        model = Converter().transform(parse_tree)
+        model = converter.transform(parse_tree)
     except VisitError as e:
         raise e.orig_exc
 
@@ -47,6 +149,13 @@ def parse_tree_to_model(parse_tree: Tree) -> dict:
 
 
 class Converter(Transformer):
+    """
+    Converts a parse tree to a model, either flattened by the
+    `FinalTransformer`, or directly after the ambiguities are solved
+    (the `variants`, `variant`, and `variant_predicted` shapes before
+    flattening are handled here), which saves a traversal.
+    """
+
     def description(self, children: list) -> dict:
         return {"description": get_only_value(children)}
 
@@ -76,6 +185,12 @@ class Converter(Transformer):
         return {"coordinate_system": name.value}
 
     def variants(self, children: list) -> dict:
+        if len(children) == 1 and ("variants" in children[0] or "variants_predicted" in children[0]):
+            # Not flattened.
+            return children[0]
+        return {"variants": [child["variant"] for child in children]}
+
+    def variants_certain(self, children: list) -> dict:
         return {"variants": [child["variant"] for child in children]}
 
     def variants_predicted(self, children: list) -> dict:
@@ -85,12 +200,15 @@ class Converter(Transformer):
         return {"variant_certain": to_dict(children)}
 
     def variant_predicted(self, children: list) -> dict:
-        output = {"variant": to_dict(children)}
+        output = {"variant": _certain(to_dict(children))}
         output["variant"]["predicted"] = True
         return output
 
     def variant(self, children: list) -> dict:
-        return {"variant": to_dict(children)}
+        if len(children) == 1 and "variant" in children[0]:
+            # Not flattened, already converted by `variant_predicted`.
+            return children[0]
+        return {"variant": _certain(to_dict(children))}
 
     def conversion(self, children: list) -> dict:
         output = {"type": "conversion", "source": "reference"}
@@ -281,6 +399,15 @@ class Converter(Transformer):
         return {"amino_acid": name.value}
 
 
+def _certain(model: dict) -> dict:
+    """
+    The `variant_certain` of a not flattened variant is unwrapped.
+    """
+    if len(model) == 1 and "variant_certain" in model:
+        return model["variant_certain"]
+    return model
+
+
 def _predicted(model: dict) -> None:
     """
 
@@ -0,0 +1,84 @@
+// LALR(1) compatible subset of the DNA grammar (dna.g), used for the
+// descriptions that do not require ambiguity solving. It produces the
+// same trees as the Earley grammar. Not covered (and left to Earley):
+// nested descriptions, repeats, lengths, predicted variants, unsigned
+// offsets, and variants without an operation.
+
+description: description_dna
+
+description_dna: reference ":" (COORDINATE_SYSTEM ".")? variants
+
+COORDINATE_SYSTEM: "a" .. "o" | "q" .. "z"
+
+// -----
+
+variants: variants_certain
+
+variants_certain: ("[" ((variant (";" variant)*) | "=") "]") | variant | "="
+
+variant: variant_certain
+
+variant_certain: location (conversion | deletion | deletion_insertion | duplication
+                  | equal | insertion | inversion | substitution)
+
+// -----
+
+location: point | uncertain_point | range
+
+point: (OUTSIDE_CDS? (NUMBER | UNKNOWN) OFFSET?) | CHROMOSOME_POINT
+
+OUTSIDE_CDS: "*" | "-"
+
+OFFSET: ("+" | "-") (NUMBER | UNKNOWN)
+
+CHROMOSOME_POINT: "pter" | "qter"
+
+uncertain_point: "(" point "_" point ")"
+
+range: (point | uncertain_point) "_" (point | uncertain_point)
+
+// -----
+
+conversion: "con" inserted
+
+deletion: "del" inserted?
+
+deletion_insertion: "del" inserted? "ins" inserted
+
+duplication: "dup" inserted?
+
+equal: "="
+
+insertion: "ins" inserted
+
+inversion: "inv" inserted?
+
+substitution: SEQUENCE? ">" inserted
+
+// The operations take precedence over the sequences they start with.
+DEL.2: "del"
+
+DUP.2: "dup"
+
+INS.2: "ins"
+
+CON.2: "con"
+
+INVERTED.2: "inv"
+
+// -----
+
+inserted: ("[" (insert (";" insert)*) "]") | insert
+
+insert: (SEQUENCE | range_location) INVERTED?
+
+range_location: range -> location
+
+// -----
+
+SEQUENCE: NT+
+
+NT: "a" | "c" | "g" | "t" | "u" | "r" | "y" | "k"
+  | "m" | "s" | "w" | "b" | "d" | "h" | "v" | "n"
+  | "A" | "C" | "G" | "T" | "U" | "R" | "Y" | "K"
+  | "M" | "S" | "W" | "B" | "D" | "H" | "V" | "N"
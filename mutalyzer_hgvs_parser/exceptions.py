@@ -14,7 +14,9 @@ class UnexpectedCharacter(Exception):
         self.unexpected_character = description[self.pos_in_stream]
         self.description = description
         self.expecting = _get_expecting(list(exception.allowed))
+        super(UnexpectedCharacter, self).__init__(self._message())
 
+    def _message(self) -> str:
         message = "Unexpected character '{}' at position {}:\n".format(
             self.unexpected_character, self.column
         )
@@ -22,11 +24,14 @@ class UnexpectedCharacter(Exception):
         message += "\nExpecting:"
         for expecting in self.expecting:
             message += "\n - {}".format(expecting)
-        super(UnexpectedCharacter, self).__init__(message)
+        return message
 
     def get_context(self) -> str:
         return "\n {}\n {}{}".format(self.description, " " * self.pos_in_stream, "^")
 
+    def __reduce__(self) -> tuple:
+        return _rebuild, (self.__class__, str(self), self.__dict__)
+
     def serialize(self) -> dict:
         return {
             "line": self.line,
@@ -55,6 +60,9 @@ class UnexpectedEnd(Exception):
     def get_context(self) -> str:
         return "\n {}\n {}{}".format(self.description, " " * self.pos_in_stream, "^")
 
+    def __reduce__(self) -> tuple:
+        return _rebuild, (self.__class__, str(self), self.__dict__)
+
     def serialize(self) -> dict:
         return {
             "pos_in_stream": self.pos_in_stream,
@@ -64,6 +72,48 @@ class UnexpectedEnd(Exception):
         }
 
 
+class LimitExceeded(Exception):
+    """
+    Parsing a description was aborted, since it exceeds one of the parser
+    limits.
+    """
+
+    def __init__(self, limit: str, maximum: float, description: str):
+        self.limit = limit
+        self.maximum = maximum
+        self.description = description
+        super(LimitExceeded, self).__init__(LIMITS[limit].format(maximum))
+
+    def __reduce__(self) -> tuple:
+        return _rebuild, (self.__class__, str(self), self.__dict__)
+
+    def serialize(self) -> dict:
+        return {
+            "limit": self.limit,
+            "maximum": self.maximum,
+            "description": self.description,
+        }
+
+
+LIMITS = {
+    "max_length": "Description longer than {} characters",
+    "max_depth": "Brackets nested deeper than {} levels",
+    "max_ambiguities": "More than {} ambiguities in the description parse tree",
+    "timeout": "Description parsing took longer than {} seconds",
+}
+
+
+def _rebuild(cls: type[Exception], message: str, state: dict) -> Exception:
+    """
+    Recreate an exception without calling its `__init__`, which expects
+    the original lark exception (e.g., when passed between processes).
+    """
+    exception = cls.__new__(cls)
+    Exception.__init__(exception, message)
+    exception.__dict__.update(state)
+    return exception
+
+
 def _get_expecting(lark_terminal_list: list[str]) -> list[str]:
     expecting = set()
     for lark_terminal in lark_terminal_list:
@@ -0,0 +1,104 @@
+"""
+Module for converting the most common simple descriptions, e.g.,
+`NM_004006.2:c.4375C>T`, `NG_012337.1:g.100del`, or `R1:c.5_6insAT`,
+directly to their models, without going through the Earley parser.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, cast
+
+_ID = r"[A-Za-z0-9][A-Za-z0-9._-]*"
+
+_SEQUENCE = r"[acgturykmswbdhvnACGTURYKMSWBDHVN]+"
+
+_POINT = r"[*-]?\d+(?:[+-](?:\d+|\?))?"
+
+_DESCRIPTION = re.compile(
+    rf"(?P<reference>{_ID})(?:\((?P<selector>{_ID})\))?:"
+    rf"(?:(?P<coordinate_system>[a-oq-z])\.)?"
+    rf"(?P<start>{_POINT})(?:_(?P<end>{_POINT}))?"
+    r"(?P<operation>[^\d].*)"
+)
+
+_POINT_PARTS = re.compile(r"(?P<outside_cds>[*-])?(?P<position>\d+)(?P<offset>[+-](?:\d+|\?))?")
+
+# Operation type, pattern, and the model keys of the captured sequences.
+_OPERATIONS = [
+    ("substitution", re.compile(rf"({_SEQUENCE})?>({_SEQUENCE})"), ["deleted", "inserted"]),
+    ("deletion_insertion", re.compile(rf"del({_SEQUENCE})?ins({_SEQUENCE})"), ["deleted", "inserted"]),
+    ("deletion", re.compile(rf"del({_SEQUENCE})?"), ["deleted"]),
+    ("duplication", re.compile(rf"dup({_SEQUENCE})?"), ["inserted"]),
+    ("insertion", re.compile(rf"ins({_SEQUENCE})"), ["inserted"]),
+    ("inversion", re.compile(r"inv"), []),
+    ("equal", re.compile(r"="), []),
+]
+
+
+def fast_to_model(description: str) -> dict | None:
+    """
+    Convert a simple HGVS description, i.e., a reference with at most one
+    selector and a single substitution, deletion, duplication, insertion,
+    deletion-insertion, inversion, or equal variant at a point or range
+    location with literal sequences, to its model.
+
+    :arg str description: HGVS description.
+    :returns: The model, identical to the one produced by `to_model()`,
+        or `None` if the description does not have a simple shape.
+    :rtype: dict
+    """
+    match = _DESCRIPTION.fullmatch(description)
+    if match is None:
+        return None
+
+    variant = _variant(match)
+    if variant is None:
+        return None
+
+    reference: dict[str, Any] = {"id": match["reference"]}
+    if match["selector"]:
+        reference["selector"] = {"id": match["selector"]}
+
+    model: dict[str, Any] = {"type": "description_dna", "reference": reference}
+    if match["coordinate_system"]:
+        model["coordinate_system"] = match["coordinate_system"]
+    model["variants"] = [variant]
+    return model
+
+
+def _variant(match: re.Match) -> dict | None:
+    for operation, pattern, keys in _OPERATIONS:
+        operation_match = pattern.fullmatch(match["operation"])
+        if operation_match:
+            break
+    else:
+        return None
+
+    if match["end"] is None:
+        location = _point(match["start"])
+    else:
+        location = {"start": _point(match["start"]), "end": _point(match["end"]), "type": "range"}
+
+    variant = {"location": location, "type": operation, "source": "reference"}
+    for key, sequence in zip(keys, operation_match.groups()):
+        if sequence is not None:
+            variant[key] = [{"sequence": sequence, "source": "description"}]
+    return variant
+
+
+def _point(point: str) -> dict:
+    parts = cast(re.Match, _POINT_PARTS.fullmatch(point))
+
+    output: dict[str, Any] = {"type": "point"}
+    if parts["outside_cds"]:
+        output["outside_cds"] = "downstream" if parts["outside_cds"] == "*" else "upstream"
+    output["position"] = int(parts["position"])
+    offset = parts["offset"]
+    if offset == "+?":
+        output["offset"] = {"uncertain": True, "downstream": True}
+    elif offset == "-?":
+        output["offset"] = {"uncertain": True, "upstream": True}
+    elif offset:
+        output["offset"] = {"value": int(offset)}
+    return output
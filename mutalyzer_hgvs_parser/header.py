@@ -0,0 +1,103 @@
+"""
+Module for extracting the reference, selector(s), and coordinate system
+of an HGVS description, e.g., `NG_012337.1(SDHD_v001):c.` in
+`NG_012337.1(SDHD_v001):c.274G>T`, without parsing the variants.
+"""
+
+from __future__ import annotations
+
+import re
+
+from .convert import to_model
+
+# The `reference.g` rules and the `WS` ignored by the parser.
+_WS = re.compile(r"[ \t\f\r\n]*")
+
+_ID = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+_COORDINATE_SYSTEM = re.compile(r"([a-z])[ \t\f\r\n]*\.")
+
+
+class _NotScanned(Exception):
+    pass
+
+
+def to_header_model(description: str) -> dict:
+    """
+    Extract the reference (with its selectors) and the coordinate system
+    of an HGVS description, without parsing the variants. The variants
+    are not validated, but if the header itself is not valid, the same
+    error as for `to_model()` is raised.
+
+    :arg str description: HGVS description.
+    :returns: The `reference` and, if present, the `coordinate_system`,
+        identical to those in the `to_model()` output.
+    :rtype: dict
+    """
+    scanned = scan_header(description)
+    if scanned is not None:
+        return scanned[0]
+    # Raises the syntax error.
+    model = to_model(description)
+    header = {"reference": model["reference"]}
+    if "coordinate_system" in model:
+        header["coordinate_system"] = model["coordinate_system"]
+    return header
+
+
+def scan_header(description: str) -> tuple[dict, int] | None:
+    """
+    Scan the header of an HGVS description, as `to_header_model()` does,
+    without falling back on the parser.
+
+    :arg str description: HGVS description.
+    :returns: The header model and the position of the variants in the
+        description, or `None` if the header could not be scanned.
+    :rtype: tuple
+    """
+    try:
+        return _scan(description)
+    except _NotScanned:
+        return None
+
+
+def _scan(description: str) -> tuple[dict, int]:
+    reference, position = _reference(description, _skip(description, 0))
+    if not description.startswith(":", position):
+        raise _NotScanned()
+
+    header: dict = {"reference": reference}
+    position = _skip(description, position + 1)
+    coordinate_system = _COORDINATE_SYSTEM.match(description, position)
+    if coordinate_system:
+        header["coordinate_system"] = coordinate_system[1]
+        position = _skip(description, coordinate_system.end())
+    return header, position
+
+
+def _skip(description: str, position: int) -> int:
+    return _WS.match(description, position).end()  # type: ignore[union-attr]
+
+
+def _reference(description: str, position: int) -> tuple[dict, int]:
+    """
+    reference: ID reference? | "(" ID reference? ")"
+    """
+    parenthesized = description.startswith("(", position)
+    if parenthesized:
+        position = _skip(description, position + 1)
+
+    reference_id = _ID.match(description, position)
+    if reference_id is None:
+        raise _NotScanned()
+    reference: dict = {"id": reference_id[0]}
+    position = _skip(description, reference_id.end())
+
+    if position < len(description) and (description[position] == "(" or description[position].isalnum()):
+        reference["selector"], position = _reference(description, position)
+
+    if parenthesized:
+        if not description.startswith(")", position):
+            raise _NotScanned()
+        position = _skip(description, position + 1)
+    return reference, position
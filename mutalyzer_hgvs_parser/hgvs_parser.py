@@ -4,26 +4,49 @@ Module for parsing HGVS variant descriptions.
 
 from __future__ import annotations
 
+import collections
+import copy
 import functools
+import hashlib
+import importlib
+import io
 import os
-from typing import Callable, TypedDict
+import pickle
+import re
+import stat
+import sys
+import tempfile
+import threading
+import time
+import types
+import weakref
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, TypedDict, Union, cast
 
+import lark
 from lark import Lark, Token, Transformer, Tree
-from lark.exceptions import UnexpectedCharacters, UnexpectedEOF
+from lark.exceptions import UnexpectedCharacters, UnexpectedEOF, UnexpectedInput
 
-from .exceptions import UnexpectedCharacter, UnexpectedEnd
+from .exceptions import LimitExceeded, UnexpectedCharacter, UnexpectedEnd
+from .profiling import current_call, profiled, stage
+from .sequences import restore, shorten
 from .util import all_tree_children_equal, data_equals, get_child, get_tree_child
 
 
 class _Ambiguity(TypedDict):
     type: str
+    # The data of the first alternative and the number of alternatives
+    # (`None` for any) that the conditions require, used for dispatching.
+    signature: tuple[str, int | None]
     conditions: Callable[[list], bool]
     selected: int
 
 
-AMBIGUITIES: list[_Ambiguity] = [
+# A tuple, so that the dispatching index (see `_ambiguity_candidates()`) is
+# built only once.
+AMBIGUITIES: tuple[_Ambiguity, ...] = (
     {
         "type": "insert_location | insert_length - length",
+        "signature": ("insert", 2),
         # 10 ("inserted" start rule)
         "conditions": lambda children: (
             len(children) == 2
@@ -35,6 +58,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_location_and_substitution | variant_certain_location",
+        "signature": ("variant_certain", 2),
         # R1:10
         # on the protein side
         "conditions": lambda children: (
@@ -49,6 +73,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_repeat | variant_certain_substitution - repeat",
+        "signature": ("variant_certain", 2),
         # PREF:p.Ala2[10]
         "conditions": lambda children: (
             len(children) == 2
@@ -66,6 +91,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_repeat | variant_certain_substitution - repeat 2",
+        "signature": ("variant_certain", 2),
         # PREF:p.254AE[3]
         "conditions": lambda children: (
             len(children) == 2
@@ -83,6 +109,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_repeat | variant_certain_substitution - substitution 1",
+        "signature": ("variant_certain", 2),
         # PREF:p.Trp26Ter, LRG_199p1:p.Trp24Cys, PREF:p.Trp26*,
         # PREF:p.[Ser44Arg;Trp46Arg]
         "conditions": lambda children: (
@@ -99,6 +126,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_repeat | variant_certain_substitution - substitution 2",
+        "signature": ("variant_certain", 2),
         # for protein variants: 10R2:10_20
         "conditions": lambda children: (
             len(children) == 2
@@ -113,6 +141,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "insertion | repeat - insertion",
+        "signature": ("variant_certain", 2),
         # 10_11insNM_000001.1:c.100_200 ("variant" start rule)
         "conditions": lambda children: (
             len(children) == 2
@@ -124,6 +153,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "insertion | repeat | substitution - insertion",
+        "signature": ("variant_certain", 3),
         # R1:[1del;10_11insR2:2del]
         "conditions": lambda children: (
             len(children) == 3
@@ -136,6 +166,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "deletion | deletion_insertion | repeat - deletion_insertion",
+        "signature": ("variant_certain", 3),
         # 10_11insNM_000001.1:c.100_200 ("variant" start rule)
         "conditions": lambda children: (
             len(children) == 3
@@ -151,6 +182,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "deletion | deletion_insertion | repeat | substitution - deletion_insertion",
+        "signature": ("variant_certain", 4),
         # R1:1delinsR2:2del
         "conditions": lambda children: (
             len(children) == 4
@@ -165,6 +197,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "deletion | deletion_insertion | repeat | substitution - deletion_insertion",
+        "signature": ("variant_certain", 4),
         # R1:[1del;10_11insR2:2del]
         "conditions": lambda children: (
             len(children) == 4
@@ -182,6 +215,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "inversion | repeat - inversion",
+        "signature": ("variant_certain", 2),
         # R1(t1):c.-5-3inv
         "conditions": lambda children: (
             len(children) == 2
@@ -193,6 +227,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "conversion | repeat - conversion",
+        "signature": ("variant_certain", 2),
         # R1:g.10_20conR2:40_50
         "conditions": lambda children: (
             len(children) == 2
@@ -204,6 +239,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "repeat | location - location",
+        "signature": ("variant_certain", 2),
         # REF:g.123?
         # REF:g.??
         "conditions": lambda children: (
@@ -218,6 +254,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain | variant_predicted - variant_predicted",
+        "signature": ("variant", 2),
         # R1(R2(R3)):g.(10_15)
         "conditions": lambda children: (
             len(children) == 2
@@ -231,6 +268,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variants_certain_variant_predicted | variants_predicted_variant_certain - variants_predicted",
+        "signature": ("variants", 2),
         # R1(R2(R3)):g.(10_15)
         "conditions": lambda children: (
             len(children) == 2
@@ -247,6 +285,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variants_certain_variant_predicted | variants_predicted_variant_certain - variants_predicted",
+        "signature": ("variants", 2),
         # NP_003997.1:p.(Trp24Cys)
         "conditions": lambda children: (
             len(children) == 2
@@ -263,6 +302,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "description_dna | description_protein - description_dna",
+        "signature": ("description", 2),
         # R1:100insA
         # - we opt for "description_dna"
         # TODO: Leave it undefined and do the check based on
@@ -277,6 +317,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain-location_repeat|repeat - variant_certain-location",
+        "signature": ("variant_certain", 3),
         # NM_000492.4:c.1210-34_1210-6
         "conditions": lambda children: (
             len(children) == 3
@@ -295,6 +336,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain-location_repeat|location_inversion - inversion",
+        "signature": ("variant_certain", 3),
         # NC_000015.9(NM_001012338.3):c.396-6644_1397-29766inv
         "conditions": lambda children: (
             len(children) == 3
@@ -316,6 +358,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_duplication | variant_certain_repeat - duplication",
+        "signature": ("variant_certain", 2),
         # R1:c.10-5_10-2dupR2:10
         "conditions": lambda children: (
             len(children) == 2
@@ -331,6 +374,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_deletion | variant_certain_repeat - deletion",
+        "signature": ("variant_certain", 2),
         # R1:c.10-5_10-2delR2:10del
         "conditions": lambda children: (
             len(children) == 2
@@ -348,6 +392,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_delins | variant_certain_delins - one insert",
+        "signature": ("deletion_insertion", 2),
         # R1:c.10-5_10-2delinsTCTR2.2:c.10insT
         "conditions": lambda children: (
             len(children) == 2
@@ -360,6 +405,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     # TODO: revisit the next ones in the repeats context.
     {
         "type": "variant_certain_repeat | variant_certain_repeat_length - length 0",
+        "signature": ("variant_certain", 2),
         # R1:c.10-2[5]
         "conditions": lambda children: (
             len(children) == 2
@@ -381,6 +427,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_repeat | variant_certain_repeat_length - length 1",
+        "signature": ("variant_certain", 2),
         # R1:c.10-2[5]
         "conditions": lambda children: (
             len(children) == 2
@@ -402,6 +449,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_repeat | variant_certain_repeat_range_length - length 0",
+        "signature": ("variant_certain", 3),
         # R1:c.10-2_10-4[5]
         "conditions": lambda children: (
             len(children) == 3
@@ -426,6 +474,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_repeat | variant_certain_repeat_range_length - length 1",
+        "signature": ("variant_certain", 3),
         # R1:c.10-2_10-4[5]
         "conditions": lambda children: (
             len(children) == 3
@@ -450,6 +499,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_repeat | variant_certain_repeat_range_length - length 2",
+        "signature": ("variant_certain", 3),
         # R1:c.10-2_10-4[5]
         "conditions": lambda children: (
             len(children) == 3
@@ -474,6 +524,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain_repeat | variant_certain_substitution - 2",
+        "signature": ("variant_certain", 2),
         # for protein descriptions
         # STR:D5S818
         "conditions": lambda children: (
@@ -500,6 +551,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "deletion_insertion | deletion_insertion | ... nested - 0",
+        "signature": ("deletion_insertion", None),
         # REF_1:10del REF_2:20insA REF_3:30insT
         "conditions": lambda children: (
             len(children) >= 2
@@ -521,6 +573,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "inserted | inserted ",
+        "signature": ("inserted", 2),
         # in the inserted rule
         # NG_000001.1(NM_000002.3):c.(170_?)_420+60[19]
         "conditions": lambda children: (
@@ -540,6 +593,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "inserted insert repeat_mixed - 0 ",
+        "signature": ("inserted", None),
         # in the variant rule
         # 123_191delins[CAG[19];CAA[4]]
         "conditions": lambda children: (
@@ -550,6 +604,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain repeat | variant_certain substitution - 0 ",
+        "signature": ("variant_certain", 2),
         # for proteins
         # R1:p.Ala1207_Asp1208Thr1207_Asn1208
         "conditions": lambda children: (
@@ -574,6 +629,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain repeat | variant_certain substitution - 1 ",
+        "signature": ("variant_certain", 2),
         # for proteins
         # R1:p.Ala1207_Asp1208Thr1207_Asn1208[10]
         "conditions": lambda children: (
@@ -596,6 +652,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "variant_certain repeat | variant_certain substitution - 1 ",
+        "signature": ("variant_certain", 2),
         # for proteins
         # R1:54_149Ala[23]Ter[1]
         "conditions": lambda children: (
@@ -613,6 +670,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "repeat | repeat - 0 ",
+        "signature": ("variant_certain", 2),
         # NG_007524:28578-181-182
         "conditions": lambda children: (
             len(children) == 2
@@ -628,6 +686,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "insert description_dna repeat_number | insert description_dna - 0 ",
+        "signature": ("insert", 2),
         # inserted
         # NG_000001.1(NM_000002.3):c.(170_?)_420+60[19]
         "conditions": lambda children: (
@@ -643,6 +702,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "insert location repeat_number | insert repeat_mixed - 0 ",
+        "signature": ("insert", 2),
         # test_variant_to_model 123_191[CAG[19];CAA[4];10_15[6]
         "conditions": lambda children: (
                 len(children) == 2
@@ -656,6 +716,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "insert location repeat_number | insert repeat_mixed - 0 ",
+        "signature": ("insert", 2),
         # test_variant_to_model 123_191[CAG[19];CAA[4];10_15[6]
         "conditions": lambda children: (
                 len(children) == 2
@@ -670,6 +731,7 @@ AMBIGUITIES: list[_Ambiguity] = [
     },
     {
         "type": "insert description_dna inv | insert description_dna - 1 ",
+        "signature": ("insert", 2),
         "conditions": lambda children: (
                 len(children) == 2
                 and children[0].data == children[1].data == "insert"
@@ -681,17 +743,100 @@ AMBIGUITIES: list[_Ambiguity] = [
         ),
         "selected": 1,
     },
-]
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _ambiguity_candidates(data: str, alternatives: int) -> tuple[int, ...]:
+    """
+    Indices of the `AMBIGUITIES` entries with a matching signature, in
+    their original order.
+    """
+    return tuple(
+        index
+        for index, ambig in enumerate(AMBIGUITIES)
+        if ambig["signature"][0] == data and ambig["signature"][1] in (None, alternatives)
+    )
+
+
+# The hits are counted per thread, without locking, and merged when read.
+# The lock guards the registry of the threads counters, and the hits of the
+# ended threads.
+_ambiguity_hits_lock = threading.Lock()
+_ambiguity_hits_generation = 0
+_thread_ambiguity_hits: dict[int, collections.Counter[int]] = {}
+_ended_ambiguity_hits: collections.Counter[int] = collections.Counter()
+_local_ambiguity_hits = threading.local()
+
+
+class _ThreadEnd:
+    """
+    Only referenced by a thread local, so finalized when the thread ends.
+    """
+
+
+def _count_ambiguity_hit(index: int) -> None:
+    local = _local_ambiguity_hits
+    if getattr(local, "generation", None) != _ambiguity_hits_generation:
+        local.hits = collections.Counter()
+        local.end = _ThreadEnd()
+        with _ambiguity_hits_lock:
+            local.generation = _ambiguity_hits_generation
+            _thread_ambiguity_hits[id(local.end)] = local.hits
+        weakref.finalize(local.end, _end_ambiguity_hits, id(local.end), local.hits)
+    local.hits[index] += 1
+
+
+def _end_ambiguity_hits(key: int, hits: collections.Counter[int]) -> None:
+    with _ambiguity_hits_lock:
+        # Not if reset meanwhile.
+        if _thread_ambiguity_hits.get(key) is hits:
+            del _thread_ambiguity_hits[key]
+            _ended_ambiguity_hits.update(hits)
+
+
+def ambiguity_hits() -> list[dict]:
+    """
+    Get the number of times each `AMBIGUITIES` entry solved an ambiguity,
+    most frequent first.
+
+    :returns: The entries index, type, and hits.
+    :rtype: list
+    """
+    with _ambiguity_hits_lock:
+        hits = collections.Counter(_ended_ambiguity_hits)
+        for thread_hits in _thread_ambiguity_hits.values():
+            # Copied at once, while the thread may be counting.
+            hits.update(dict(thread_hits))
+    return [{"index": index, "type": AMBIGUITIES[index]["type"], "hits": count} for index, count in hits.most_common()]
+
+
+def reset_ambiguity_hits() -> None:
+    """
+    Reset the `AMBIGUITIES` entries hit counts.
+    """
+    global _ambiguity_hits_generation
+    with _ambiguity_hits_lock:
+        # The threads start new counters.
+        _ambiguity_hits_generation += 1
+        _thread_ambiguity_hits.clear()
+        _ended_ambiguity_hits.clear()
 
 
 class AmbigTransformer(Transformer):
     def _ambig(self, children: list) -> Tree:
         # from lark.tree import pydot__tree_to_png
         # pydot__tree_to_png(Tree("ambig", children), "ambig.png")
-        for ambig in AMBIGUITIES:
+        data = getattr(children[0], "data", None)
+        for index in _ambiguity_candidates(data, len(children)):
+            ambig = AMBIGUITIES[index]
             if ambig["conditions"](children):
                 # from lark.tree import pydot__tree_to_png
                 # pydot__tree_to_png(Tree("ambig", children), "ambig_2.png")
+                _count_ambiguity_hit(index)
+                call = current_call()
+                if call is not None:
+                    call.record["ambiguities"].append(index)
                 return children[ambig["selected"]]
         raise Exception("Ambiguity not solved.")
 
@@ -743,8 +888,9 @@ class ProteinTransformer(Transformer):
         return Tree("extension", children)
 
     def extension_n(self, children: list) -> Tree:
+        # In the order of the other points, for the model keys order.
         point = Tree(
-            "point", [Token("NUMBER", children[0].value), Token("OUTSIDE_CDS", "-")]
+            "point", [Token("OUTSIDE_CDS", "-"), Token("NUMBER", children[0].value)]
         )
         location = [Tree("location", [point])]  # type: ignore[misc]
         return Tree("inserted", [Tree("insert", location)])
@@ -838,6 +984,198 @@ def _replace_annon_terminals(grammar: str) -> str:
     return updated_grammar
 
 
+@functools.lru_cache
+def _builtin_grammar() -> str:
+    return _replace_annon_terminals(
+        "".join(_read_grammar_file(f) for f in ["top.g", "dna.g", "protein.g", "reference.g", "common.g"])
+    )
+
+
+def builtin_start_rules() -> list[str]:
+    """
+    All the rules of the built-in grammar, which can be used as start
+    rules.
+
+    :returns: The rule names.
+    :rtype: list
+    """
+    return re.findall(r"^[?!]?([a-z_][a-z0-9_]*)(?:\.-?\d+)?\s*:", _builtin_grammar(), re.MULTILINE)
+
+
+CACHE_ENV_VARIABLE = "MUTALYZER_HGVS_PARSER_CACHE"
+
+
+class _ParserPickler(pickle.Pickler):
+    """
+    Lark keeps references to modules (e.g., `re`), which cannot be pickled,
+    so they are stored by name.
+    """
+
+    def persistent_id(self, obj: Any) -> str | None:
+        if isinstance(obj, types.ModuleType):
+            return obj.__name__
+        return None
+
+
+class _ParserUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Any) -> Any:
+        return importlib.import_module(pid)
+
+
+def _cache_key(grammar: str, start_rule: str, ignore_white_spaces: bool, parser_type: str) -> str:
+    key = "\n".join(
+        [
+            grammar,
+            start_rule,
+            str(ignore_white_spaces),
+            parser_type,
+            lark.__version__,
+            "{}.{}".format(*sys.version_info[:2]),
+        ]
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _cache_path(cache: bool | str, key: str) -> str:
+    if cache is True:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache_dir = os.path.join(cache_home, "mutalyzer_hgvs_parser")
+    else:
+        cache_dir = str(cache)
+    return os.path.join(cache_dir, f"parser_{key}.pickle")
+
+
+def _trusted(path: str) -> bool:
+    """
+    Loading a cached parser can run arbitrary code, so only the files and
+    directories owned by the current user (or root), and not writable by
+    others, are trusted.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    try:
+        status = os.stat(path)
+    except OSError:
+        return False
+    return status.st_uid in (os.getuid(), 0) and not status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _load_cached_parser(cache_path: str, key: str) -> Lark | None:
+    if not (_trusted(os.path.dirname(cache_path)) and _trusted(cache_path)):
+        return None
+    try:
+        with open(cache_path, "rb") as cache_file:
+            cached = _ParserUnpickler(cache_file).load()
+    except Exception:
+        # Missing, corrupted, or incompatible cache file, it is regenerated.
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    if "lalr" in cached:
+        try:
+            return Lark.load(io.BytesIO(cached["lalr"]))
+        except Exception:
+            return None
+    return cached["parser"]
+
+
+def _save_cached_parser(cache_path: str, key: str, parser: Lark) -> None:
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        if not _trusted(cache_dir):
+            return
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        # The cache is only an optimization, e.g., on a read-only file system.
+        return
+    try:
+        if parser.options.parser == "lalr":
+            # The LALR tables compare their actions by identity, which
+            # pickling does not preserve, so lark serializes them instead.
+            lalr_file = io.BytesIO()
+            parser.save(lalr_file)
+            cached: dict = {"key": key, "lalr": lalr_file.getvalue()}
+        else:
+            cached = {"key": key, "parser": parser}
+        with os.fdopen(fd, "wb") as cache_file:
+            _ParserPickler(cache_file, protocol=pickle.HIGHEST_PROTOCOL).dump(cached)
+        # Atomic, so concurrent processes never read a partial file.
+        os.replace(temp_path, cache_path)
+    except Exception:
+        os.remove(temp_path)
+
+
+class Limits(NamedTuple):
+    """
+    Limits on the parsed descriptions, e.g., for user input, so that a
+    single description cannot hold a parser for long. `None` means no
+    limit.
+    """
+
+    #: Maximum description length.
+    max_length: int | None = None
+    #: Maximum nesting depth of the brackets, e.g., of nested inserts.
+    max_depth: int | None = None
+    #: Maximum number of ambiguity nodes in the parse tree, which bounds
+    #: the time taken to solve them.
+    max_ambiguities: int | None = None
+    #: Maximum parsing time, in seconds.
+    timeout: float | None = None
+
+    def check(self, description: str) -> None:
+        """
+        Check the limits known before parsing, i.e., the length and the
+        depth.
+
+        :arg str description: Description (or description part).
+        :raises LimitExceeded: If the description exceeds a limit.
+        """
+        if self.max_length is not None and len(description) > self.max_length:
+            raise LimitExceeded("max_length", self.max_length, description)
+        if self.max_depth is not None and _depth(description) > self.max_depth:
+            raise LimitExceeded("max_depth", self.max_depth, description)
+
+
+class _Timeout(Exception):
+    pass
+
+
+class _TimedText(str):
+    """
+    Description that checks the deadline while the Earley parser iterates
+    over its characters (it processes one Earley set per character).
+    """
+
+    deadline: float
+
+    def __iter__(self) -> Iterator[str]:
+        deadline = self.deadline
+        for character in str.__iter__(self):
+            if time.monotonic() > deadline:
+                raise _Timeout()
+            yield character
+
+
+def _timed(text: str, deadline: float | None) -> str:
+    if deadline is None:
+        return text
+    timed_text = _TimedText(text)
+    timed_text.deadline = deadline
+    return timed_text
+
+
+def _depth(description: str) -> int:
+    depth = max_depth = 0
+    for character in description:
+        if character in "([":
+            depth += 1
+            max_depth = max(depth, max_depth)
+        elif character in ")]":
+            depth -= 1
+    return max_depth
+
+
 class HgvsParser:
     """
     HGVS parser object.
@@ -848,15 +1186,42 @@ class HgvsParser:
         grammar_path: str | None = None,
         start_rule: str | None = None,
         ignore_white_spaces: bool = True,
+        cache: bool | str = False,
+        lalr: bool = False,
+        start_rules: list[str] | None = None,
+        limits: Limits | None = None,
     ):
         """
         :arg str grammar_path: Path to a different EBNF grammar file.
         :arg str start_rule: Alternative start rule for the grammar.
         :arg bool ignore_white_spaces: Ignore or not white spaces in the description.
+        :arg cache: Store the built parser on disk and load it from there
+            when valid. Use `True` for the default cache directory
+            (`$XDG_CACHE_HOME/mutalyzer_hgvs_parser`, by default in
+            `~/.cache`) or provide a directory path.
+        :arg bool lalr: Try first a LALR parser for the unambiguous subset
+            of the DNA descriptions, falling back to the Earley parser.
+            Only for the built-in grammar and the `description` start rule.
+        :arg list start_rules: Start rules compiled in the parser, among
+            which the start rule can be selected in each call (by default
+            only `start_rule`).
+        :arg Limits limits: Limits on the parsed descriptions, exceeding
+            which raises a `LimitExceeded` exception.
         """
+        self._start_rules = start_rules or [start_rule or "description"]
+        if start_rule is not None and start_rule not in self._start_rules:
+            raise ValueError(f"The start rule is not one of the start rules: {start_rule}.")
+        if lalr and (grammar_path or "description" not in self._start_rules):
+            raise ValueError(
+                "The LALR parser is only available for the built-in grammar "
+                "and the description start rule."
+            )
         self._grammar_path = grammar_path
         self._start_rule = start_rule
         self._ignore_whitespaces = ignore_white_spaces
+        self._cache = cache
+        self._lalr = lalr
+        self._limits = limits or Limits()
         self._create_parser()
 
     def _create_parser(self) -> None:
@@ -864,35 +1229,208 @@ class HgvsParser:
             with open(self._grammar_path) as grammar_file:
                 grammar = grammar_file.read()
         else:
-            grammar = _replace_annon_terminals("".join(
-                _read_grammar_file(f)
-                for f in ["top.g", "dna.g", "protein.g", "reference.g", "common.g"]
-            ))
+            grammar = _builtin_grammar()
 
-        start_rule = self._start_rule if self._start_rule else "description"
+        self._grammar = grammar
+        self._parser = self._build(grammar, self._start_rules, "earley")
+        # Built on first use, and shared with the `with_start_rule()` copies.
+        self._recognizers: dict[str, Lark] = {}
+        # Shared with the copies, which share the recognizers.
+        self._recognizers_lock = threading.Lock()
 
+        self._lalr_parser = None
+        if self._lalr:
+            lalr_grammar = "".join(
+                _read_grammar_file(f) for f in ["lalr.g", "reference.g", "common.g"]
+            )
+            self._lalr_parser = self._build(lalr_grammar, ["description"], "lalr")
+
+    def _build(self, grammar: str, start_rules: list[str], parser_type: str) -> Lark:
         if self._ignore_whitespaces:
             grammar += "\n%import common.WS\n%ignore WS"
 
-        self._parser = Lark(
-            grammar, parser="earley", start=start_rule, ambiguity="explicit"
-        )
+        cache_path = None
+        if self._cache:
+            key = _cache_key(grammar, ",".join(start_rules), self._ignore_whitespaces, parser_type)
+            cache_path = _cache_path(self._cache, key)
+            parser = _load_cached_parser(cache_path, key)
+            if parser is not None:
+                return parser
 
-    def parse(self, description: str) -> Tree:
+        if parser_type == "lalr":
+            parser = Lark(grammar, parser="lalr", start=start_rules)
+        elif parser_type == "forest":
+            parser = Lark(grammar, parser="earley", start=start_rules, ambiguity="forest")
+        else:
+            parser = Lark(
+                grammar, parser="earley", start=start_rules, ambiguity="explicit"
+            )
+
+        if cache_path:
+            _save_cached_parser(cache_path, key, parser)
+        return parser
+
+    @property
+    def limits(self) -> Limits:
+        """
+        Limits on the parsed descriptions.
         """
-        Parse the provided description.
+        return self._limits
+
+    def with_start_rule(self, start_rule: str | None) -> HgvsParser:
+        """
+        Get a copy of the parser, sharing the built parsers, with another
+        default start rule (one of the start rules).
+
+        :arg str start_rule: Start rule used when none is provided.
+        :returns: The parser copy.
+        :rtype: HgvsParser
+        """
+        self._start(start_rule)
+        parser = copy.copy(self)
+        parser._start_rule = start_rule
+        return parser
+
+    def with_limits(self, limits: Limits | None) -> HgvsParser:
+        """
+        Get a copy of the parser, sharing the built parsers, with other
+        limits on the parsed descriptions.
+
+        :arg Limits limits: Limits on the parsed descriptions.
+        :returns: The parser copy.
+        :rtype: HgvsParser
+        """
+        parser = copy.copy(self)
+        parser._limits = limits or Limits()
+        return parser
+
+    def _start(self, start_rule: str | None) -> str:
+        start = start_rule or self._start_rule or "description"
+        if start not in self._start_rules:
+            raise ValueError(f"The start rule is not one of the start rules: {start}.")
+        return start
+
+    def parse(self, description: str, start_rule: str | None = None) -> Tree:
+        """
+        Parse the provided description with the Earley parser, i.e., the
+        raw parse tree, with the ambiguities not solved.
 
         :arg str description: An HGVS description.
+        :arg str start_rule: One of the start rules, instead of the default.
         :returns: A parse tree.
         :rtype: lark.Tree
         """
+        return self._parse(description, start_rule, lalr=False)[0]
+
+    def _parse(self, description: str, start_rule: str | None = None, lalr: bool = True) -> tuple[Tree, bool]:
+        """
+        :arg bool lalr: Try first the LALR parser, if any.
+        :returns: The parse tree and whether it is already resolved, i.e.,
+            produced by the LALR parser, with no ambiguities and protein rules.
+        :raises LimitExceeded: If the description exceeds a limit.
+        """
+        start = self._start(start_rule)
+        deadline = self._check_limits(description)
+        if lalr and self._lalr_parser and start == "description":
+            try:
+                return self._lalr_parser.parse(description), True
+            except UnexpectedInput:
+                # Not in the LALR subset (or not valid), so Earley decides.
+                pass
         try:
-            parse_tree = self._parser.parse(description)
+            parse_tree = self._parse_earley(description, start, deadline)
         except UnexpectedCharacters as e:
             raise UnexpectedCharacter(e, description)
         except UnexpectedEOF as e:
             raise UnexpectedEnd(e, description)
-        return parse_tree
+        except _Timeout:
+            raise self._timeout(description) from None
+        # Building the tree from the parse forest is not interrupted.
+        if deadline is not None and time.monotonic() > deadline:
+            raise self._timeout(description)
+        if self._limits.max_ambiguities is not None:
+            ambiguities = sum(1 for subtree in parse_tree.iter_subtrees() if subtree.data == "_ambig")
+            if ambiguities > self._limits.max_ambiguities:
+                raise LimitExceeded("max_ambiguities", self._limits.max_ambiguities, description)
+        return parse_tree, False
+
+    def _check_limits(self, description: str) -> float | None:
+        """
+        Check the limits known before parsing.
+
+        :returns: The parsing deadline, if any.
+        :raises LimitExceeded: If the description exceeds a limit.
+        """
+        self._limits.check(description)
+        if self._limits.timeout is not None:
+            return time.monotonic() + self._limits.timeout
+        return None
+
+    def _timeout(self, description: str) -> LimitExceeded:
+        return LimitExceeded("timeout", cast(float, self._limits.timeout), description)
+
+    def _parse_earley(self, description: str, start: str, deadline: float | None = None) -> Tree:
+        """
+        The long sequences in the built-in grammar descriptions are
+        shortened for parsing, which otherwise takes time proportional to
+        their length.
+        """
+        parse_tree = self._parse_shortened(description, start, deadline)
+        if parse_tree is not None:
+            return parse_tree
+        return self._parser.parse(_timed(description, deadline), start)
+
+    def _parse_shortened(self, description: str, start: str, deadline: float | None) -> Tree | None:
+        """
+        :returns: The parse tree of the description with its long sequences
+            shortened, or `None` if there are none, if the grammar is not
+            the built-in one, or if the original description should be
+            parsed instead (e.g., to report the errors for it).
+        """
+        if self._grammar_path is None:
+            shortened, spans = shorten(description)
+            if spans:
+                try:
+                    return restore(self._parser.parse(_timed(shortened, deadline), start), spans)
+                except UnexpectedInput:
+                    pass
+        return None
+
+    def _recognize(self, description: str, start_rule: str | None = None) -> None:
+        """
+        Only check that the description is valid, without building the
+        parse tree (the Earley parser stops at the shared packed parse
+        forest).
+
+        :raises lark.exceptions.UnexpectedInput: If it is not valid.
+        :raises LimitExceeded: If the description exceeds a limit (the
+            ambiguities are not counted, as the tree is not built).
+        """
+        start = self._start(start_rule)
+        deadline = self._check_limits(description)
+        if self._lalr_parser and start == "description":
+            try:
+                self._lalr_parser.parse(description)
+                return
+            except UnexpectedInput:
+                pass
+        try:
+            # Long sequences are shortened, as for parsing.
+            if self._parse_shortened(description, start, deadline) is not None:
+                return
+        except _Timeout:
+            raise self._timeout(description) from None
+        if "forest" not in self._recognizers:
+            with self._recognizers_lock:
+                if "forest" not in self._recognizers:
+                    self._recognizers["forest"] = self._build(self._grammar, self._start_rules, "forest")
+            if deadline is not None:
+                # Building the recognizer does not count towards the timeout.
+                deadline = time.monotonic() + cast(float, self._limits.timeout)
+        try:
+            self._recognizers["forest"].parse(_timed(description, deadline), start)
+        except _Timeout:
+            raise self._timeout(description) from None
 
     def status(self) -> None:
         """
@@ -904,17 +1442,84 @@ class HgvsParser:
         print(f"  Parser: {self._parser.options.parser}")
         print(f"  Lexer: {self._parser.options.lexer}")
         print(f"  Ambiguity: {self._parser.options.ambiguity}")
-        print(f"  Start: {self._parser.options.start}")
+        print(f"  Start: {self._start_rule or 'description'} (of {len(self._start_rules)} start rules)")
         print(f"  Tree class: {self._parser.options.tree_class}")
         print(f"  Propagate positions: {self._parser.options.propagate_positions}")
+        print(f"  LALR subset parser: {self._lalr_parser is not None}")
+        print(f"  Limits: {self._limits}")
+
+
+_parsers: dict[tuple[str | None, str | None], HgvsParser] = {}
+_parser_locks: dict[tuple[str | None, str | None], threading.Lock] = {}
+_parser_locks_lock = threading.Lock()
 
 
-@functools.lru_cache
 def get_parser(grammar_path: str | None = None, start_rule: str | None = None) -> HgvsParser:
-    return HgvsParser(grammar_path, start_rule)
+    """
+    Get the parser shared by all the threads for the provided grammar and
+    start rule. The lark parsers keep the parsing state in each call, so
+    they can be used concurrently.
+
+    For the built-in grammar, all the start rules share a single parser,
+    with all the rules compiled as start rules.
+    """
+    key = (grammar_path, start_rule)
+    parser = _parsers.get(key)
+    if parser is None:
+        if grammar_path is None and start_rule is not None:
+            parser = _parsers.setdefault(key, get_parser().with_start_rule(start_rule))
+        else:
+            parser = _build_shared(key)
+    return parser
+
+
+def _build_shared(key: tuple[str | None, str | None]) -> HgvsParser:
+    """
+    Concurrent first calls for a parser wait for a single build, without
+    holding up the calls for the other parsers.
+    """
+    with _parser_locks_lock:
+        lock = _parser_locks.setdefault(key, threading.Lock())
+    with lock:
+        parser = _parsers.get(key)
+        if parser is None:
+            parser = _parsers[key] = new_parser(*key)
+    return parser
 
 
-def parse(description: str, grammar_path: str | None = None, start_rule: str | None = None) -> Tree:
+def new_parser(grammar_path: str | None = None, start_rule: str | None = None) -> HgvsParser:
+    """
+    Build a parser with the same options as the shared ones, i.e., with
+    the parsers cache from the `MUTALYZER_HGVS_PARSER_CACHE` environment
+    variable and, for the built-in grammar, all the rules compiled as start
+    rules and the LALR parser.
+
+    :arg str grammar_path: Path to a different EBNF grammar file.
+    :arg str start_rule: Alternative start rule for the grammar.
+    :returns: A new parser.
+    :rtype: HgvsParser
+    """
+    cache = os.environ.get(CACHE_ENV_VARIABLE) or False
+    if grammar_path is None:
+        return HgvsParser(start_rule=start_rule, cache=cache, lalr=True, start_rules=builtin_start_rules())
+    return HgvsParser(grammar_path, start_rule, cache=cache)
+
+
+def warm_cache(cache: bool | str = True) -> None:
+    """
+    Build the shared parser (for all the start rules) that `get_parser()`
+    uses, and store it in the cache, e.g., at install or deploy time, so
+    that later processes only have to load it.
+
+    :arg cache: `True` for the default cache directory or a directory path.
+    """
+    HgvsParser(cache=cache, lalr=True, start_rules=builtin_start_rules())
+
+
+@profiled("parse")
+def parse(
+    description: str, grammar_path: str | None = None, start_rule: str | None = None, limits: Limits | None = None
+) -> Tree:
     """
     Parse the provided HGVS `description`, or the description part,
     e.g., a location, a variants list, etc., if an appropriate alternative
@@ -923,16 +1528,101 @@ def parse(description: str, grammar_path: str | None = None, start_rule: str | N
     :arg str description: Description (or description part) to be parsed.
     :arg str grammar_path: Path towards a different grammar file.
     :arg str start_rule: Alternative start rule for the grammar.
+    :arg Limits limits: Limits on the description.
     :returns: Parse tree.
     :rtype: lark.Tree
+    :raises LimitExceeded: If the description exceeds a limit.
     """
-    parser = get_parser(grammar_path, start_rule)
-
     # from lark.tree import pydot__tree_to_png
-    # pydot__tree_to_png(parser.parse(description), "tree.png")
+    # pydot__tree_to_png(get_parser(grammar_path, start_rule).parse(description), "tree.png")
 
-    return FinalTransformer().transform(
-        AmbigTransformer().transform(
-            ProteinTransformer().transform(parser.parse(description))
-        )
-    )
+    parser = _limited_parser(grammar_path, start_rule, limits)
+    parse_tree = _parse_resolved(description, grammar_path, start_rule, parser)
+    with stage(current_call(), "flattening"):
+        return _final_transformer.transform(parse_tree)
+
+
+class ResolveTransformer(ProteinTransformer, AmbigTransformer):
+    """
+    Renames the protein rules and solves the ambiguities in a single pass.
+    """
+
+
+# The transformers keep no state, so they are shared between calls.
+_resolve_transformer = ResolveTransformer()
+_final_transformer = FinalTransformer()
+
+
+def _limited_parser(grammar_path: str | None, start_rule: str | None, limits: Limits | None) -> HgvsParser | None:
+    """
+    The shared parser with the `limits`, or `None` (the shared parser) if
+    there are none.
+    """
+    if limits is None:
+        return None
+    return get_parser(grammar_path, start_rule).with_limits(limits)
+
+
+def _parse_resolved(
+    description: str,
+    grammar_path: str | None = None,
+    start_rule: str | None = None,
+    parser: HgvsParser | None = None,
+) -> Tree:
+    """
+    Parse tree with the protein rules renamed and the ambiguities solved,
+    but not yet flattened by the `FinalTransformer`, which the `Converter`
+    does not require.
+
+    The shared parser is used, unless another `parser` (built for the
+    same grammar and start rule) is provided.
+    """
+    if parser is None:
+        parser = get_parser(grammar_path, start_rule)
+    call = current_call()
+    if call is None:
+        parse_tree, resolved = parser._parse(description)
+        return parse_tree if resolved else _resolve_transformer.transform(parse_tree)
+
+    call.record["start_rule"] = start_rule
+    with call.stage("parsing"):
+        parse_tree, resolved = parser._parse(description)
+    call.record["parser"] = "lalr" if resolved else "earley"
+    call.forest(parse_tree)
+    if resolved:
+        return parse_tree
+    with call.stage("disambiguation"):
+        return _resolve_transformer.transform(parse_tree)
+
+
+def _disambiguate(parse_tree: Tree) -> Tree:
+    return _final_transformer.transform(_resolve_transformer.transform(parse_tree))
+
+
+ParseResult = Union[Tree, UnexpectedCharacter, UnexpectedEnd, LimitExceeded]
+
+
+def parse_many(
+    descriptions: Iterable[str],
+    grammar_path: str | None = None,
+    start_rule: str | None = None,
+    limits: Limits | None = None,
+) -> Iterator[ParseResult]:
+    """
+    Parse the provided HGVS `descriptions` lazily, yielding the parse trees
+    in the input order. Syntax errors and exceeded limits are yielded,
+    instead of raised, in place of the corresponding parse trees, so that
+    one invalid description does not abort the batch.
+
+    :arg iterable descriptions: Descriptions (or description parts) to be parsed.
+    :arg str grammar_path: Path towards a different grammar file.
+    :arg str start_rule: Alternative start rule for the grammar.
+    :arg Limits limits: Limits on every description.
+    :returns: Parse trees or errors.
+    :rtype: iterator
+    """
+    for description in descriptions:
+        try:
+            yield parse(description, grammar_path, start_rule, limits)
+        except (UnexpectedCharacter, UnexpectedEnd, LimitExceeded) as e:
+            yield e
@@ -0,0 +1,239 @@
+"""
+Module for lazy, read-only, views of the dictionary models, which convert
+the parse tree parts only when accessed.
+
+.. code:: python
+
+    >>> model = to_lazy_model("NG_012337.1:g.100_101ins[AT[5];NM_004006.2:c.10_20]")
+    >>> model["reference"]["id"], [variant["type"] for variant in model["variants"]]
+    ('NG_012337.1', ['insertion'])
+"""
+
+from __future__ import annotations
+
+import abc
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+from lark import Tree
+from lark.exceptions import VisitError
+
+from .convert import Converter
+from .fast_path import fast_to_model
+from .hgvs_parser import _parse_resolved
+
+_converter = Converter()
+
+_VARIANTS = {"variants_certain", "variants_predicted"}
+
+_VARIANT = {"variant", "variant_certain", "variant_predicted"}
+
+
+def _transform(tree: Tree) -> Any:
+    try:
+        return _converter.transform(tree)
+    except VisitError as e:
+        raise e.orig_exc
+
+
+class _LazyModel(Mapping):
+    """
+    The values are computed on first access and cached.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> dict:
+        """
+        Convert all the parts.
+
+        :returns: The dictionary model.
+        :rtype: dict
+        """
+        return {key: _to_dict(value) for key, value in self.items()}
+
+    @abc.abstractmethod
+    def _keys(self) -> list[str]:
+        """
+        The keys of the model, in the `to_model()` order.
+        """
+
+
+def _to_dict(value: Any) -> Any:
+    if isinstance(value, _LazyModel):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_dict(item) for item in value]
+    return value
+
+
+class LazyDescription(_LazyModel):
+    """
+    Lazy view of a description model.
+    """
+
+    def __init__(self, parse_tree: Tree):
+        """
+        :arg lark.Tree parse_tree: Description parse tree, with the
+            ambiguities solved.
+        """
+        super().__init__()
+        if parse_tree.data == "description":
+            parse_tree = parse_tree.children[0]
+        if parse_tree.data not in ("description_dna", "description_protein"):
+            raise ValueError(f"Not a description parse tree: {parse_tree.data}.")
+        self._tree = parse_tree
+        self._children: dict[str, Any] = {}
+        for child in parse_tree.children:
+            if isinstance(child, Tree):
+                self._children[child.data] = child
+            else:
+                self._children[child.type] = child
+
+        variants, self._predicted = _variants(
+            self._children.get("variants") or self._children.get("variants_predicted")
+        )
+        self._variants = variants
+
+    def _keys(self) -> list[str]:
+        keys = ["type", "reference"]
+        if "COORDINATE_SYSTEM" in self._children:
+            keys.append("coordinate_system")
+        if self._variants is not None:
+            keys.append("variants")
+        if self._predicted:
+            keys.append("predicted")
+        return keys
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._values:
+            if key == "type":
+                self._values[key] = self._tree.data
+            elif key == "reference":
+                self._values[key] = _transform(self._children["reference"])["reference"]
+            elif key == "coordinate_system" and "COORDINATE_SYSTEM" in self._children:
+                self._values[key] = self._children["COORDINATE_SYSTEM"].value
+            elif key == "variants" and self._variants is not None:
+                self._values[key] = [LazyVariant(variant) for variant in self._variants]
+            elif key == "predicted" and self._predicted:
+                self._values[key] = True
+            else:
+                raise KeyError(key)
+        return self._values[key]
+
+
+def _variants(tree: Tree | None) -> tuple[list[Tree] | None, bool]:
+    """
+    The variant trees, and whether they are predicted, from either a
+    flattened or a not flattened variants tree.
+    """
+    if tree is None:
+        return None, False
+    children = [child for child in tree.children if isinstance(child, Tree)]
+    if tree.data == "variants" and len(children) == 1 and children[0].data in _VARIANTS:
+        return _variants(children[0])
+    return children, tree.data == "variants_predicted"
+
+
+class LazyVariant(_LazyModel):
+    """
+    Lazy view of a variant model. The `type` and `source` are available
+    without converting the variant operation.
+    """
+
+    def __init__(self, parse_tree: Tree):
+        """
+        :arg lark.Tree parse_tree: Variant parse tree, with the ambiguities
+            solved.
+        """
+        super().__init__()
+        self._predicted = False
+        # Down to the location and operation, through the not flattened
+        # `variant_certain` and `variant_predicted` trees.
+        while (
+            len(parse_tree.children) == 1
+            and isinstance(parse_tree.children[0], Tree)
+            and parse_tree.children[0].data in _VARIANT
+        ):
+            self._predicted = self._predicted or parse_tree.data == "variant_predicted"
+            parse_tree = parse_tree.children[0]
+        self._predicted = self._predicted or parse_tree.data == "variant_predicted"
+
+        self._location: Tree | None = None
+        self._operations = []
+        for child in parse_tree.children:
+            if child.data == "location":
+                self._location = child
+            else:
+                self._operations.append(child)
+        self._operation: dict | None = None
+
+    def _keys(self) -> list[str]:
+        keys = []
+        if self._location is not None:
+            keys.append("location")
+        if len(self._operations) == 1:
+            keys.extend(["type", "source"])
+        if self._operations:
+            keys.extend(key for key in self._converted() if key not in keys)
+        if self._predicted:
+            keys.append("predicted")
+        return keys
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "location" and self._location is not None:
+            if key not in self._values:
+                self._values[key] = _transform(self._location)["location"]
+            return self._values[key]
+        if key == "predicted" and self._predicted:
+            return True
+        if len(self._operations) == 1 and key in ("type", "source"):
+            return self._operations[0].data if key == "type" else "reference"
+        if key not in ("location", "predicted") and key in self._converted():
+            return self._converted()[key]
+        raise KeyError(key)
+
+    def _converted(self) -> dict:
+        if self._operation is None:
+            self._operation = {}
+            for operation in self._operations:
+                self._operation.update(_transform(operation))
+        return self._operation
+
+
+def parse_tree_to_lazy_model(parse_tree: Tree) -> LazyDescription:
+    """
+    Get a lazy view of the model of a description parse tree.
+
+    :arg lark.Tree parse_tree: Description parse tree.
+    :returns: Lazy description model.
+    :rtype: LazyDescription
+    """
+    return LazyDescription(parse_tree)
+
+
+def to_lazy_model(description: str) -> Mapping:
+    """
+    Get a lazy view of the model of an HGVS description. Simple
+    descriptions, handled by the fast path, are returned as (cheap)
+    dictionary models. Nested descriptions are only reported when the
+    inserted parts are accessed.
+
+    :arg str description: HGVS description.
+    :returns: Lazy description model, equal to the `to_model()` output.
+    :rtype: Mapping
+    """
+    model = fast_to_model(description)
+    if model is not None:
+        return model
+    return LazyDescription(_parse_resolved(description))
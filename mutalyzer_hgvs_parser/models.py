@@ -0,0 +1,208 @@
+"""
+Module with compact, slot based, alternatives to the dictionary models,
+for when many models are kept in memory.
+
+.. code:: python
+
+    >>> description = to_typed_model("NM_004006.2:c.4375C>T")
+    >>> description.variants[0].location.position
+    4375
+    >>> description.to_dict() == to_model("NM_004006.2:c.4375C>T")
+    True
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, ClassVar, Union
+
+from .convert import to_model
+
+
+class _Model:
+    """
+    Base class for the slot based models. Fields that are not set are
+    `None` and are left out of the dictionary model.
+    """
+
+    __slots__: tuple[str, ...] = ()
+
+    # Model `"type"` value, if fixed by the class.
+    _TYPE: ClassVar[str | None] = None
+
+    # Dictionary model keys, in their output order.
+    _KEYS: ClassVar[tuple[str, ...]] = ()
+
+    # Conversions of the nested dictionary model values.
+    _FROM_DICT: ClassVar[dict[str, Callable[[Any], Any]]] = {}
+
+    def __init__(self, **fields: Any):
+        for field in self.__slots__:
+            setattr(self, field, fields.pop(field, None))
+        if fields:
+            raise TypeError(f"Unexpected {self.__class__.__name__} fields: {', '.join(fields)}.")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self.__slots__ if getattr(self, field) is not None
+        )
+        return f"{self.__class__.__name__}({fields})"
+
+    def to_dict(self) -> dict:
+        """
+        Convert to the dictionary model.
+
+        :returns: Dictionary model.
+        :rtype: dict
+        """
+        output = {}
+        for key in self._KEYS:
+            value = self._TYPE if key == "type" and self._TYPE else getattr(self, key)
+            if value is not None:
+                output[key] = _to_dict(value)
+        return output
+
+    @classmethod
+    def from_dict(cls, model: dict) -> Any:
+        """
+        Convert from the dictionary model.
+
+        :arg dict model: Dictionary model.
+        :returns: Slot based model.
+        :raises ValueError: If the model has unexpected keys or type.
+        """
+        fields = {}
+        for key, value in model.items():
+            if key == "type" and cls._TYPE:
+                if value != cls._TYPE:
+                    raise ValueError(f"Unexpected {cls.__name__} type: {value}.")
+            elif key in cls.__slots__:
+                fields[key] = cls._FROM_DICT[key](value) if key in cls._FROM_DICT else value
+            else:
+                raise ValueError(f"Unexpected {cls.__name__} key: {key}.")
+        return cls(**fields)
+
+
+def _to_dict(value: Any) -> Any:
+    if isinstance(value, _Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_dict(item) for item in value]
+    return value
+
+
+class Reference(_Model):
+    __slots__ = ("id", "selector")
+    _KEYS = ("id", "selector")
+
+
+class Offset(_Model):
+    __slots__ = ("value", "uncertain", "upstream", "downstream")
+    _KEYS = ("value", "uncertain", "upstream", "downstream")
+
+
+class Point(_Model):
+    """
+    A location point, or a length (or repeat number) value.
+    """
+
+    __slots__ = ("outside_cds", "position", "value", "amino_acid", "offset", "uncertain", "inverted")
+    _TYPE = "point"
+    _KEYS = ("type", "outside_cds", "amino_acid", "position", "value", "offset", "uncertain", "inverted")
+
+
+class Range(_Model):
+    """
+    A range location, an uncertain point (`uncertain` set), or a length
+    range.
+    """
+
+    __slots__ = ("start", "end", "uncertain", "inverted")
+    _TYPE = "range"
+    _KEYS = ("start", "end", "type", "uncertain", "inverted")
+
+
+Location = Union[Point, Range]
+
+
+class Insert(_Model):
+    """
+    An inserted (or deleted) part: a sequence, a reference location, or a
+    description (the `source` is then a `Reference`).
+    """
+
+    __slots__ = (
+        "type",
+        "coordinate_system",
+        "sequence",
+        "location",
+        "repeat_number",
+        "length",
+        "inverted",
+        "source",
+    )
+    _KEYS = __slots__
+
+    def to_dict(self) -> dict:
+        output = super().to_dict()
+        if isinstance(self.source, Reference) and "location" in output:  # type: ignore[attr-defined]
+            # The location of a description follows its source.
+            output["location"] = output.pop("location")
+        return output
+
+
+class Variant(_Model):
+    __slots__ = ("location", "type", "source", "deleted", "inserted", "predicted")
+    _KEYS = __slots__
+
+
+class Description(_Model):
+    __slots__ = ("type", "reference", "coordinate_system", "variants", "predicted")
+    _KEYS = __slots__
+
+
+def _location(model: dict) -> Location:
+    if model.get("type") == "range":
+        return Range.from_dict(model)
+    return Point.from_dict(model)
+
+
+def _inserts(models: list) -> list:
+    return [Insert.from_dict(model) for model in models]
+
+
+def _source(source: str | dict) -> str | Reference:
+    return Reference.from_dict(source) if isinstance(source, dict) else source
+
+
+Reference._FROM_DICT = {"selector": Reference.from_dict}
+Point._FROM_DICT = {"offset": Offset.from_dict}
+Range._FROM_DICT = {"start": _location, "end": _location}
+Insert._FROM_DICT = {
+    "location": _location,
+    "repeat_number": Point.from_dict,
+    "length": _location,
+    "source": _source,
+}
+Variant._FROM_DICT = {"location": _location, "deleted": _inserts, "inserted": _inserts}
+Description._FROM_DICT = {
+    "reference": Reference.from_dict,
+    "variants": lambda models: [Variant.from_dict(model) for model in models],
+}
+
+
+def to_typed_model(description: str) -> Description:
+    """
+    Convert an HGVS description to a slot based model.
+
+    :arg str description: HGVS description.
+    :returns: Description model.
+    :rtype: Description
+    """
+    return Description.from_dict(to_model(description))
@@ -0,0 +1,109 @@
+"""
+Module for parsing with a pool of parsers, each used by a single thread
+at a time, instead of the parsers shared by all the threads.
+
+.. code:: python
+
+    >>> pool = ParserPool(size=8)
+    >>> with ThreadPoolExecutor(8) as executor:
+    ...     models = list(executor.map(pool.to_model, descriptions))
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import queue
+import threading
+from typing import Iterator
+
+from lark import Tree
+
+from .convert import Converter, _to_model
+from .hgvs_parser import HgvsParser, Limits, _final_transformer, _parse_resolved, new_parser
+
+
+class ParserPool:
+    """
+    A bounded pool of parsers for a grammar and start rule. The parsers
+    are built on demand, up to the pool size, and a thread waits for one
+    when all are in use.
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        grammar_path: str | None = None,
+        start_rule: str | None = None,
+        limits: Limits | None = None,
+    ):
+        """
+        :arg int size: Maximum number of parsers (by default the number of
+            CPUs).
+        :arg str grammar_path: Path to a different EBNF grammar file.
+        :arg str start_rule: Alternative start rule for the grammar.
+        :arg Limits limits: Limits on the parsed descriptions, exceeding
+            which raises a `LimitExceeded` exception.
+        """
+        self.size = size or os.cpu_count() or 1
+        self.grammar_path = grammar_path
+        self.start_rule = start_rule
+        self.limits = limits
+        # The most recently used parsers first.
+        self._idle: queue.LifoQueue[HgvsParser] = queue.LifoQueue()
+        self._available = threading.BoundedSemaphore(self.size)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Number of parsers built so far.
+        """
+        return self._created
+
+    @contextlib.contextmanager
+    def parser(self) -> Iterator[HgvsParser]:
+        """
+        Take a parser out of the pool for the duration of the context.
+
+        :returns: A parser not used by any other thread.
+        :rtype: HgvsParser
+        """
+        self._available.acquire()
+        try:
+            try:
+                parser = self._idle.get_nowait()
+            except queue.Empty:
+                # Acquiring the semaphore ensures there are less than `size`.
+                parser = new_parser(self.grammar_path, self.start_rule).with_limits(self.limits)
+                with self._lock:
+                    self._created += 1
+            try:
+                yield parser
+            finally:
+                self._idle.put(parser)
+        finally:
+            self._available.release()
+
+    def parse(self, description: str) -> Tree:
+        """
+        Equivalent of `parse()`, with a parser from the pool.
+
+        :arg str description: Description (or description part) to be parsed.
+        :returns: Parse tree.
+        :rtype: lark.Tree
+        """
+        with self.parser() as parser:
+            parse_tree = _parse_resolved(description, start_rule=self.start_rule, parser=parser)
+        return _final_transformer.transform(parse_tree)
+
+    def to_model(self, description: str) -> dict:
+        """
+        Equivalent of `to_model()`, with a parser from the pool.
+
+        :arg str description: HGVS description.
+        :returns: Description dictionary model.
+        :rtype: dict
+        """
+        with self.parser() as parser:
+            return _to_model(description, self.start_rule, Converter(), parser)
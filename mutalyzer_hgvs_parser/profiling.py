@@ -0,0 +1,235 @@
+"""
+Module for the opt-in instrumentation of the parsing and conversion calls.
+
+.. code:: python
+
+    profiler = Profiler()
+    with profiler.activate():
+        to_model("NM_004006.2:c.4375C>T")
+    profiler.metrics()
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import functools
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, ContextManager, Iterator, TypeVar, cast
+
+from lark import Tree
+
+_profiler: ContextVar[Profiler | None] = ContextVar("mutalyzer_hgvs_parser_profiler", default=None)
+
+_call: ContextVar[ProfiledCall | None] = ContextVar("mutalyzer_hgvs_parser_profiled_call", default=None)
+
+_NO_STAGE = contextlib.nullcontext()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class Profiler:
+    """
+    Records, for every `parse()`, `to_model()`, and `to_model_many()` item
+    call made while active, the stages durations, the employed parser
+    (`fast_path`, `lalr`, or `earley`), the number of nodes and of
+    ambiguity nodes in the Earley parse forest, and the matched
+    `AMBIGUITIES` entries. The calls are aggregated in counters and
+    duration histograms per stage.
+    """
+
+    def __init__(
+        self,
+        max_calls: int = 1000,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        on_call: Callable[[dict], None] | None = None,
+    ):
+        """
+        :arg int max_calls: Number of the most recent call records kept.
+        :arg tuple buckets: Upper bounds (seconds) of the histogram buckets.
+        :arg callable on_call: Called with every call record when finished.
+        """
+        self.calls: collections.deque[dict] = collections.deque(maxlen=max_calls)
+        self.counters: collections.Counter[str] = collections.Counter()
+        self.ambiguities: collections.Counter[int] = collections.Counter()
+        self.buckets = tuple(sorted(buckets))
+        self.histograms: dict[str, dict[str, Any]] = {}
+        self._on_call = on_call
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[Profiler]:
+        """
+        Activate the profiler for the current thread (or task) within the
+        context. It can be activated in several threads at the same time.
+        """
+        token = _profiler.set(self)
+        try:
+            yield self
+        finally:
+            _profiler.reset(token)
+
+    def metrics(self) -> dict:
+        """
+        Get the aggregated counters and histograms.
+
+        :returns: Counters, matched ambiguities per `AMBIGUITIES` index,
+            and histograms per stage.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "ambiguities": dict(self.ambiguities),
+                "histograms": {
+                    stage: {
+                        "buckets": list(self.buckets),
+                        "counts": list(histogram["counts"]),
+                        "sum": histogram["sum"],
+                        "count": histogram["count"],
+                    }
+                    for stage, histogram in self.histograms.items()
+                },
+            }
+
+    def prometheus(self, prefix: str = "mutalyzer_hgvs_parser") -> str:
+        """
+        Get the metrics in the Prometheus text exposition format.
+
+        :arg str prefix: Metrics names prefix.
+        :returns: The metrics.
+        :rtype: str
+        """
+        metrics = self.metrics()
+        lines = []
+        for name, value in sorted(metrics["counters"].items()):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        lines.append(f"# TYPE {prefix}_ambiguities_total counter")
+        for index, value in sorted(metrics["ambiguities"].items()):
+            lines.append(f'{prefix}_ambiguities_total{{index="{index}"}} {value}')
+        lines.append(f"# TYPE {prefix}_stage_seconds histogram")
+        for stage, histogram in sorted(metrics["histograms"].items()):
+            cumulative = 0
+            for bucket, count in zip(histogram["buckets"], histogram["counts"]):
+                cumulative += count
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="{bucket}"}} {cumulative}')
+            lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {histogram["count"]}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {histogram["sum"]}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {histogram["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def _finish(self, record: dict) -> None:
+        with self._lock:
+            self.calls.append(record)
+            self.counters["calls"] += 1
+            if record["parser"]:
+                self.counters[f"calls_{record['parser']}"] += 1
+            if record["error"]:
+                self.counters["errors"] += 1
+            self.counters["ambiguity_nodes"] += record["ambiguity_nodes"]
+            self.ambiguities.update(record["ambiguities"])
+            for stage, duration in record["stages"].items():
+                self._observe(stage, duration)
+        if self._on_call:
+            self._on_call(record)
+
+    def _observe(self, stage: str, duration: float) -> None:
+        if stage not in self.histograms:
+            self.histograms[stage] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+        histogram = self.histograms[stage]
+        for i, bucket in enumerate(self.buckets):
+            if duration <= bucket:
+                histogram["counts"][i] += 1
+                break
+        histogram["sum"] += duration
+        histogram["count"] += 1
+
+
+class ProfiledCall:
+    """
+    The record of a single profiled call.
+    """
+
+    def __init__(self, function: str, description: str):
+        self.record: dict[str, Any] = {
+            "function": function,
+            "description": description,
+            "start_rule": None,
+            "parser": None,
+            "stages": {},
+            "tree_nodes": 0,
+            "ambiguity_nodes": 0,
+            "ambiguities": [],
+            "error": None,
+        }
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time a stage of the call.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record["stages"][name] = time.perf_counter() - start
+
+    def forest(self, parse_tree: Tree) -> None:
+        """
+        Count the (ambiguity) nodes of the parse forest.
+        """
+        for subtree in parse_tree.iter_subtrees():
+            self.record["tree_nodes"] += 1
+            if subtree.data == "_ambig":
+                self.record["ambiguity_nodes"] += 1
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """
+    Record the calls of the decorated function, of which the first
+    argument is the description, with the active profiler, if any. Nested
+    calls are part of the outer call.
+    """
+
+    def decorator(function: F) -> F:
+        @functools.wraps(function)
+        def wrapper(description: str, *args: Any, **kwargs: Any) -> Any:
+            profiler = _profiler.get()
+            if profiler is None or _call.get() is not None:
+                return function(description, *args, **kwargs)
+
+            call = ProfiledCall(name, description)
+            token = _call.set(call)
+            start = time.perf_counter()
+            try:
+                return function(description, *args, **kwargs)
+            except Exception as e:
+                call.record["error"] = e.__class__.__name__
+                raise
+            finally:
+                call.record["stages"]["total"] = time.perf_counter() - start
+                _call.reset(token)
+                profiler._finish(call.record)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def current_call() -> ProfiledCall | None:
+    """
+    The call being profiled, if any.
+    """
+    return _call.get()
+
+
+def stage(call: ProfiledCall | None, name: str) -> ContextManager:
+    """
+    Time a stage of the call being profiled, if any.
+    """
+    return _NO_STAGE if call is None else call.stage(name)
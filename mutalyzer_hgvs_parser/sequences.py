@@ -0,0 +1,182 @@
+"""
+Module for parsing descriptions with long literal sequences, e.g.,
+`NC_000001.11:g.1000_1001delins[<5 kb>;NM_004006.2:c.10_20]`, in a time
+independent of the sequences length.
+
+The Earley parser processes every character, so the long sequences are
+replaced by short ones with the same first and last characters before
+parsing, and put back in the parse tree afterwards.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterator, NamedTuple, cast
+
+from lark import Token, Tree
+
+_NT = "acgturykmswbdhvnACGTURYKMSWBDHVN"
+
+_AA = (
+    "Ala|Arg|Asn|Asp|Cys|Gln|Glu|Gly|His|Ile|Leu|Lys|Met|Phe|Pro|Ser|Thr|Trp|Tyr|Val|Sec|Ter|Xaa"
+    "|[ARNDCQEGHILKMFPSTWYVUX]"
+)
+
+# Sequences shorter than this are parsed as they are.
+MIN_LENGTH = 64
+
+# Number of nucleotides or amino acids kept at each end.
+_KEEP = 8
+
+# Only letters, so that all the terminals matching some of the characters
+# (i.e., `ID`, `SEQUENCE`, and `P_SEQUENCE`) match all of them.
+_LETTERS = re.compile(f"[A-Za-z]{{{MIN_LENGTH},}}")
+
+# The operations preceding the sequences, e.g., `ins` in `insACGT`, of which
+# the letters are never in a sequence.
+_OPERATIONS = re.compile("del|ins|dup|inv|con")
+
+_NT_SEQUENCE = re.compile(f"[{_NT}]+")
+
+_SEQUENCES = [
+    re.compile(f"[{_NT}]{{{MIN_LENGTH},}}"),
+    re.compile(f"(?:{_AA}){{{MIN_LENGTH // 3},}}"),
+]
+
+_AA_UNIT = re.compile(_AA)
+
+_SEQUENCE_TERMINALS = {"SEQUENCE", "P_SEQUENCE"}
+
+
+class _Span(NamedTuple):
+    # Position of the short sequence in the shortened description.
+    start: int
+    end: int
+    sequence: str
+
+
+def shorten(description: str) -> tuple[str, list[_Span]]:
+    """
+    Replace the long sequences with short ones.
+
+    :arg str description: HGVS description.
+    :returns: The shortened description and the replaced sequences.
+    :rtype: tuple
+    """
+    if len(description) < MIN_LENGTH:
+        return description, []
+
+    parts = []
+    spans: list[_Span] = []
+    position = shift = 0
+    for start, end, is_nucleotides in _sequences(description):
+        sequence = description[start:end]
+        short = _short(sequence, is_nucleotides)
+        parts.append(description[position:start])
+        parts.append(short)
+        spans.append(_Span(start - shift, start - shift + len(short), sequence))
+        shift += len(sequence) - len(short)
+        position = end
+    parts.append(description[position:])
+    return "".join(parts), spans
+
+
+def _sequences(description: str) -> Iterator[tuple[int, int, bool]]:
+    """
+    The long sequences, in the runs of letters. A run with only nucleotide
+    letters, the common case, is not searched for amino acids.
+    """
+    for run_start, run_end in _runs(description):
+        if _NT_SEQUENCE.fullmatch(description, run_start, run_end):
+            yield run_start, run_end, True
+            continue
+        matches = sorted(
+            (
+                (match.start(), match.end(), pattern is _SEQUENCES[0])
+                for pattern in _SEQUENCES
+                for match in pattern.finditer(description, run_start, run_end)
+            ),
+            key=lambda match: (match[0], -match[1]),
+        )
+        position = 0
+        for start, end, is_nucleotides in matches:
+            # Skip the overlapping with a longer one, or too short (the amino acids).
+            if start >= position and end - start >= MIN_LENGTH:
+                yield start, end, is_nucleotides
+                position = end
+
+
+def _runs(description: str) -> Iterator[tuple[int, int]]:
+    """
+    The runs of letters, split at the operations, so that a sequence does
+    not start in the operation (e.g., at `ns` in `insACGT`), which would
+    not be a sequence token.
+    """
+    for letters in _LETTERS.finditer(description):
+        start = letters.start()
+        for operation in _OPERATIONS.finditer(description, letters.start(), letters.end()):
+            if operation.start() - start >= MIN_LENGTH:
+                yield start, operation.start()
+            start = operation.end()
+        if letters.end() - start >= MIN_LENGTH:
+            yield start, letters.end()
+
+
+def _short(sequence: str, is_nucleotides: bool) -> str:
+    if is_nucleotides:
+        return sequence[:_KEEP] + sequence[-_KEEP:]
+    units = _AA_UNIT.findall(sequence)
+    return "".join(units[:_KEEP] + units[-_KEEP:])
+
+
+def restore(parse_tree: Tree, spans: list[_Span]) -> Tree | None:
+    """
+    Put the long sequences back in the parse tree of the shortened
+    description, and shift the positions of the following tokens.
+
+    :arg lark.Tree parse_tree: Parse tree of the shortened description.
+    :arg list spans: The replaced sequences.
+    :returns: The parse tree, or `None` if a short sequence is not exactly
+        a sequence token in all the alternatives, in which case the
+        original description should be parsed instead.
+    :rtype: lark.Tree
+    """
+    visited = set()
+    subtrees = [parse_tree]
+    while subtrees:
+        subtree = subtrees.pop()
+        # Alternatives (`_ambig`) may share subtrees.
+        if id(subtree) in visited:
+            continue
+        visited.add(id(subtree))
+        for i, child in enumerate(subtree.children):
+            if isinstance(child, Tree):
+                subtrees.append(child)
+            else:
+                token = _restore_token(child, spans)
+                if token is None:
+                    return None
+                subtree.children[i] = token
+    return parse_tree
+
+
+def _restore_token(token: Token, spans: list[_Span]) -> Token | None:
+    # Always set by the Earley parser.
+    start_pos, end_pos, column = cast(int, token.start_pos), cast(int, token.end_pos), cast(int, token.column)
+    shift = 0
+    value = token.value
+    for span in spans:
+        if start_pos >= span.end:
+            shift += len(span.sequence) - (span.end - span.start)
+        elif end_pos > span.start:
+            if (start_pos, end_pos) != (span.start, span.end) or token.type not in _SEQUENCE_TERMINALS:
+                return None
+            value = span.sequence
+            break
+    if not shift and value is token.value:
+        return token
+    start_pos += shift
+    column += shift
+    return Token(
+        token.type, value, start_pos, token.line, column, token.end_line, column + len(value), start_pos + len(value)
+    )
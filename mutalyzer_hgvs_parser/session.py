@@ -0,0 +1,135 @@
+"""
+Module for validating a description while it is being edited, e.g., in an
+input box with live validation.
+
+.. code:: python
+
+    >>> session = ParseSession()
+    >>> session.update("NM_004006.2:c.4375C>").status
+    'incomplete'
+    >>> session.update("NM_004006.2:c.4375C>T").status
+    'valid'
+"""
+
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+
+from lark import Tree
+
+from .exceptions import UnexpectedCharacter, UnexpectedEnd
+from .hgvs_parser import parse
+
+# Number of characters after an unexpected character examined by the
+# parser before reporting it, i.e., the longest partially matched
+# terminal (e.g., `pte` for `pter`) beyond that character.
+_LOOKAHEAD = 3
+
+
+class ParseState:
+    """
+    The parse outcome of a description.
+    """
+
+    def __init__(
+        self,
+        description: str,
+        tree: Tree | None = None,
+        error: UnexpectedCharacter | UnexpectedEnd | None = None,
+    ):
+        """
+        :arg str description: The (partial) description.
+        :arg lark.Tree tree: The parse tree, if valid.
+        :arg Exception error: The syntax error, if not valid.
+        """
+        self.description = description
+        self.tree = tree
+        self.error = error
+
+    @property
+    def status(self) -> str:
+        """
+        `valid`, `incomplete` (more input is expected), or `invalid`.
+        """
+        if self.error is None:
+            return "valid"
+        if isinstance(self.error, UnexpectedEnd):
+            return "incomplete"
+        return "invalid"
+
+    @property
+    def position(self) -> int | None:
+        """
+        Position of the unexpected character (or of the last one if the
+        description is incomplete).
+        """
+        return None if self.error is None else self.error.pos_in_stream
+
+    @property
+    def expecting(self) -> list[str]:
+        """
+        What is expected at the error position.
+        """
+        return [] if self.error is None else self.error.expecting
+
+
+class ParseSession:
+    """
+    Parses the successive versions of a description being edited. The
+    outcomes of recent versions are kept (e.g., for deletions and undos),
+    and when the unchanged part of the description already contains an
+    unexpected character, the error is reused without parsing.
+    """
+
+    def __init__(self, start_rule: str | None = None, history: int = 256):
+        """
+        :arg str start_rule: Alternative start rule for the grammar.
+        :arg int history: Number of recent versions outcomes kept.
+        """
+        self.start_rule = start_rule
+        self.history = history
+        self.state: ParseState | None = None
+        self._states: OrderedDict[str, ParseState] = OrderedDict()
+
+    def update(self, description: str) -> ParseState:
+        """
+        Parse the current version of the description.
+
+        :arg str description: The (partial) description.
+        :returns: The parse outcome.
+        :rtype: ParseState
+        """
+        state = self._states.get(description)
+        if state is not None:
+            self._states.move_to_end(description)
+        else:
+            state = self._reuse(description) or self._parse(description)
+            self._states[description] = state
+            if len(self._states) > self.history:
+                self._states.popitem(last=False)
+        self.state = state
+        return state
+
+    def _parse(self, description: str) -> ParseState:
+        try:
+            return ParseState(description, tree=parse(description, start_rule=self.start_rule))
+        except (UnexpectedCharacter, UnexpectedEnd) as e:
+            return ParseState(description, error=e)
+
+    def _reuse(self, description: str) -> ParseState | None:
+        """
+        An unexpected character is reported once no token can include it,
+        which depends only on the description up to that character and the
+        few after it.
+        """
+        if self.state is None or not isinstance(self.state.error, UnexpectedCharacter):
+            return None
+        end = self.state.error.pos_in_stream + 1 + _LOOKAHEAD
+        if len(description) < end or description[:end] != self.state.description[:end]:
+            return None
+
+        error = copy.copy(self.state.error)
+        error.description = description
+        error.args = (error._message(),)
+        return ParseState(description, error=error)
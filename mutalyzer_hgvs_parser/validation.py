@@ -0,0 +1,102 @@
+"""
+Module for only checking whether descriptions are syntactically valid,
+without building the parse trees, e.g., for ingest validators.
+
+.. code:: python
+
+    >>> is_valid("NM_004006.2:c.4375C>T")
+    True
+    >>> validate("NM_004006.2:c.4375C>")
+    Validation(status='incomplete', position=19)
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, NamedTuple, Union
+
+from lark.exceptions import UnexpectedCharacters, UnexpectedEOF
+
+from .exceptions import LimitExceeded
+from .fast_path import fast_to_model
+from .hgvs_parser import Limits, get_parser
+
+
+class Validation(NamedTuple):
+    """
+    The validation outcome of a description.
+    """
+
+    #: `valid`, `incomplete` (more input is expected), or `invalid`.
+    status: str
+    #: Position of the unexpected character (or of the last one if the
+    #: description is incomplete), `None` if valid.
+    position: int | None = None
+
+
+_VALID = Validation("valid")
+
+
+def validate(description: str, start_rule: str | None = None, limits: Limits | None = None) -> Validation:
+    """
+    Check whether an HGVS description, or a description part if an
+    alternative `start_rule` is provided, is syntactically valid. The
+    parse tree is not built, so the ambiguities are not solved (nor
+    counted for the limits) and the error messages are not computed.
+
+    :arg str description: Description (or description part) to be checked.
+    :arg str start_rule: Alternative start rule for the grammar.
+    :arg Limits limits: Limits on the description.
+    :returns: The status and the error position.
+    :rtype: Validation
+    :raises LimitExceeded: If the description exceeds a limit.
+    """
+    parser = get_parser(start_rule=start_rule)
+    if limits is not None:
+        parser = parser.with_limits(limits)
+        # The fast path does not bypass the limits.
+        limits.check(description)
+    if start_rule in (None, "description") and fast_to_model(description) is not None:
+        return _VALID
+    try:
+        parser._recognize(description)
+    except UnexpectedCharacters as e:
+        return Validation("invalid", e.pos_in_stream or 0)
+    except UnexpectedEOF:
+        return Validation("incomplete", len(description) - 1)
+    return _VALID
+
+
+def is_valid(description: str, start_rule: str | None = None, limits: Limits | None = None) -> bool:
+    """
+    Check whether an HGVS description, or a description part if an
+    alternative `start_rule` is provided, is syntactically valid.
+
+    :arg str description: Description (or description part) to be checked.
+    :arg str start_rule: Alternative start rule for the grammar.
+    :arg Limits limits: Limits on the description.
+    :returns: `True` if valid.
+    :rtype: bool
+    :raises LimitExceeded: If the description exceeds a limit.
+    """
+    return validate(description, start_rule, limits).status == "valid"
+
+
+def validate_many(
+    descriptions: Iterable[str], start_rule: str | None = None, limits: Limits | None = None
+) -> Iterator[Union[Validation, LimitExceeded]]:
+    """
+    Check the provided HGVS `descriptions` lazily, yielding the validation
+    outcomes in the input order. Exceeded limits are yielded, instead of
+    raised, so that one description does not abort the batch.
+
+    :arg iterable descriptions: Descriptions (or description parts) to be checked.
+    :arg str start_rule: Alternative start rule for the grammar.
+    :arg Limits limits: Limits on every description.
+    :returns: The statuses and the error positions, or the exceeded limits.
+    :rtype: iterator
+    """
+    for description in descriptions:
+        try:
+            yield validate(description, start_rule, limits)
+        except LimitExceeded as e:
+            yield e
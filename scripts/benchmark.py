@@ -0,0 +1,264 @@
+"""
+Benchmark the parsing, disambiguation, and conversion stages separately,
+and end-to-end, over a corpus of descriptions.
+
+The corpus has one tab separated category and description per line
+(the bundled `benchmark_corpus.txt` by default). Results are printed and
+can be saved as JSON, to compare them later against another version:
+
+    python scripts/benchmark.py -o new.json --compare old.json
+
+With `--threads`, the `to_model` throughput is also measured with up to
+that many threads, using the shared parsers and a parser pool, and with
+`--sequences`, the `to_model` latency for inserted sequences (in a list
+and repeated) of 10 nt up to 1 Mnt. With `--alleles`, the `to_model` and
+`to_allele_model` (with an empty and with a warm variant cache) latencies
+for alleles of 10 up to 300 variants.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import version
+
+import lark
+
+from mutalyzer_hgvs_parser.alleles import to_allele_model
+from mutalyzer_hgvs_parser.cache import ResultCache
+from mutalyzer_hgvs_parser.convert import Converter, _convert, to_model
+from mutalyzer_hgvs_parser.hgvs_parser import _resolve_transformer, get_parser
+from mutalyzer_hgvs_parser.pool import ParserPool
+
+CORPUS = os.path.join(os.path.dirname(__file__), "benchmark_corpus.txt")
+
+
+def read_corpus(path):
+    corpus = []
+    with open(path) as corpus_file:
+        for line in corpus_file:
+            if line.strip() and not line.startswith("#"):
+                category, description = line.rstrip("\n").split("\t")
+                corpus.append((category, description))
+    return corpus
+
+
+def stages(corpus):
+    """
+    The stages, each with its inputs (prepared by the previous stage) and
+    the function timed on every input.
+    """
+    parser = get_parser()
+    descriptions = [description for _, description in corpus]
+    parsed = [parser._parse(description) for description in descriptions]
+    resolved = [tree if is_resolved else _resolve_transformer.transform(tree) for tree, is_resolved in parsed]
+    converter = Converter()
+
+    def disambiguate(parsed_tree):
+        tree, is_resolved = parsed_tree
+        return tree if is_resolved else _resolve_transformer.transform(tree)
+
+    return {
+        "parse": (descriptions, parser._parse),
+        "disambiguation": (parsed, disambiguate),
+        "conversion": (resolved, lambda tree: _convert(tree, converter)),
+        "to_model": (descriptions, to_model),
+    }
+
+
+def time_stage(inputs, function, repeat):
+    latencies = []
+    for _ in range(repeat):
+        for stage_input in inputs:
+            start = time.perf_counter()
+            function(stage_input)
+            latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return {
+        "count": len(latencies),
+        "throughput": len(latencies) / sum(latencies),
+        "p50_ms": 1000 * statistics.median(latencies),
+        "p99_ms": 1000 * latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))],
+    }
+
+
+def peak_memory(inputs, function):
+    """
+    Measured in a separate run, since tracing slows down the timings.
+    """
+    tracemalloc.start()
+    for stage_input in inputs:
+        function(stage_input)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def thread_scaling(corpus, repeat, threads):
+    """
+    The `to_model` throughput for 1, 2, 4, ... threads, each converting
+    the whole corpus.
+    """
+    descriptions = [description for _, description in corpus] * repeat
+    scaling = {}
+    counts = [2**i for i in range(threads.bit_length()) if 2**i < threads] + [threads]
+    for name, function in [("shared", to_model), ("pool", ParserPool(threads).to_model)]:
+        scaling[name] = {}
+        for count in counts:
+            with ThreadPoolExecutor(count) as executor:
+                # Untimed, so that the pool parsers are built.
+                list(executor.map(function, descriptions[:count]))
+                start = time.perf_counter()
+                list(executor.map(lambda _: [function(d) for d in descriptions], range(count)))
+                scaling[name][count] = count * len(descriptions) / (time.perf_counter() - start)
+    return scaling
+
+
+def sequence_scaling(repeat):
+    """
+    The `to_model` p50 latencies for insertions with a sequence of 10 nt,
+    100 nt, ..., 1 Mnt, followed by a reference part, or repeated.
+    """
+    shapes = {
+        "inserted list": "NC_000001.11:g.1000_1001delins[{};NM_004006.2:c.10_20]",
+        "repeated insertion": "NC_000001.11:g.1000_1001ins{}[3]",
+    }
+    scaling = {}
+    for power in range(1, 7):
+        sequence = ("ACGT" * (10**power // 4 + 1))[: 10**power]
+        scaling[10**power] = {
+            name: time_stage([shape.format(sequence)], to_model, repeat)["p50_ms"] for name, shape in shapes.items()
+        }
+    return scaling
+
+
+def allele_scaling(repeat):
+    """
+    The p50 latencies for alleles of 10, 30, 100, and 300 variants, of
+    which some are only parsed by the Earley parser.
+    """
+    variants = ["{}_{}insN[10]", "{}_{}ins[A;T[3]]", "({}_{})del", "{}_{}delins[AT[3];GC]", "{}del", "{}A>G"]
+    scaling = {}
+    for count in [10, 30, 100, 300]:
+        description = "NM_000088.3:c.[{}]".format(
+            ";".join(variants[i % len(variants)].format(100 + 7 * i, 101 + 7 * i) for i in range(count))
+        )
+        cache = ResultCache(max_size=count)
+        functions = {
+            "to_model": to_model,
+            "empty cache": lambda d: to_allele_model(d, ResultCache(count)),
+            "warm cache": lambda d: to_allele_model(d, cache),
+        }
+        scaling[count] = {name: time_stage([description], f, repeat)["p50_ms"] for name, f in functions.items()}
+    return scaling
+
+
+def benchmark(corpus, repeat, threads=None, sequences=False, alleles=False):
+    results = {
+        "version": version("mutalyzer-hgvs-parser"),
+        "lark": lark.__version__,
+        "python": platform.python_version(),
+        "corpus_size": len(corpus),
+        "repeat": repeat,
+        "stages": {},
+        "categories": {},
+    }
+    for stage, (inputs, function) in stages(corpus).items():
+        results["stages"][stage] = time_stage(inputs, function, repeat)
+        results["stages"][stage]["peak_memory_kb"] = peak_memory(inputs, function)
+
+    for category in sorted({category for category, _ in corpus}):
+        descriptions = [description for c, description in corpus if c == category]
+        results["categories"][category] = time_stage(descriptions, to_model, repeat)
+
+    if threads:
+        results["threads"] = thread_scaling(corpus, repeat, threads)
+    if sequences:
+        results["sequences"] = sequence_scaling(repeat)
+    if alleles:
+        results["alleles"] = allele_scaling(repeat)
+    return results
+
+
+def print_results(results):
+    print(
+        f"mutalyzer-hgvs-parser {results['version']}, lark {results['lark']}, "
+        f"Python {results['python']}, {results['corpus_size']} descriptions x {results['repeat']}"
+    )
+    print(f"\n{'stage':<16}{'desc/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'peak KiB':>12}")
+    for stage, result in results["stages"].items():
+        print(
+            f"{stage:<16}{result['throughput']:>12.1f}{result['p50_ms']:>10.3f}"
+            f"{result['p99_ms']:>10.3f}{result['peak_memory_kb']:>12.1f}"
+        )
+    print(f"\n{'to_model':<16}{'desc/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+    for category, result in results["categories"].items():
+        print(f"{category:<16}{result['throughput']:>12.1f}{result['p50_ms']:>10.3f}{result['p99_ms']:>10.3f}")
+    if "threads" in results:
+        print(f"\n{'threads':<16}" + "".join(f"{name + ' desc/s':>16}" for name in results["threads"]))
+        for count in results["threads"]["shared"]:
+            print(f"{count:<16}" + "".join(f"{scaling[count]:>16.1f}" for scaling in results["threads"].values()))
+    if "sequences" in results:
+        print(f"\n{'sequence nt':<16}" + "".join(f"{name + ' ms':>24}" for name in results["sequences"][10]))
+        for length, latencies in results["sequences"].items():
+            print(f"{length:<16}" + "".join(f"{latency:>24.3f}" for latency in latencies.values()))
+    if "alleles" in results:
+        print(f"\n{'variants':<16}" + "".join(f"{name + ' ms':>18}" for name in results["alleles"][10]))
+        for count, latencies in results["alleles"].items():
+            print(f"{count:<16}" + "".join(f"{latency:>18.3f}" for latency in latencies.values()))
+
+
+def compare(results, baseline, threshold):
+    """
+    Print the p50 latency ratios against a baseline and return whether
+    any stage or category regressed above the threshold.
+    """
+    print(f"\nCompared to {baseline['version']} (new / old p50 latency):")
+    regressed = False
+    for group in ["stages", "categories"]:
+        for name, result in results[group].items():
+            if name not in baseline[group]:
+                continue
+            ratio = result["p50_ms"] / baseline[group][name]["p50_ms"]
+            flag = ""
+            if ratio > threshold:
+                flag = "  REGRESSION"
+                regressed = True
+            print(f" {name:<16}{ratio:>8.2f}{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the HGVS parser stages.")
+    parser.add_argument("-c", "--corpus", default=CORPUS, help="corpus file path")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="corpus repetitions")
+    parser.add_argument("-o", "--output", help="save the results as JSON")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=1.2, help="p50 latency ratio considered a regression"
+    )
+    parser.add_argument("--threads", type=int, help="measure the scaling up to this many threads")
+    parser.add_argument("--sequences", action="store_true", help="measure the scaling with the sequence length")
+    parser.add_argument("--alleles", action="store_true", help="measure the scaling with the number of variants")
+    args = parser.parse_args()
+
+    results = benchmark(read_corpus(args.corpus), args.repeat, args.threads, args.sequences, args.alleles)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            if compare(results, json.load(baseline_file), args.threshold):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
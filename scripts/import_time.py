@@ -0,0 +1,56 @@
+"""
+Benchmark the startup time: importing the package, the CLI `-v` and
+`--help`, and the first parse (which builds the parser), each in a new
+Python process.
+
+    python scripts/import_time.py -n 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+CLI = "import sys; sys.argv = ['mutalyzer_hgvs_parser', '{}']; from mutalyzer_hgvs_parser.cli import main; main()"
+
+CASES = {
+    "import": "import mutalyzer_hgvs_parser",
+    "cli -v": CLI.format("-v"),
+    "cli --help": CLI.format("--help"),
+    "first parse": "from mutalyzer_hgvs_parser import parse; parse('NM_004006.2:c.4375C>T')",
+}
+
+# Measured inside the process, without the interpreter startup.
+TIMER = """
+import time
+start = time.perf_counter()
+try:
+{}
+except SystemExit:
+    pass
+print(time.perf_counter() - start)
+"""
+
+
+def time_case(code, repeat):
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format("    " + code)], capture_output=True, text=True, check=True
+        ).stdout
+        timings.append(1000 * float(output.splitlines()[-1]))
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the startup time.")
+    parser.add_argument("-n", "--repeat", type=int, default=10, help="runs per case")
+    args = parser.parse_args()
+
+    print(f"{'case':<16}{'median ms':>12}")
+    for case, code in CASES.items():
+        print(f"{case:<16}{time_case(code, args.repeat):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+Search for descriptions of which the parsing time grows super-linearly
+with their length, e.g., after changes to the grammar or `AMBIGUITIES`.
+
+Starting from the benchmark corpus descriptions, randomly mutated (e.g.,
+with uncertain ranges, offsets, or predicted variants), the descriptions
+are repeatedly grown by grammar-aware steps (more alleles variants, nested
+inserted descriptions, repeat mixed chains, inserted lists, longer
+sequences). The parsing plus disambiguation time and the parse tree size
+are measured along each growth, and the growths with the largest exponent
+of the time as a function of the length (1 for linear) are reported,
+ignoring those too fast to be measured reliably. A growth that exceeds
+the parsing timeout is reported as well:
+
+    python scripts/perf_fuzz.py -n 200 --seed 1 -o fuzz.json --fail-above 1.5
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+from mutalyzer_hgvs_parser.alleles import split_allele
+from mutalyzer_hgvs_parser.exceptions import LimitExceeded, UnexpectedCharacter, UnexpectedEnd
+from mutalyzer_hgvs_parser.header import scan_header
+from mutalyzer_hgvs_parser.hgvs_parser import Limits, _resolve_transformer, get_parser
+
+CORPUS = os.path.join(os.path.dirname(__file__), "benchmark_corpus.txt")
+
+_POINT = re.compile(r"(?<=[.;\[_])(\d+)(?=[_a-zA-Z>=\]])")
+
+_REPEAT = re.compile(r"([ACGTN]+)\[(\d+)\](?!.*[ACGTN]+\[\d+\])")
+
+
+def _variants_position(description):
+    scanned = scan_header(description)
+    return None if scanned is None else scanned[1]
+
+
+# One-shot mutations, to make some constructs appear in the seeds.
+
+
+def uncertain_range(description):
+    return _POINT.sub(lambda match: f"(?_{match[1]})", description, count=1)
+
+
+def uncertain_point(description):
+    return _POINT.sub(lambda match: f"({match[1]}_{int(match[1]) + 10})", description, count=1)
+
+
+def offset(description):
+    return _POINT.sub(lambda match: f"{match[1]}+5", description, count=1)
+
+
+def predicted(description):
+    position = _variants_position(description)
+    if position is None:
+        return None
+    return f"{description[:position]}({description[position:]})"
+
+
+def repeat(description):
+    return re.sub(r"ins([ACGTN]+)$", r"ins\1[5]", description)
+
+
+def insert_list(description):
+    return re.sub(r"ins([^\[\];]+)$", r"ins[\1;N[10]]", description)
+
+
+MUTATIONS = [uncertain_range, uncertain_point, offset, predicted, repeat, insert_list]
+
+
+# Growth steps, applied repeatedly.
+
+
+def allele(description):
+    position = _variants_position(description)
+    if position is None:
+        return None
+    allele = split_allele(description)
+    variants = allele[1] if allele else [description[position:]]
+    return f"{description[:position]}[{';'.join(variants[:1] + variants)}]"
+
+
+def nested_insert(description):
+    return f"R1:c.10_11ins[{description}]"
+
+
+def repeat_mixed(description):
+    if _REPEAT.search(description) is None:
+        return None
+    return _REPEAT.sub(lambda match: f"{match[0]}{match[1]}[{match[2]}]", description, count=1)
+
+
+def inserted_list(description):
+    if "ins[" not in description:
+        return None
+    return description.replace("ins[", "ins[N[10];", 1)
+
+
+def sequence(description):
+    if re.search(r"ins[ACGT]+$", description) is None:
+        return None
+    return description + "ACGT"
+
+
+GROWERS = [allele, nested_insert, repeat_mixed, inserted_list, sequence]
+
+
+def read_corpus(path):
+    with open(path) as corpus_file:
+        return [line.rstrip("\n").split("\t")[1] for line in corpus_file if line.strip() and not line.startswith("#")]
+
+
+def measure(parser, description, repeat_count):
+    """
+    The median parsing plus disambiguation time, and the parse tree size.
+    """
+    timings = []
+    for _ in range(repeat_count):
+        start = time.perf_counter()
+        parse_tree, resolved = parser._parse(description)
+        parsed = time.perf_counter()
+        if not resolved:
+            _resolve_transformer.transform(parse_tree)
+        end = time.perf_counter()
+        timings.append((parsed - start, end - parsed))
+    nodes = ambiguities = 0
+    for subtree in parse_tree.iter_subtrees():
+        nodes += 1
+        ambiguities += subtree.data == "_ambig"
+    return {
+        "length": len(description),
+        "parse_ms": 1000 * statistics.median(t[0] for t in timings),
+        "disambiguation_ms": 1000 * statistics.median(t[1] for t in timings),
+        "nodes": nodes,
+        "ambiguities": ambiguities,
+        "parser": "lalr" if resolved else "earley",
+    }
+
+
+def _total(point):
+    return point["parse_ms"] + point["disambiguation_ms"]
+
+
+def growth_exponent(points):
+    """
+    Least squares slope of the log added time as a function of the log
+    added length, relative to the first point, so that the time of the
+    seed (e.g., taking the LALR parser) does not hide the growth.
+    """
+    added = [
+        (point["length"] - points[0]["length"], _total(point) - _total(points[0]))
+        for point in points[1:]
+        if _total(point) > _total(points[0])
+    ]
+    if len(added) < 2:
+        return 0.0
+    xs = [math.log(length) for length, _ in added]
+    ys = [math.log(total) for _, total in added]
+    x_mean, y_mean = statistics.mean(xs), statistics.mean(ys)
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    if not variance:
+        return 0.0
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / variance
+
+
+def mutate(parser, description, rng, count):
+    for mutation in rng.sample(MUTATIONS, count):
+        mutated = mutation(description)
+        try:
+            if mutated and mutated != description and _is_valid(parser, mutated):
+                description = mutated
+        except LimitExceeded:
+            pass
+    return description
+
+
+def _is_valid(parser, description):
+    try:
+        parser._parse(description)
+    except (UnexpectedCharacter, UnexpectedEnd):
+        return False
+    return True
+
+
+def grow(parser, seed, growers, steps, max_length, repeat_count):
+    """
+    Apply the growers in turn, measuring at 1, 2, 4, ... growth steps,
+    until the description is not valid, too long, or times out.
+    """
+    points = []
+    description = seed
+    timed_out = False
+    try:
+        for step in range(1, steps + 1):
+            # The growers are applied in turn, skipping those not applicable.
+            for grower in growers[step % len(growers) :] + growers[: step % len(growers)]:
+                grown = grower(description)
+                if grown and len(grown) <= max_length and _is_valid(parser, grown):
+                    break
+            else:
+                break
+            description = grown
+            if step & (step - 1) == 0:
+                points.append(measure(parser, description, repeat_count))
+                points[-1]["description"] = description
+    except LimitExceeded:
+        timed_out = True
+    return points, timed_out
+
+
+def search(corpus, iterations, steps, max_length, timeout, repeat_count, rng, budget=None):
+    parser = get_parser().with_limits(Limits(timeout=timeout))
+    started = time.monotonic()
+    results = []
+    for _ in range(iterations):
+        if budget is not None and time.monotonic() - started > budget:
+            break
+        seed = mutate(parser, rng.choice(corpus), rng, rng.randint(0, 2))
+        applicable = [grower for grower in GROWERS if grower(seed)]
+        growers = rng.sample(applicable, min(len(applicable), rng.randint(1, 2)))
+        points, timed_out = grow(parser, seed, growers, steps, max_length, repeat_count)
+        if len(points) < 3:
+            continue
+        results.append(
+            {
+                "seed": seed,
+                "growers": [grower.__name__ for grower in growers],
+                "exponent": growth_exponent(points),
+                "timed_out": timed_out,
+                "points": points,
+            }
+        )
+    return results
+
+
+def significant(results, min_ms):
+    """
+    The growths ending above `min_ms`, of which the exponent is not timer noise.
+    """
+    return [result for result in results if _total(result["points"][-1]) >= min_ms or result["timed_out"]]
+
+
+def print_results(results, top):
+    print(f"{len(results)} growths above the minimum time\n")
+    print(f"{'exponent':>9}{'length':>8}{'ms':>10}{'ms/char':>9}{'ambig':>7}  growers / seed")
+    for result in sorted(results, key=lambda result: (result["timed_out"], result["exponent"]), reverse=True)[:top]:
+        last = result["points"][-1]
+        total = _total(last)
+        flag = " TIMEOUT" if result["timed_out"] else ""
+        print(
+            f"{result['exponent']:>9.2f}{last['length']:>8}{total:>10.2f}{total / last['length']:>9.3f}"
+            f"{last['ambiguities']:>7}  {'+'.join(result['growers'])}{flag}: {result['seed']}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search for super-linear parsing inputs.")
+    parser.add_argument("-c", "--corpus", default=CORPUS, help="seed corpus file path")
+    parser.add_argument("-n", "--iterations", type=int, default=100, help="number of growths")
+    parser.add_argument("--steps", type=int, default=32, help="maximum growth steps")
+    parser.add_argument("--max-length", type=int, default=2000, help="maximum description length")
+    parser.add_argument("--timeout", type=float, default=2.0, help="parsing time limit (seconds)")
+    parser.add_argument("--repeat", type=int, default=3, help="timings per measurement")
+    parser.add_argument("--budget", type=float, help="total search time limit (seconds)")
+    parser.add_argument("--seed", type=int, help="random seed")
+    parser.add_argument("--top", type=int, default=20, help="number of growths reported")
+    parser.add_argument("--min-ms", type=float, default=10.0, help="minimum final time of the growths reported")
+    parser.add_argument("-o", "--output", help="save the results as JSON")
+    parser.add_argument("--fail-above", type=float, help="exit with an error above this exponent (or on a timeout)")
+    args = parser.parse_args()
+
+    results = search(
+        read_corpus(args.corpus),
+        args.iterations,
+        args.steps,
+        args.max_length,
+        args.timeout,
+        args.repeat,
+        random.Random(args.seed),
+        args.budget,
+    )
+    print_results(significant(results, args.min_ms), args.top)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if args.fail_above is not None and any(
+        result["exponent"] > args.fail_above or result["timed_out"] for result in significant(results, args.min_ms)
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Tests for the asyncio interface.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mutalyzer_hgvs_parser import aio
+from mutalyzer_hgvs_parser.aio import AsyncConverter, aparse, ato_model, ato_model_many
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter
+from mutalyzer_hgvs_parser.hgvs_parser import parse
+
+DESCRIPTIONS = [
+    "NM_004006.2:c.4375C>T",
+    "NG_012337.1(SDHD_v001):c.274G>T",
+    "NM_004006.2:c.[4375C>T;4380_4390del]",
+    "NP_003997.1:p.(Trp24Cys)",
+    "NM_004006.2:c.43x75C>T",
+    "NG_012337.1:g.100_101ins[AT[5];NM_004006.2:c.10_20]",
+]
+
+
+def _expected(description):
+    try:
+        return to_model(description)
+    except UnexpectedCharacter as e:
+        return str(e)
+
+
+def _results(models):
+    return [model if isinstance(model, dict) else str(model) for model in models]
+
+
+def test_aparse():
+    assert asyncio.run(aparse("NM_004006.2:c.4375C>T")) == parse("NM_004006.2:c.4375C>T")
+
+
+def test_ato_model():
+    assert asyncio.run(ato_model("NM_004006.2:c.4375C>T")) == to_model("NM_004006.2:c.4375C>T")
+
+
+def test_ato_model_start_rule():
+    assert asyncio.run(ato_model("4375C>T", "variant")) == to_model("4375C>T", "variant")
+
+
+def test_ato_model_error():
+    with pytest.raises(UnexpectedCharacter):
+        asyncio.run(ato_model("NM_004006.2:c.43x75C>T"))
+
+
+def test_ato_model_concurrent():
+    async def run():
+        converter = AsyncConverter(workers=2, max_pending=2)
+        async with converter:
+            return await asyncio.gather(*(converter.to_model(d) for d in DESCRIPTIONS * 5), return_exceptions=True)
+
+    assert _results(asyncio.run(run())) == [_expected(d) for d in DESCRIPTIONS * 5]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 100])
+def test_ato_model_many(chunk_size):
+    async def run():
+        return [model async for model in ato_model_many(DESCRIPTIONS * 3, chunk_size=chunk_size)]
+
+    assert _results(asyncio.run(run())) == [_expected(d) for d in DESCRIPTIONS * 3]
+
+
+def test_ato_model_many_async_input():
+    async def descriptions():
+        for description in DESCRIPTIONS:
+            await asyncio.sleep(0)
+            yield description
+
+    async def run():
+        return [model async for model in ato_model_many(descriptions(), chunk_size=4)]
+
+    assert _results(asyncio.run(run())) == [_expected(d) for d in DESCRIPTIONS]
+
+
+def test_ato_model_many_backpressure():
+    read = []
+
+    def descriptions():
+        for description in DESCRIPTIONS * 10:
+            read.append(description)
+            yield description
+
+    async def run():
+        converter = AsyncConverter(workers=1, max_pending=2)
+        async with converter:
+            models = converter.to_model_many(descriptions(), chunk_size=3)
+            await models.__anext__()
+            await models.aclose()
+
+    asyncio.run(run())
+    assert len(read) == 2 * 3
+
+
+def test_ato_model_many_cancel(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    chunks = []
+
+    def to_model_chunk(descriptions, start_rule, limits=None):
+        chunks.append(descriptions)
+        started.set()
+        release.wait()
+        return []
+
+    monkeypatch.setattr(aio, "_to_model_chunk", to_model_chunk)
+
+    async def run():
+        converter = AsyncConverter(workers=1, max_pending=3)
+        async with converter:
+            task = asyncio.ensure_future(converter.to_model_many(DESCRIPTIONS, chunk_size=1).__anext__())
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            release.set()
+
+    asyncio.run(run())
+    # Only the running chunk was converted, the queued ones were cancelled.
+    assert chunks == [DESCRIPTIONS[:1]]
+
+
+def test_ato_model_many_processes():
+    async def run():
+        async with AsyncConverter(workers=2, processes=True) as converter:
+            return [model async for model in converter.to_model_many(DESCRIPTIONS, chunk_size=2)]
+
+    assert _results(asyncio.run(run())) == [_expected(d) for d in DESCRIPTIONS]
+
+
+def test_converter_event_loops():
+    converter = AsyncConverter(workers=1, max_pending=1)
+
+    async def run():
+        # Waiting for the semaphore binds it to the event loop.
+        return await asyncio.gather(*(converter.to_model(d) for d in DESCRIPTIONS[:3]))
+
+    for _ in range(2):
+        assert asyncio.run(run()) == [to_model(d) for d in DESCRIPTIONS[:3]]
+    converter.close()
+
+
+def test_ato_model_many_bounded(monkeypatch):
+    lock = threading.Lock()
+    running = []
+    concurrency = []
+
+    def to_model_chunk(descriptions, start_rule, limits=None):
+        with lock:
+            running.append(descriptions)
+            concurrency.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(descriptions)
+        return descriptions
+
+    monkeypatch.setattr(aio, "_to_model_chunk", to_model_chunk)
+
+    async def convert(converter):
+        return [model async for model in converter.to_model_many(DESCRIPTIONS, chunk_size=1)]
+
+    async def run():
+        async with AsyncConverter(workers=4, max_pending=2) as converter:
+            return await asyncio.gather(*(convert(converter) for _ in range(3)))
+
+    assert asyncio.run(run()) == [DESCRIPTIONS] * 3
+    assert max(concurrency) == 2
+
+
+def test_get_converter_threads(monkeypatch):
+    class SlowConverter(AsyncConverter):
+        def __init__(self):
+            time.sleep(0.01)
+            super().__init__(workers=1)
+
+    monkeypatch.setattr(aio, "_converter", None)
+    monkeypatch.setattr(aio, "AsyncConverter", SlowConverter)
+    converters = []
+    threads = [threading.Thread(target=lambda: converters.append(aio._get_converter())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(converter) for converter in converters}) == 1
+    converters[0].close()
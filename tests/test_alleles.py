@@ -0,0 +1,102 @@
+"""
+Tests for the allele conversion variant by variant.
+"""
+
+import pytest
+
+from mutalyzer_hgvs_parser.alleles import split_allele, to_allele_model
+from mutalyzer_hgvs_parser.cache import ResultCache
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.exceptions import NestedDescriptions, UnexpectedCharacter, UnexpectedEnd
+
+from .test_convert import DESCRIPTIONS, VARIANTS
+from .test_protein import TESTS
+
+ALLELES = [
+    "NM_000088.3:c.[100del;200dup;5000A>G]",
+    "NM_000088.3:c.[100del;100del;100del]",
+    "NG_1(NM_1):c.[ 10_11ins[A;T[3];R2:c.10_20] ; (20del) ;30_31insN[10]]",
+    "NG_1:g.[10_11insR2:c.10_20;20_21delins[R3:g.5_6;AT]]",
+    "NG_1:r.[10a>u;(20_30)del]",
+    "NP_1:p.[Arg2Ter;(Ser3Cys);Trp24_Cys25insGlyLeu]",
+    "NM_1:c.[" + ";".join(VARIANTS) + "]",
+]
+
+
+@pytest.mark.parametrize("description", ALLELES + list(DESCRIPTIONS) + [d for d in TESTS if TESTS[d]])
+def test_to_allele_model(description):
+    model = to_model(description)
+    allele_model = to_allele_model(description, ResultCache())
+    assert allele_model == model
+    assert list(allele_model) == list(model)
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "R1:c.[10del;20del",
+        "R1:c.[10del;20del]]",
+        "R1:c.[10del;;20del]",
+        "R1:c.[10del;20delx]",
+        "R1:c.[=;10del]",
+        "R1:c.[10del;(20del]",
+        "R1:c.[10del;20_21insR2:c.[5del;6del]]",
+        "P1:p.[Arg2Ter;=]",
+    ],
+)
+def test_to_allele_model_error(description):
+    with pytest.raises((UnexpectedCharacter, UnexpectedEnd, NestedDescriptions)) as exc:
+        to_allele_model(description, ResultCache())
+    with pytest.raises(exc.type) as model_exc:
+        to_model(description)
+    assert str(exc.value) == str(model_exc.value)
+
+
+@pytest.mark.parametrize(
+    "description, expected",
+    [
+        (
+            "NG_1(NM_1):c.[10_11ins[A;T];(20del);30_31insR2:c.[5del;6del]]",
+            (
+                {"reference": {"id": "NG_1", "selector": {"id": "NM_1"}}, "coordinate_system": "c"},
+                ["10_11ins[A;T]", "(20del)", "30_31insR2:c.[5del;6del]"],
+            ),
+        ),
+        (
+            "NP_1:p.[ Arg2Ter ; Ser3Cys ]",
+            ({"reference": {"id": "NP_1"}, "coordinate_system": "p"}, ["Arg2Ter", "Ser3Cys"]),
+        ),
+        ("R1:c.[10del]", None),
+        ("R1:c.10del", None),
+        ("R1:[10del;20del]", None),
+        ("R1:c.([10del;20del])", None),
+        ("R1:c.[(10del;20del)]", None),
+        ("R1:c.[10del;20del", None),
+        ("R1:c.[10del];[20del]", None),
+        ("R1!:c.[10del;20del]", None),
+    ],
+)
+def test_split_allele(description, expected):
+    assert split_allele(description) == expected
+
+
+def test_to_allele_model_cache():
+    cache = ResultCache()
+    to_allele_model("R1:c.[10del;20del;10del]", cache)
+    assert cache.stats()["misses"] == 2
+    model = to_allele_model("R2:c.[20del;10del]", cache)
+    assert cache.stats()["hits"] == 2
+    assert model == to_model("R2:c.[20del;10del]")
+
+
+def test_to_allele_model_copies():
+    cache = ResultCache()
+    model = to_allele_model("R1:c.[10del;10del]", cache)
+    model["variants"][0]["type"] = "modified"
+    assert model["variants"][1]["type"] == "deletion"
+    assert to_allele_model("R1:c.[10del;10del]", cache) == to_model("R1:c.[10del;10del]")
+
+
+def test_to_allele_model_workers():
+    description = "NM_1:c.[" + ";".join(VARIANTS) + ";(10del)]"
+    assert to_allele_model(description, ResultCache(), workers=2, chunk_size=10) == to_model(description)
@@ -1,8 +1,20 @@
+import threading
+
 import pytest
+from lark import Transformer
 from lark.tree import Tree
 
 from mutalyzer_hgvs_parser.convert import to_model
-from mutalyzer_hgvs_parser.hgvs_parser import get_child
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter, UnexpectedEnd
+from mutalyzer_hgvs_parser.hgvs_parser import (
+    AMBIGUITIES,
+    HgvsParser,
+    _ambiguity_candidates,
+    ambiguity_hits,
+    get_child,
+    parse,
+    reset_ambiguity_hits,
+)
 
 from .test_convert import DESCRIPTIONS, INSERTED, VARIANTS
 from .test_protein import HGVS_NOMENCLATURE
@@ -74,3 +86,53 @@ def test_get_child(children, path, output):
     print(path)
     print(get_child(children, path))
     assert get_child(children, path) == output
+
+
+class _DispatchChecker(Transformer):
+    def _ambig(self, children):
+        linear = [i for i, ambig in enumerate(AMBIGUITIES) if ambig["conditions"](children)]
+        indexed = [
+            i for i in _ambiguity_candidates(children[0].data, len(children)) if AMBIGUITIES[i]["conditions"](children)
+        ]
+        assert linear[:1] == indexed[:1]
+        return children[AMBIGUITIES[linear[0]]["selected"]] if linear else children[0]
+
+
+@pytest.mark.parametrize(
+    "start_rule, descriptions",
+    [
+        ("description", list(DESCRIPTIONS) + list(HGVS_NOMENCLATURE)),
+        ("variant", list(VARIANTS)),
+        ("inserted", list(INSERTED)),
+    ],
+)
+def test_ambiguities_dispatch(start_rule, descriptions):
+    parser = HgvsParser(start_rule=start_rule)
+    for description in descriptions:
+        try:
+            parse_tree = parser.parse(description)
+        except (UnexpectedCharacter, UnexpectedEnd):
+            continue
+        _DispatchChecker().transform(parse_tree)
+
+
+def test_ambiguity_hits():
+    reset_ambiguity_hits()
+    parse("10", start_rule="inserted")
+    parse("10", start_rule="inserted")
+    assert ambiguity_hits() == [{"index": 0, "type": AMBIGUITIES[0]["type"], "hits": 2}]
+    reset_ambiguity_hits()
+    assert ambiguity_hits() == []
+
+
+def test_ambiguity_hits_threads():
+    reset_ambiguity_hits()
+    parse("10", start_rule="inserted")
+    thread = threading.Thread(target=parse, args=("10",), kwargs={"start_rule": "inserted"})
+    thread.start()
+    thread.join()
+    # Also the hits of the ended threads.
+    assert ambiguity_hits() == [{"index": 0, "type": AMBIGUITIES[0]["type"], "hits": 2}]
+    reset_ambiguity_hits()
+    parse("10", start_rule="inserted")
+    assert ambiguity_hits() == [{"index": 0, "type": AMBIGUITIES[0]["type"], "hits": 1}]
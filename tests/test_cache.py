@@ -0,0 +1,68 @@
+"""
+Tests for the results cache.
+"""
+
+import pytest
+
+from mutalyzer_hgvs_parser.cache import ResultCache
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter
+from mutalyzer_hgvs_parser.hgvs_parser import parse
+
+
+def test_cache_hits_and_misses():
+    cache = ResultCache()
+    assert cache.to_model("NM_004006.2:c.4375C>T") == to_model("NM_004006.2:c.4375C>T")
+    assert cache.to_model("NM_004006.2:c.4375C>T") == to_model("NM_004006.2:c.4375C>T")
+    assert cache.to_model("4375C>T", "variant") == to_model("4375C>T", "variant")
+    assert cache.parse("NM_004006.2:c.4375C>T") == parse("NM_004006.2:c.4375C>T")
+    assert cache.stats() == {"hits": 1, "misses": 3, "evictions": 0, "size": 3, "max_size": 10000}
+
+
+def test_cache_eviction():
+    cache = ResultCache(2)
+    cache.to_model("R1:c.1del")
+    cache.to_model("R1:c.2del")
+    cache.to_model("R1:c.1del")
+    cache.to_model("R1:c.3del")
+    cache.to_model("R1:c.1del")
+    cache.to_model("R1:c.2del")
+    assert cache.stats() == {"hits": 2, "misses": 4, "evictions": 2, "size": 2, "max_size": 2}
+
+
+def test_cache_copies():
+    cache = ResultCache()
+    model = cache.to_model("R1:c.1del")
+    model["variants"].clear()
+    assert cache.to_model("R1:c.1del") == to_model("R1:c.1del")
+
+    parse_tree = cache.parse("R1:c.1del")
+    parse_tree.children.clear()
+    assert cache.parse("R1:c.1del") == parse("R1:c.1del")
+
+
+def test_cache_errors_not_cached():
+    cache = ResultCache()
+    for _ in range(2):
+        with pytest.raises(UnexpectedCharacter):
+            cache.to_model("R1:c.1del!")
+    assert cache.stats()["size"] == 0
+
+
+def test_cache_get_put():
+    cache = ResultCache()
+    key = ("to_model", "R1:c.1del", None, None)
+    assert cache.get(key) is None
+    cache.put(key, to_model("R1:c.1del"))
+    model = cache.get(key)
+    model["variants"].clear()
+    assert cache.to_model("R1:c.1del") == to_model("R1:c.1del")
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "size": 1, "max_size": 10000}
+
+
+def test_cache_clear():
+    cache = ResultCache()
+    cache.to_model("R1:c.1del")
+    cache.to_model("R1:c.1del")
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "max_size": 10000}
@@ -0,0 +1,55 @@
+"""
+Tests for the command line interface.
+"""
+
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from mutalyzer_hgvs_parser import usage, version
+from mutalyzer_hgvs_parser.cli import _arg_parser, _parse_raw, _to_model_stream
+from mutalyzer_hgvs_parser.convert import to_model
+
+
+def test_to_model_stream(capsys):
+    _to_model_stream(io.StringIO("R1:c.10del\n\nR1:c.10del!\n 10_11insA \n"), None, None)
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(lines) == 3
+    assert lines[0] == {"input": "R1:c.10del", "model": to_model("R1:c.10del")}
+    assert lines[1]["input"] == "R1:c.10del!"
+    assert lines[1]["error"]["type"] == "UnexpectedCharacter"
+    assert lines[1]["error"]["pos_in_stream"] == 10
+    assert lines[2]["input"] == "10_11insA"
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import mutalyzer_hgvs_parser",
+        "from mutalyzer_hgvs_parser.cli import _arg_parser; _arg_parser().parse_args(['R1:c.10del'])",
+    ],
+)
+def test_lazy_imports(code):
+    check = "; import sys; assert not {'lark', 'importlib.metadata'} & set(sys.modules), sorted(sys.modules)"
+    subprocess.run([sys.executable, "-c", code + check], check=True)
+
+
+def test_version(capsys):
+    with pytest.raises(SystemExit):
+        _arg_parser().parse_args(["-v"])
+    assert capsys.readouterr().out == version("mutalyzer_hgvs_parser") + "\n"
+
+
+def test_help():
+    parser = _arg_parser()
+    # Also read by the documentation, without printing the help.
+    assert [parser.description, parser.epilog] == usage
+    assert parser.format_help().rstrip().endswith(usage[1])
+
+
+def test_parse_raw():
+    # Not solving the DNA / protein ambiguity.
+    assert _parse_raw("R1:10_11insN", None, None).data == "_ambig"
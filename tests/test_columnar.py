@@ -0,0 +1,103 @@
+"""
+Tests for the columnar output.
+"""
+
+from mutalyzer_hgvs_parser.columnar import MISSING, VariantColumns, to_columns
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter
+
+from .test_convert import DESCRIPTIONS
+
+
+def test_to_columns():
+    columns = to_columns(
+        [
+            "NM_004006.2(NP_003997.1):c.-10+5_*12del",
+            "NM_004006.2:c.[10A>G;20_21insA[5]]",
+            "NM_004006.2:c.10del!",
+            "NG_012337.1:g.=",
+            "NP_003997.1:p.Trp24Cys",
+        ]
+    )
+
+    assert len(columns) == 5
+    assert columns.row(0) == {
+        "description": 0,
+        "variant": 0,
+        "reference": "NM_004006.2",
+        "selector": "NP_003997.1",
+        "coordinate_system": "c",
+        "type": "deletion",
+        "start": 10,
+        "start_offset": 5,
+        "start_outside_cds": -1,
+        "end": 12,
+        "end_offset": MISSING,
+        "end_outside_cds": 1,
+        "deleted": None,
+        "inserted": None,
+        "predicted": 0,
+        "model": -1,
+    }
+    assert columns.row(1)["deleted"] == "A"
+    assert columns.row(1)["inserted"] == "G"
+    assert columns.row(1)["end"] == MISSING
+
+    # Repeated insert and protein location.
+    assert columns.row(2)["model"] == 0
+    assert columns.row(2)["start"] == MISSING
+    assert columns.row(2)["inserted"] is None
+    # No variants.
+    assert columns.row(3)["variant"] == -1
+    assert columns.row(3)["type"] is None
+    assert columns.row(3)["start"] == MISSING
+    assert columns.row(3)["model"] == 1
+    assert columns.row(4)["model"] == 2
+    assert columns.models == [
+        to_model("NM_004006.2:c.[10A>G;20_21insA[5]]"),
+        to_model("NG_012337.1:g.="),
+        to_model("NP_003997.1:p.Trp24Cys"),
+    ]
+
+    assert list(columns.description) == [0, 1, 1, 3, 4]
+    assert list(columns.variant) == [0, 0, 1, -1, 0]
+    assert list(columns.errors) == [2]
+    assert isinstance(columns.errors[2], UnexpectedCharacter)
+
+
+def test_to_columns_no_variants():
+    columns = to_columns(["NP_003997.1:p.(=)", "NP_003997.1:p.?", "NP_003997.1:p.0"])
+    assert list(columns.description) == [0, 1, 2]
+    assert columns.row(0)["variant"] == -1
+    assert columns.row(0)["predicted"] == 1
+    assert columns.models[columns.row(0)["model"]] == to_model("NP_003997.1:p.(=)")
+
+
+def test_to_columns_buffers():
+    columns = to_columns(["NG_012337.1:g.100del", "NG_012337.1:g.200_300del"])
+    assert memoryview(columns.start).format == "q"
+    assert memoryview(columns.start).tolist() == [100, 200]
+    assert set(columns.as_dict()) == set(VariantColumns.COLUMNS)
+
+
+def test_to_columns_conformance():
+    columns = to_columns(DESCRIPTIONS)
+    models = list(DESCRIPTIONS.values())
+    assert not columns.errors
+    for i in range(len(columns)):
+        row = columns.row(i)
+        description = models[row["description"]]
+        assert row["reference"] == description["reference"]["id"]
+        if row["variant"] == -1:
+            assert not description.get("variants")
+            assert columns.models[row["model"]] == description
+            continue
+        variant = description["variants"][row["variant"]]
+        assert row["type"] == variant.get("type")
+        if row["model"] == -1:
+            location = variant["location"]
+            start = location["start"] if location["type"] == "range" else location
+            assert row["start"] == start["position"]
+            assert row["start_offset"] == start.get("offset", {"value": MISSING})["value"]
+        else:
+            assert columns.models[row["model"]] == description
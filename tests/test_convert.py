@@ -4,8 +4,13 @@ Tests for the lark tree to dictionary converter.
 
 import pytest
 
-from mutalyzer_hgvs_parser.convert import to_model
-from mutalyzer_hgvs_parser.exceptions import NestedDescriptions
+from mutalyzer_hgvs_parser.convert import parse_tree_to_model, to_model, to_model_many
+from mutalyzer_hgvs_parser.exceptions import (
+    NestedDescriptions,
+    UnexpectedCharacter,
+    UnexpectedEnd,
+)
+from mutalyzer_hgvs_parser.hgvs_parser import parse
 
 
 def _get_tests(tests):
@@ -1293,3 +1298,31 @@ def test_mix(description, model):
 def test_nested_descriptions(description):
     with pytest.raises(NestedDescriptions):
         to_model(description)
+
+
+def test_to_model_many():
+    descriptions = list(DESCRIPTIONS) + ["R1:c.10del!", "R1:c.", "R1:1delinsR2:2del"]
+    models = list(to_model_many(iter(descriptions)))
+    assert models[: len(DESCRIPTIONS)] == list(DESCRIPTIONS.values())
+    assert isinstance(models[-3], UnexpectedCharacter)
+    assert isinstance(models[-2], UnexpectedEnd)
+    assert isinstance(models[-1], NestedDescriptions)
+
+
+def test_to_model_many_start_rule():
+    assert list(to_model_many(VARIANTS, "variant")) == list(VARIANTS.values())
+
+
+def test_to_model_many_workers():
+    descriptions = list(DESCRIPTIONS) + ["R1:c.10del!", "R1:c.", "R1:1delinsR2:2del"]
+    models = list(to_model_many(descriptions, workers=2, chunk_size=7))
+    assert models[: len(DESCRIPTIONS)] == list(DESCRIPTIONS.values())
+    assert isinstance(models[-3], UnexpectedCharacter)
+    assert models[-3].serialize() == next(to_model_many(["R1:c.10del!"])).serialize()
+    assert isinstance(models[-2], UnexpectedEnd)
+    assert isinstance(models[-1], NestedDescriptions)
+
+
+@pytest.mark.parametrize("description, model", _get_tests(DESCRIPTIONS))
+def test_parse_tree_to_model(description, model):
+    assert parse_tree_to_model(parse(description)) == model
@@ -0,0 +1,87 @@
+"""
+Conformance tests for the fast path against the Earley parser path.
+"""
+
+import json
+
+import pytest
+
+from mutalyzer_hgvs_parser.convert import parse_tree_to_model
+from mutalyzer_hgvs_parser.fast_path import fast_to_model
+from mutalyzer_hgvs_parser.hgvs_parser import parse
+
+from . import test_hgvs_parser, test_syntax
+from .test_convert import DESCRIPTIONS, _get_mix
+from .test_protein import HGVS_NOMENCLATURE
+
+SIMPLE = [
+    "NM_004006.2:c.4375C>T",
+    "NG_012337.1(SDHD_v001):c.274G>T",
+    "NC_000023.10:g.100del",
+    "NC_000023.10:g.100delA",
+    "LRG_199t1:c.10_20dup",
+    "LRG_199t1:c.10_20dupTTAGC",
+    "R1:c.5_6insAT",
+    "R1:c.5_6delinsAT",
+    "R1:c.5delGinsAT",
+    "R1:c.5AT>GC",
+    "R1:c.5>G",
+    "R1:c.-10-5del",
+    "R1:c.*10+5_*12-?del",
+    "R1:c.10+?_11-?dup",
+    "R1:c.10_20inv",
+    "R1:c.10=",
+    "R1:r.10u>a",
+    "R1:10_11insN",
+]
+
+
+def _syntax_descriptions():
+    descriptions = []
+    for module in [test_syntax, test_hgvs_parser]:
+        for test in vars(module).values():
+            for mark in getattr(test, "pytestmark", []):
+                if mark.name == "parametrize" and mark.args[0] == "description":
+                    descriptions.extend(mark.args[1])
+    return descriptions
+
+
+def _corpus():
+    return SIMPLE + list(DESCRIPTIONS) + list(_get_mix()) + list(HGVS_NOMENCLATURE) + _syntax_descriptions()
+
+
+def test_fast_path_conformance():
+    recognized = 0
+    for description in _corpus():
+        model = fast_to_model(description)
+        if model is not None:
+            recognized += 1
+            # Same content and the same keys order.
+            assert json.dumps(model) == json.dumps(parse_tree_to_model(parse(description))), description
+    assert recognized > len(SIMPLE)
+
+
+@pytest.mark.parametrize("description", SIMPLE)
+def test_fast_path_simple(description):
+    assert fast_to_model(description) is not None
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "R1:c.10del!",
+        "R1:c.10 del",
+        "R1:c.10delN[2]",
+        "R1(R2(R3)):c.10del",
+        "R1:c.(10_20)del",
+        "R1:c.?del",
+        "R1:c.10del10",
+        "R1:c.[10del;20dup]",
+        "R1:c.(10del)",
+        "R1:c.10_11insR2:g.10_20",
+        "R1:p.Trp24Cys",
+        "R1:c.10",
+    ],
+)
+def test_fast_path_not_simple(description):
+    assert fast_to_model(description) is None
@@ -0,0 +1,78 @@
+"""
+Tests for the header extraction.
+"""
+
+import pytest
+
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter, UnexpectedEnd
+from mutalyzer_hgvs_parser.header import scan_header, to_header_model
+
+from .test_convert import DESCRIPTIONS
+from .test_protein import TESTS
+
+
+@pytest.mark.parametrize(
+    "description, header",
+    [
+        (
+            "NG_012337.1(SDHD_v001):c.274G>T",
+            {"reference": {"id": "NG_012337.1", "selector": {"id": "SDHD_v001"}}, "coordinate_system": "c"},
+        ),
+        ("NG_012337.1:274G>T", {"reference": {"id": "NG_012337.1"}}),
+        ("NP_003997.1:p.Trp24Cys", {"reference": {"id": "NP_003997.1"}, "coordinate_system": "p"}),
+        (
+            "NG_1(NM_1(NP_1)):c.1del",
+            {
+                "reference": {"id": "NG_1", "selector": {"id": "NM_1", "selector": {"id": "NP_1"}}},
+                "coordinate_system": "c",
+            },
+        ),
+        ("(NG_1):g.1del", {"reference": {"id": "NG_1"}, "coordinate_system": "g"}),
+        (
+            " NG_1 (NM_1) : c . 1del",
+            {"reference": {"id": "NG_1", "selector": {"id": "NM_1"}}, "coordinate_system": "c"},
+        ),
+        ("NG_1:pter_qterdel", {"reference": {"id": "NG_1"}}),
+        # The variants are not parsed.
+        ("NG_1:c.1delx", {"reference": {"id": "NG_1"}, "coordinate_system": "c"}),
+    ],
+)
+def test_to_header_model(description, header):
+    assert to_header_model(description) == header
+
+
+@pytest.mark.parametrize("description", list(DESCRIPTIONS) + [d for d in TESTS if TESTS[d]])
+def test_to_header_model_conformance(description):
+    model = to_model(description)
+    header = to_header_model(description)
+    assert header.pop("reference") == model["reference"]
+    assert header.get("coordinate_system") == model.get("coordinate_system")
+
+
+@pytest.mark.parametrize(
+    "description",
+    ["NG_1(NM_1)(NM_2):c.1del", "NG_1(NM_1:c.1del", "NG_1", "_NG_1:c.1del", "NG_1!:c.1del", ""],
+)
+def test_to_header_model_error(description):
+    with pytest.raises((UnexpectedCharacter, UnexpectedEnd)) as exc:
+        to_header_model(description)
+    with pytest.raises(exc.type) as model_exc:
+        to_model(description)
+    assert str(exc.value) == str(model_exc.value)
+
+
+@pytest.mark.parametrize(
+    "description, expected",
+    [
+        (
+            "NG_1(NM_1):c.1del",
+            ({"reference": {"id": "NG_1", "selector": {"id": "NM_1"}}, "coordinate_system": "c"}, 13),
+        ),
+        ("NG_1 : [1del;2del]", ({"reference": {"id": "NG_1"}}, 7)),
+        ("NG_1(NM_1:c.1del", None),
+        ("", None),
+    ],
+)
+def test_scan_header(description, expected):
+    assert scan_header(description) == expected
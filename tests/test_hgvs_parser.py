@@ -3,9 +3,25 @@ Syntax tests for the lark based HGVS parser - taken from the previous
 Mutalyzer tests.
 """
 
+import os
+import stat
+
 import pytest
+from lark import Lark
+
+from mutalyzer_hgvs_parser import hgvs_parser
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter
+from mutalyzer_hgvs_parser.hgvs_parser import (
+    HgvsParser,
+    builtin_start_rules,
+    get_parser,
+    new_parser,
+    parse,
+    parse_many,
+    warm_cache,
+)
 
-from mutalyzer_hgvs_parser.hgvs_parser import get_parser
+from .test_convert import DESCRIPTIONS
 
 
 @pytest.fixture
@@ -158,3 +174,114 @@ def test_parse_compound_delins(parser, description):
     Parse compound deletion-insertions.
     """
     parser(description)
+
+
+def test_multiple_start_rules():
+    parser = HgvsParser(start_rules=["description", "variant", "location"])
+    assert parser.parse("R1:c.10del", "description") == get_parser().parse("R1:c.10del")
+    assert parser.parse("10del", "variant") == HgvsParser(start_rule="variant").parse("10del")
+    assert parser.with_start_rule("location").parse("10_20") == parser.parse("10_20", "location")
+    with pytest.raises(ValueError):
+        parser.parse("10", "length")
+    with pytest.raises(ValueError):
+        HgvsParser(start_rule="length", start_rules=["description"])
+
+
+def test_get_parser_shared():
+    parsers = [get_parser(start_rule=start_rule) for start_rule in [None, "variant", "location", "inserted"]]
+    assert len({id(parser._parser) for parser in parsers}) == 1
+    assert {"description", "variant", "location", "inserted", "reference", "length"} <= set(builtin_start_rules())
+
+
+def test_cache_warm_default(tmp_path):
+    warm_cache(str(tmp_path))
+    # Earley and LALR, for all the start rules.
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_cache_warm_and_load(tmp_path, monkeypatch):
+    warm_cache(str(tmp_path))
+    expected = get_parser(start_rule="variant").parse("10del")
+
+    def no_build(*args, **kwargs):
+        raise AssertionError("parser should be loaded from the cache")
+
+    monkeypatch.setattr(Lark, "__init__", no_build)
+    monkeypatch.setenv(hgvs_parser.CACHE_ENV_VARIABLE, str(tmp_path))
+    # As `get_parser()` builds it.
+    parser = new_parser(start_rule="variant")
+    assert parser.parse("10del") == expected
+    assert parser.parse("R1:c.10del", "description") == get_parser().parse("R1:c.10del")
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_cache_load_lalr(tmp_path, monkeypatch):
+    HgvsParser(cache=str(tmp_path), lalr=True)
+    expected = get_parser()._parse("R1:c.[10del;20_21insA]")[0]
+
+    def no_build(*args, **kwargs):
+        raise AssertionError("parser should be loaded from the cache")
+
+    monkeypatch.setattr(Lark, "__init__", no_build)
+    parser = HgvsParser(cache=str(tmp_path), lalr=True)
+    parse_tree, resolved = parser._parse("R1:c.[10del;20_21insA]")
+    assert resolved
+    assert parse_tree == expected
+
+
+def test_cache_regenerated_when_invalid(tmp_path):
+    HgvsParser(cache=str(tmp_path))
+    (cache_file,) = tmp_path.iterdir()
+    cache_file.write_bytes(b"corrupted")
+
+    parser = HgvsParser(cache=str(tmp_path))
+    assert parser.parse("R1:c.10del", "description") == get_parser().parse("R1:c.10del")
+    assert cache_file.read_bytes() != b"corrupted"
+
+
+def test_cache_default_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    HgvsParser(start_rule="variant", cache=True)
+    cache_dir = tmp_path / "mutalyzer_hgvs_parser"
+    assert len(os.listdir(cache_dir)) == 1
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="no file ownership")
+@pytest.mark.parametrize("shared", ["directory", "file"])
+def test_cache_untrusted_not_loaded(tmp_path, shared):
+    HgvsParser(start_rule="variant", cache=str(tmp_path))
+    (cache_file,) = tmp_path.iterdir()
+    path = tmp_path if shared == "directory" else cache_file
+    path.chmod(path.stat().st_mode | stat.S_IWOTH)
+
+    key = cache_file.name[len("parser_") : -len(".pickle")]
+    assert hgvs_parser._load_cached_parser(str(cache_file), key) is None
+    path.chmod(path.stat().st_mode & ~stat.S_IWOTH)
+    assert hgvs_parser._load_cached_parser(str(cache_file), key) is not None
+
+
+def test_cache_key_options(tmp_path):
+    HgvsParser(cache=str(tmp_path))
+    HgvsParser(cache=str(tmp_path), ignore_white_spaces=False)
+    HgvsParser(start_rule="variant", cache=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 3
+
+
+def test_parse_many():
+    descriptions = ["NM_002001.2:c.12del", "NM_002001.2:c.12del!", "NM_002001.2:c.15_16insA"]
+    results = parse_many(descriptions)
+    assert next(results) == parse(descriptions[0])
+    assert isinstance(next(results), UnexpectedCharacter)
+    assert next(results) == parse(descriptions[2])
+
+
+@pytest.mark.parametrize("description", list(DESCRIPTIONS) + ["R1:10_11insN"])
+def test_get_parser_raw_tree(description):
+    # The LALR parser is only used when the ambiguities are solved.
+    assert get_parser().parse(description) == HgvsParser().parse(description)
+
+
+def test_lalr_unsupported():
+    with pytest.raises(ValueError):
+        HgvsParser(start_rule="variant", lalr=True)
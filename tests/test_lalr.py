@@ -0,0 +1,65 @@
+"""
+Conformance tests for the LALR subset parser against the Earley parser.
+"""
+
+import pytest
+from lark.exceptions import UnexpectedInput
+
+from mutalyzer_hgvs_parser.hgvs_parser import HgvsParser, _disambiguate
+
+from .test_fast_path import SIMPLE, _corpus
+
+
+@pytest.fixture(scope="module")
+def lalr_parser():
+    return HgvsParser(lalr=True)
+
+
+@pytest.fixture(scope="module")
+def earley_parser():
+    return HgvsParser()
+
+
+def test_lalr_conformance(lalr_parser, earley_parser):
+    accepted = 0
+    for description in _corpus():
+        try:
+            parse_tree = lalr_parser._lalr_parser.parse(description)
+        except UnexpectedInput:
+            continue
+        accepted += 1
+        assert _disambiguate(parse_tree) == _disambiguate(earley_parser.parse(description)), description
+    assert accepted > len(SIMPLE)
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "NG_012337.1(NM_003002.2):c.[274G>T;100_200delinsAGT;300dup]",
+        "R1:c.(10_20)_30del",
+        "R1:c.10_11ins[A;20_30inv]",
+        "R1:g.pter_qterdel",
+        "R1:c.[=]",
+        "R1:c.=",
+    ],
+)
+def test_lalr_accepted(lalr_parser, description):
+    lalr_parser._lalr_parser.parse(description)
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "R1:g.(10_15)",
+        "R1:c.10del10",
+        "R1:c.10_11insR2:g.10_20",
+        "R1:c.123_191CAG[19]",
+        "R1:c.(10del)",
+        "R1:c.100?del",
+        "R1:p.Trp24Cys",
+    ],
+)
+def test_lalr_fallback(lalr_parser, earley_parser, description):
+    with pytest.raises(UnexpectedInput):
+        lalr_parser._lalr_parser.parse(description)
+    assert _disambiguate(lalr_parser.parse(description)) == _disambiguate(earley_parser.parse(description))
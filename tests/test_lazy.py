@@ -0,0 +1,62 @@
+"""
+Tests for the lazy models.
+"""
+
+import json
+
+import pytest
+
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.exceptions import NestedDescriptions
+from mutalyzer_hgvs_parser.hgvs_parser import _parse_resolved, parse
+from mutalyzer_hgvs_parser.lazy import LazyDescription, parse_tree_to_lazy_model, to_lazy_model
+
+from .test_convert import DESCRIPTIONS
+from .test_protein import TESTS
+
+
+@pytest.mark.parametrize("description", list(DESCRIPTIONS) + [d for d in TESTS if TESTS[d]])
+def test_lazy_model(description):
+    model = to_model(description)
+    for parse_tree in [parse(description), _parse_resolved(description)]:
+        lazy_model = parse_tree_to_lazy_model(parse_tree)
+        assert lazy_model == model
+        # Same keys order.
+        assert json.dumps(lazy_model.to_dict()) == json.dumps(model)
+
+
+def test_lazy_model_partial():
+    lazy_model = to_lazy_model("NG_012337.1:g.[100_101insAT[5];200_300delinsNM_004006.2:c.10_20]")
+    assert isinstance(lazy_model, LazyDescription)
+    assert lazy_model["reference"]["id"] == "NG_012337.1"
+    assert [variant["type"] for variant in lazy_model["variants"]] == ["insertion", "deletion_insertion"]
+    variant = lazy_model["variants"][0]
+    assert variant._operation is None
+    assert variant["location"]["type"] == "range"
+    assert variant._operation is None
+    assert variant["inserted"] == [
+        {"sequence": "AT", "repeat_number": {"type": "point", "value": 5}, "source": "description"}
+    ]
+    assert "deleted" not in variant
+
+
+def test_lazy_model_predicted():
+    lazy_model = to_lazy_model("NP_003997.1:p.(Trp24Cys)")
+    assert lazy_model["predicted"] is True
+    assert "predicted" not in lazy_model["variants"][0]
+
+
+def test_lazy_model_fast_path():
+    assert to_lazy_model("NM_004006.2:c.4375C>T") == to_model("NM_004006.2:c.4375C>T")
+
+
+def test_lazy_model_nested_descriptions():
+    lazy_model = to_lazy_model("NG_012337.1:g.100_101insNM_004006.2:c.[10del;20del]")
+    assert lazy_model["variants"][0]["type"] == "insertion"
+    with pytest.raises(NestedDescriptions):
+        lazy_model["variants"][0]["inserted"]
+
+
+def test_lazy_model_not_description():
+    with pytest.raises(ValueError):
+        LazyDescription(parse("10del", start_rule="variant"))
@@ -0,0 +1,197 @@
+"""
+Tests for the parser limits.
+"""
+
+import asyncio
+import itertools
+import pickle
+
+import pytest
+
+from mutalyzer_hgvs_parser import hgvs_parser
+from mutalyzer_hgvs_parser.aio import aparse, ato_model, ato_model_many
+from mutalyzer_hgvs_parser.alleles import to_allele_model
+from mutalyzer_hgvs_parser.cache import ResultCache
+from mutalyzer_hgvs_parser.convert import to_model, to_model_many
+from mutalyzer_hgvs_parser.exceptions import LimitExceeded, UnexpectedCharacter
+from mutalyzer_hgvs_parser.hgvs_parser import HgvsParser, Limits, get_parser, parse, parse_many
+from mutalyzer_hgvs_parser.pool import ParserPool
+from mutalyzer_hgvs_parser.validation import Validation, validate, validate_many
+
+LONG_DESCRIPTION = "R1:c.10_11ins[" + ";".join(["N[10]"] * 20) + "]"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Clock advancing by one second every time it is read, so that a timeout
+    of N seconds is reached after about N characters are parsed.
+    """
+    ticks = itertools.count()
+    monkeypatch.setattr(hgvs_parser.time, "monotonic", lambda: float(next(ticks)))
+
+
+@pytest.mark.parametrize(
+    "limits, description, limit",
+    [
+        (Limits(max_length=20), "R1:c.10_11ins[A;T[5]]", "max_length"),
+        (Limits(max_depth=2), "R1:c.10_11ins[R2:c.[10_11ins[A]]]", "max_depth"),
+        (Limits(max_ambiguities=3), "R1:c.10_11ins[N[10];N[10];N[10];N[10]]", "max_ambiguities"),
+        (Limits(timeout=50), LONG_DESCRIPTION, "timeout"),
+        # Long sequences are shortened for parsing.
+        (Limits(timeout=50), "R1:c.10_11ins" + "A" * 100 + "T[5]" * 20, "timeout"),
+    ],
+)
+def test_limit_exceeded(clock, limits, description, limit):
+    with pytest.raises(LimitExceeded) as exc:
+        get_parser().with_limits(limits).parse(description)
+    assert exc.value.limit == limit
+    assert exc.value.maximum == getattr(limits, limit)
+    assert exc.value.description == description
+
+
+@pytest.mark.parametrize(
+    "limits, description",
+    [
+        (Limits(max_length=21), "R1:c.10_11ins[A;T[5]]"),
+        (Limits(max_depth=3), "R1:c.10_11ins[R2:c.[10_11ins[A]]]"),
+        (Limits(max_ambiguities=4), "R1:c.10_11ins[N[10];N[10];N[10];N[10]]"),
+        (Limits(timeout=60), "R1:c.10_11ins[N[10];N[10];N[10];N[10]]"),
+    ],
+)
+def test_limit_not_exceeded(limits, description):
+    assert get_parser().with_limits(limits).parse(description) == get_parser().parse(description)
+
+
+def test_limits_checked_first():
+    parser = HgvsParser(limits=Limits(max_length=5))
+    with pytest.raises(LimitExceeded):
+        parser.parse("R1:c.10del!")
+    with pytest.raises(UnexpectedCharacter):
+        parser.with_limits(None).parse("R1:c.10del!")
+
+
+def test_limits_timeout_reset(clock):
+    parser = get_parser().with_limits(Limits(timeout=50))
+    with pytest.raises(LimitExceeded):
+        parser.parse(LONG_DESCRIPTION)
+    assert parser.parse("R1:c.10_11insN[10]") == get_parser().parse("R1:c.10_11insN[10]")
+
+
+def test_limits_pool():
+    pool = ParserPool(size=1, limits=Limits(max_length=20))
+    with pytest.raises(LimitExceeded):
+        # Not taking the fast path.
+        pool.to_model("R1:c.10del" + " " * 20)
+    with pytest.raises(LimitExceeded):
+        pool.parse("R1:c.10_11ins[A;T[5]]")
+    assert pool.to_model("R1:c.10del") == to_model("R1:c.10del")
+
+
+def test_limits_functions():
+    limits = Limits(max_length=20)
+    # Taking the fast path, or not.
+    for description in ["R1:c.10del" + " " * 20, "R1:c.10_11ins[A;T[5]]"]:
+        for function in [parse, to_model, validate]:
+            with pytest.raises(LimitExceeded):
+                function(description, limits=limits)
+    assert parse("R1:c.10del", limits=limits) == parse("R1:c.10del")
+    assert to_model("10del", "variant", limits=limits) == to_model("10del", "variant")
+    assert validate("R1:c.10del!", limits=limits) == validate("R1:c.10del!")
+
+
+def test_limits_validate_timeout(clock):
+    with pytest.raises(LimitExceeded) as exc:
+        validate(LONG_DESCRIPTION, limits=Limits(timeout=50))
+    assert exc.value.limit == "timeout"
+    assert validate("R1:c.10_11insN[10]", limits=Limits(timeout=50)) == Validation("valid")
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_limits_to_model_many(workers):
+    descriptions = ["R1:c.10del", "R1:c.10_11ins[A;T[5]]", "R1:c.20del"]
+    results = list(to_model_many(descriptions, workers=workers, limits=Limits(max_length=20)))
+    assert results[0] == to_model("R1:c.10del")
+    assert isinstance(results[1], LimitExceeded)
+    assert results[1].description == descriptions[1]
+    assert results[2] == to_model("R1:c.20del")
+
+
+def test_limits_many():
+    descriptions = ["R1:c.10del", "R1:c.10_11ins[A;T[5]]"]
+    parse_trees = list(parse_many(descriptions, limits=Limits(max_length=20)))
+    assert parse_trees[0] == parse("R1:c.10del")
+    assert isinstance(parse_trees[1], LimitExceeded)
+    validations = list(validate_many(descriptions, limits=Limits(max_length=20)))
+    assert validations[0] == Validation("valid")
+    assert isinstance(validations[1], LimitExceeded)
+
+
+def test_limits_async():
+    limits = Limits(max_length=20)
+    for function in [aparse, ato_model]:
+        with pytest.raises(LimitExceeded):
+            asyncio.run(function("R1:c.10_11ins[A;T[5]]", limits=limits))
+    assert asyncio.run(ato_model("10del", "variant", limits)) == to_model("10del", "variant")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2])
+def test_limits_async_many(chunk_size):
+    descriptions = ["R1:c.10del", "R1:c.10_11ins[A;T[5]]", "R1:c.20del"]
+
+    async def run():
+        return [
+            model async for model in ato_model_many(descriptions, chunk_size=chunk_size, limits=Limits(max_length=20))
+        ]
+
+    results = asyncio.run(run())
+    assert results[0] == to_model("R1:c.10del")
+    assert isinstance(results[1], LimitExceeded)
+    assert results[1].description == descriptions[1]
+    assert results[2] == to_model("R1:c.20del")
+
+
+def test_limits_cache():
+    cache = ResultCache()
+    description = "R1:c.10_11ins[A;T[5]]"
+    assert cache.to_model(description) == to_model(description)
+    assert cache.parse(description) == parse(description)
+    # Not reusing the entries cached without limits.
+    with pytest.raises(LimitExceeded):
+        cache.to_model(description, limits=Limits(max_length=20))
+    with pytest.raises(LimitExceeded):
+        cache.parse(description, limits=Limits(max_length=20))
+    assert cache.to_model(description, limits=Limits(max_length=21)) == to_model(description)
+    assert cache.stats()["size"] == 3
+
+
+@pytest.mark.parametrize(
+    "limits, description, limit",
+    [
+        (Limits(max_length=30), "R1:c.[10del;20del;30_31ins[A;T[5]]]", "max_length"),
+        (Limits(max_depth=2), "R1:c.[10del;10_11ins[R2:c.[10_11ins[A]]]]", "max_depth"),
+        (Limits(max_ambiguities=3), "R1:c.[10del;10_11ins[N[10];N[10];N[10];N[10]]]", "max_ambiguities"),
+        (Limits(max_length=20), "R1:c.10_11ins[A;T[5]]", "max_length"),
+    ],
+)
+def test_limits_allele(limits, description, limit):
+    with pytest.raises(LimitExceeded) as exc:
+        to_allele_model(description, ResultCache(), limits=limits)
+    assert exc.value.limit == limit
+    assert exc.value.description == description
+
+
+def test_limits_allele_cache():
+    cache = ResultCache()
+    description = "R1:c.[10del;10_11ins[N[10];N[10];N[10];N[10]]]"
+    assert to_allele_model(description, cache) == to_model(description)
+    with pytest.raises(LimitExceeded):
+        to_allele_model(description, cache, limits=Limits(max_ambiguities=3))
+
+
+def test_limit_exceeded_pickle():
+    with pytest.raises(LimitExceeded) as exc:
+        get_parser().with_limits(Limits(max_length=5)).parse("R1:c.10del")
+    exception = pickle.loads(pickle.dumps(exc.value))
+    assert str(exception) == str(exc.value) == "Description longer than 5 characters"
+    assert exception.serialize() == {"limit": "max_length", "maximum": 5, "description": "R1:c.10del"}
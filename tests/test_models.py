@@ -0,0 +1,94 @@
+"""
+Tests for the slot based models.
+"""
+
+import json
+
+import pytest
+
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.models import (
+    Description,
+    Insert,
+    Offset,
+    Point,
+    Range,
+    Reference,
+    Variant,
+    to_typed_model,
+)
+
+from .test_convert import DESCRIPTIONS
+from .test_protein import TESTS
+
+
+@pytest.mark.parametrize("description", list(DESCRIPTIONS) + [d for d in TESTS if TESTS[d]])
+def test_typed_model_round_trip(description):
+    model = to_model(description)
+    typed_model = Description.from_dict(model)
+    assert typed_model.to_dict() == model
+    # Also in the same order.
+    assert json.dumps(typed_model.to_dict()) == json.dumps(model)
+    assert Description.from_dict(typed_model.to_dict()) == typed_model
+
+
+def test_to_typed_model():
+    assert to_typed_model("NM_004006.2(NP_003997.1):c.-10+5_*12del") == Description(
+        type="description_dna",
+        reference=Reference(id="NM_004006.2", selector=Reference(id="NP_003997.1")),
+        coordinate_system="c",
+        variants=[
+            Variant(
+                location=Range(
+                    start=Point(outside_cds="upstream", position=10, offset=Offset(value=5)),
+                    end=Point(outside_cds="downstream", position=12),
+                ),
+                type="deletion",
+                source="reference",
+            )
+        ],
+    )
+
+
+def test_typed_model_nested_description():
+    typed_model = to_typed_model("NG_012337.1:g.100_101ins[NM_000001.1:c.10_20inv]")
+    insert = typed_model.variants[0].inserted[0]
+    assert isinstance(insert, Insert)
+    assert insert.source == Reference(id="NM_000001.1")
+    assert insert.location.inverted
+
+
+def test_typed_model_nested_description_order():
+    description = "NG_012337.1:g.100_101ins[NM_000001.1:c.10_20[3]]"
+    assert list(to_typed_model(description).to_dict()["variants"][0]["inserted"][0]) == [
+        "type",
+        "coordinate_system",
+        "repeat_number",
+        "source",
+        "location",
+    ]
+    assert json.dumps(to_typed_model(description).to_dict()) == json.dumps(to_model(description))
+
+
+def test_typed_model_slots():
+    point = Point(position=1)
+    with pytest.raises(AttributeError):
+        point.unknown = 1
+
+
+@pytest.mark.parametrize(
+    "model, message",
+    [
+        ({"id": "R1", "unknown": 1}, "Unexpected Reference key: unknown."),
+        ({"id": "R1", "selector": {"id": "R2", "type": "point"}}, "Unexpected Reference key: type."),
+    ],
+)
+def test_typed_model_unexpected(model, message):
+    with pytest.raises(ValueError) as exc:
+        Reference.from_dict(model)
+    assert str(exc.value) == message
+
+
+def test_typed_model_unexpected_type():
+    with pytest.raises(ValueError):
+        Point.from_dict({"type": "range", "position": 1})
@@ -0,0 +1,146 @@
+"""
+Tests for concurrent parsing, with the shared parsers and a parser pool.
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mutalyzer_hgvs_parser import hgvs_parser
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.hgvs_parser import ambiguity_hits, get_parser, parse, reset_ambiguity_hits
+from mutalyzer_hgvs_parser.pool import ParserPool
+
+from .test_convert import DESCRIPTIONS
+
+THREADS = 8
+
+CORPUS = list(DESCRIPTIONS) + [
+    "NP_003997.1:p.(Trp24Cys)",
+    "NP_003997.1:p.Ala2[10]",
+    "NM_004006.2:c.4375C>T",
+    "NG_012337.1:g.100_101ins[AT[5];NM_004006.2:c.10_20]",
+]
+
+
+@pytest.fixture
+def interleaved():
+    """
+    Switch between the threads often.
+    """
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _concurrently(function, inputs, threads=THREADS):
+    barrier = threading.Barrier(threads)
+
+    def run(_):
+        barrier.wait()
+        return [function(item) for item in inputs]
+
+    with ThreadPoolExecutor(threads) as executor:
+        return list(executor.map(run, range(threads)))
+
+
+def test_to_model_shared(interleaved):
+    expected = [to_model(description) for description in CORPUS]
+    assert _concurrently(to_model, CORPUS) == [expected] * THREADS
+
+
+def test_parse_shared(interleaved):
+    expected = [parse(description) for description in CORPUS]
+    assert _concurrently(parse, CORPUS) == [expected] * THREADS
+
+
+def test_to_model_pool(interleaved):
+    pool = ParserPool(size=3)
+    expected = [to_model(description) for description in CORPUS]
+    assert _concurrently(pool.to_model, CORPUS) == [expected] * THREADS
+    assert len(pool) <= 3
+
+
+def test_parse_pool_start_rule():
+    pool = ParserPool(size=2, start_rule="variant")
+    assert pool.parse("10del") == parse("10del", start_rule="variant")
+    assert pool.to_model("10del") == to_model("10del", "variant")
+    assert len(pool) == 1
+
+
+def test_pool_reuse():
+    pool = ParserPool(size=2)
+    with pool.parser() as first:
+        pass
+    with pool.parser() as second:
+        pass
+    assert first is second
+
+
+def test_pool_bounded():
+    pool = ParserPool(size=2)
+    used = []
+
+    def run(_):
+        with pool.parser() as parser:
+            used.append(parser)
+            time.sleep(0.01)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        list(executor.map(run, range(4 * THREADS)))
+    assert len(pool) == 2
+    assert len({id(parser) for parser in used}) == 2
+
+
+def test_get_parser_built_once(monkeypatch):
+    built = []
+
+    def new_parser(grammar_path, start_rule):
+        built.append(grammar_path)
+        time.sleep(0.05)
+        return object()
+
+    monkeypatch.setattr(hgvs_parser, "new_parser", new_parser)
+    monkeypatch.setattr(hgvs_parser, "_parsers", {})
+    results = _concurrently(lambda _: get_parser("concurrent.g"), [None])
+
+    assert built == ["concurrent.g"]
+    assert len({id(parser) for parser, in results}) == 1
+
+
+def test_get_parser_builds_independent(monkeypatch):
+    release = threading.Event()
+
+    def new_parser(grammar_path, start_rule):
+        if grammar_path == "slow.g":
+            release.wait(5)
+        return object()
+
+    monkeypatch.setattr(hgvs_parser, "new_parser", new_parser)
+    monkeypatch.setattr(hgvs_parser, "_parsers", {})
+    slow = threading.Thread(target=get_parser, args=("slow.g",))
+    slow.start()
+    try:
+        # Not waiting for the other build.
+        fast = threading.Thread(target=get_parser, args=("fast.g",))
+        fast.start()
+        fast.join(1)
+        assert not fast.is_alive()
+    finally:
+        release.set()
+        slow.join()
+
+
+def test_ambiguity_hits_shared(interleaved):
+    reset_ambiguity_hits()
+    for description in CORPUS:
+        parse(description)
+    expected = {hit["index"]: hit["hits"] * THREADS for hit in ambiguity_hits()}
+
+    reset_ambiguity_hits()
+    _concurrently(parse, CORPUS)
+    assert {hit["index"]: hit["hits"] for hit in ambiguity_hits()} == expected
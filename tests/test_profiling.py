@@ -0,0 +1,122 @@
+"""
+Tests for the profiling instrumentation.
+"""
+
+import threading
+
+import pytest
+
+from mutalyzer_hgvs_parser.convert import to_model, to_model_many
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter
+from mutalyzer_hgvs_parser.hgvs_parser import AMBIGUITIES, parse
+from mutalyzer_hgvs_parser.profiling import Profiler
+
+
+@pytest.mark.parametrize(
+    "function, description, parser, stages",
+    [
+        (to_model, "NM_004006.2:c.4375C>T", "fast_path", {"fast_path", "total"}),
+        (
+            to_model,
+            "NM_004006.2:c.[100del;200dup]",
+            "lalr",
+            {"fast_path", "parsing", "conversion", "total"},
+        ),
+        (
+            to_model,
+            "NP_003997.1:p.Trp24Cys",
+            "earley",
+            {"fast_path", "parsing", "disambiguation", "conversion", "total"},
+        ),
+        (parse, "NM_004006.2:c.100del", "lalr", {"parsing", "flattening", "total"}),
+    ],
+)
+def test_profiler_call(function, description, parser, stages):
+    profiler = Profiler()
+    with profiler.activate():
+        function(description)
+
+    assert len(profiler.calls) == 1
+    record = profiler.calls[0]
+    assert record["function"] == function.__name__
+    assert record["description"] == description
+    assert record["parser"] == parser
+    assert set(record["stages"]) == stages
+    assert record["error"] is None
+
+
+def test_profiler_ambiguities():
+    profiler = Profiler()
+    with profiler.activate():
+        to_model("NM_004006.2:c.4375_4376insN[10]")
+
+    record = profiler.calls[0]
+    assert record["ambiguity_nodes"] == len(record["ambiguities"]) > 0
+    assert record["tree_nodes"] > record["ambiguity_nodes"]
+    for index in record["ambiguities"]:
+        assert AMBIGUITIES[index]["signature"][0] == "insert"
+    assert profiler.metrics()["ambiguities"] == {
+        index: record["ambiguities"].count(index) for index in record["ambiguities"]
+    }
+
+
+def test_profiler_error():
+    profiler = Profiler()
+    with profiler.activate():
+        with pytest.raises(UnexpectedCharacter):
+            to_model("R1:c.10del!")
+        results = list(to_model_many(["R1:c.10del!", "R1:c.10del"]))
+
+    assert isinstance(results[0], UnexpectedCharacter)
+    assert [record["error"] for record in profiler.calls] == [
+        "UnexpectedCharacter",
+        "UnexpectedCharacter",
+        None,
+    ]
+    assert profiler.metrics()["counters"]["errors"] == 2
+
+
+def test_profiler_metrics():
+    calls = []
+    profiler = Profiler(max_calls=2, on_call=calls.append)
+    with profiler.activate():
+        for description in ["R1:c.1del", "R1:c.2del", "R1:c.3del"]:
+            to_model(description)
+
+    assert len(calls) == 3
+    assert [record["description"] for record in profiler.calls] == ["R1:c.2del", "R1:c.3del"]
+
+    metrics = profiler.metrics()
+    assert metrics["counters"]["calls"] == 3
+    assert metrics["counters"]["calls_fast_path"] == 3
+    histogram = metrics["histograms"]["total"]
+    assert histogram["count"] == sum(histogram["counts"]) == 3
+
+    exposition = profiler.prometheus()
+    assert "mutalyzer_hgvs_parser_calls_total 3\n" in exposition
+    assert 'mutalyzer_hgvs_parser_stage_seconds_count{stage="total"} 3\n' in exposition
+
+
+def test_profiler_inactive():
+    profiler = Profiler()
+    with profiler.activate():
+        pass
+    to_model("R1:c.1del")
+    assert not profiler.calls
+
+
+def test_profiler_threads():
+    profiler = Profiler()
+
+    def convert():
+        with profiler.activate():
+            for _ in range(20):
+                to_model("R1:c.1del")
+
+    threads = [threading.Thread(target=convert) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert profiler.metrics()["counters"]["calls"] == 80
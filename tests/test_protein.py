@@ -1,6 +1,7 @@
 import pytest
 
 from mutalyzer_hgvs_parser import parse, to_model
+from mutalyzer_hgvs_parser.convert import parse_tree_to_model
 
 HGVS_NOMENCLATURE = {
     # Substitution
@@ -1026,3 +1027,12 @@ def test_hgvs_protein_parse(description):
 def test_hgvs_protein_convert(description):
     if TESTS.get(description):
         assert to_model(description) == TESTS[description]
+
+
+@pytest.mark.parametrize(
+    "description",
+    TESTS.keys(),
+)
+def test_hgvs_protein_parse_tree_to_model(description):
+    if TESTS.get(description):
+        assert parse_tree_to_model(parse(description)) == TESTS[description]
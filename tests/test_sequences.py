@@ -0,0 +1,109 @@
+"""
+Tests for parsing descriptions with long sequences.
+"""
+
+import pytest
+from lark import Token
+
+from mutalyzer_hgvs_parser import hgvs_parser
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter, UnexpectedEnd
+from mutalyzer_hgvs_parser.hgvs_parser import get_parser
+from mutalyzer_hgvs_parser.sequences import restore, shorten
+
+SEQUENCE = "ACGTTGCAAC" * 10
+
+PROTEIN_SEQUENCE = "AlaGlyCysW" * 10
+
+
+def _tokens(parse_tree):
+    return [
+        (token.type, token.value, token.start_pos, token.end_pos, token.column, token.end_column)
+        for token in parse_tree.scan_values(lambda value: isinstance(value, Token))
+    ]
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        f"R1:g.10_11delins[{SEQUENCE};R2:c.10_20]",
+        f"R1:g.10_11ins[{SEQUENCE}[5];{SEQUENCE.lower()}]",
+        f"R1:g.10_11{SEQUENCE}[3]{SEQUENCE}[4]",
+        f"R1:g.[10_11ins{SEQUENCE};20del]",
+        f"R1:g.(10_11ins{SEQUENCE})",
+        f"R1:g.10_11ins[R2:c.10_11ins{SEQUENCE}]",
+        f"P1:p.Trp24_Cys25ins{PROTEIN_SEQUENCE}",
+        f"P1:p.Ala2_Gly3ins[{PROTEIN_SEQUENCE};{PROTEIN_SEQUENCE}]",
+        f"P1:p.Arg97_Cys98delins{PROTEIN_SEQUENCE}",
+        # Not a sequence, so parsed as it is.
+        f"{SEQUENCE}:g.10del",
+        f"R1({SEQUENCE}):c.10del",
+    ],
+)
+def test_long_sequence(description):
+    parser = get_parser()
+    expected = parser._parser.parse(description, "description")
+    parse_tree = parser._parse_earley(description, "description")
+    assert parse_tree == expected
+    assert _tokens(parse_tree) == _tokens(expected)
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        f"R1:g.10_11delins[{SEQUENCE}!{SEQUENCE};R2:c.10_20]",
+        f"R1:g.10_11delins[{SEQUENCE}",
+        f"P1:p.Trp24_Cys25ins{PROTEIN_SEQUENCE}Xyz",
+    ],
+)
+def test_long_sequence_error(description, monkeypatch):
+    with pytest.raises((UnexpectedCharacter, UnexpectedEnd)) as shortened:
+        to_model(description)
+    monkeypatch.setattr(hgvs_parser, "shorten", lambda description: (description, []))
+    with pytest.raises((UnexpectedCharacter, UnexpectedEnd)) as expected:
+        to_model(description)
+    assert type(shortened.value) is type(expected.value)
+    assert shortened.value.serialize() == expected.value.serialize()
+
+
+def test_shorten():
+    description = f"R1:g.10_11delins[{SEQUENCE};R2:c.10_20;{PROTEIN_SEQUENCE}]"
+    shortened, spans = shorten(description)
+    assert shortened == "R1:g.10_11delins[ACGTTGCAGTTGCAAC;R2:c.10_20;AlaGlyCysWAlaGlyCysWAlaGlyCysWAlaGlyCysW]"
+    assert [(span.start, span.end, span.sequence) for span in spans] == [
+        (17, 33, SEQUENCE),
+        (45, 85, PROTEIN_SEQUENCE),
+    ]
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        f"R1:g.10_11ins{SEQUENCE}[3]",
+        f"R1:g.10_11delins{SEQUENCE}",
+        f"R1:g.10_11del{SEQUENCE}ins{SEQUENCE}",
+        f"R1:g.[10_11ins{SEQUENCE};20dup{SEQUENCE}]",
+        f"P1:p.Arg97_Cys98delins{PROTEIN_SEQUENCE}",
+    ],
+)
+def test_shorten_after_operation(description):
+    shortened, spans = shorten(description)
+    assert spans
+    # Not falling back to parsing the original description.
+    assert restore(get_parser()._parser.parse(shortened, "description"), spans) is not None
+
+
+def test_shorten_short():
+    description = f"R1:g.10_11delins[{SEQUENCE[:63]}]"
+    assert shorten(description) == (description, [])
+
+
+def test_restore_not_sequence():
+    shortened, spans = shorten(f"{SEQUENCE}:g.10del")
+    assert restore(get_parser().parse(shortened), spans) is None
+
+
+def test_to_model_long_sequence():
+    sequence = SEQUENCE * 1000
+    model = to_model(f"R1:g.10_11delins[{sequence};R2:c.10_20]")
+    assert model["variants"][0]["inserted"][0] == {"sequence": sequence, "source": "description"}
@@ -0,0 +1,77 @@
+"""
+Tests for the editing session.
+"""
+
+import pytest
+
+from mutalyzer_hgvs_parser import session as session_module
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter, UnexpectedEnd
+from mutalyzer_hgvs_parser.hgvs_parser import parse
+from mutalyzer_hgvs_parser.session import ParseSession
+
+
+def _outcome(description, start_rule=None):
+    try:
+        return "valid", parse(description, start_rule=start_rule), None
+    except (UnexpectedCharacter, UnexpectedEnd) as e:
+        return "invalid" if isinstance(e, UnexpectedCharacter) else "incomplete", None, str(e)
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "NM_004006.2:c.[4375C>T;4380_4390del]",
+        "NM_004006.2:c.43x75C>T",
+        "NP_003997.1:p.(Trp24Cys)",
+        "R1(R2):-10ins[pter_qterinv;1+_20]",
+    ],
+)
+def test_session_typing(description):
+    session = ParseSession()
+    for end in list(range(1, len(description) + 1)) + list(range(len(description) - 1, 0, -1)):
+        state = session.update(description[:end])
+        status, tree, error = _outcome(description[:end])
+        assert state.status == status
+        assert state.tree == tree
+        assert (None if state.error is None else str(state.error)) == error
+
+
+def test_session_state():
+    session = ParseSession()
+    state = session.update("NM_004006.2:c.4375C>")
+    assert state.status == "incomplete"
+    assert state.position == 19
+    assert state.expecting
+
+    state = session.update("NM_004006.2:c.4375C>T")
+    assert state.status == "valid"
+    assert state.position is None
+    assert state.expecting == []
+    assert session.state is state
+
+
+def test_session_reuse(monkeypatch):
+    session = ParseSession()
+    error = session.update("NM_004006.2:c.43x75C>T;10").error
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Not reused.")
+
+    monkeypatch.setattr(session_module, "parse", fail)
+    state = session.update("NM_004006.2:c.43x75C>T;10del")
+    assert state.status == "invalid"
+    assert state.error is not error
+    assert state.error.description == "NM_004006.2:c.43x75C>T;10del"
+    assert str(state.error) == _outcome("NM_004006.2:c.43x75C>T;10del")[2]
+
+    # Previous versions.
+    assert session.update("NM_004006.2:c.43x75C>T;10").error is error
+
+
+def test_session_history():
+    session = ParseSession(start_rule="variant", history=2)
+    session.update("10del")
+    session.update("10dup")
+    session.update("10inv")
+    assert list(session._states) == ["10dup", "10inv"]
+    assert session.update("10del").status == "valid"
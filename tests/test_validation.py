@@ -0,0 +1,99 @@
+"""
+Tests for the validation only mode.
+"""
+
+import pytest
+
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter, UnexpectedEnd
+from mutalyzer_hgvs_parser.hgvs_parser import get_parser, parse
+from mutalyzer_hgvs_parser.validation import Validation, is_valid, validate, validate_many
+
+from .test_convert import DESCRIPTIONS
+
+INVALID = [
+    "NM_004006.2:c.43x75C>T",
+    "NM_004006.2:c.4375C>",
+    "NM_004006.2:c.[4375C>T;4380_4390del",
+    "NM_004006.2:c.4375C>T;",
+    "NM_004006.2",
+    "NP_003997.1:p.(Trp24Cys",
+    "R1(R2):-10ins[pter_qterinv;1+_20",
+    "NG_012337.1:g.100_101ins[AT[5];NM_004006.2:c.10_x]",
+    "",
+]
+
+
+def _outcome(description, start_rule=None):
+    try:
+        parse(description, start_rule=start_rule)
+    except UnexpectedCharacter as e:
+        return Validation("invalid", e.pos_in_stream)
+    except UnexpectedEnd as e:
+        return Validation("incomplete", e.pos_in_stream)
+    return Validation("valid")
+
+
+@pytest.mark.parametrize("description", list(DESCRIPTIONS) + INVALID)
+def test_validate(description):
+    assert validate(description) == _outcome(description)
+
+
+@pytest.mark.parametrize(
+    "description, start_rule",
+    [
+        ("10del", "variant"),
+        ("10_20", "location"),
+        ("10x", "variant"),
+        ("[10del;20dup]", "variants"),
+        ("(10_20)", "location"),
+    ],
+)
+def test_validate_start_rule(description, start_rule):
+    assert validate(description, start_rule) == _outcome(description, start_rule)
+
+
+def test_is_valid():
+    assert is_valid("NM_004006.2:c.4375C>T")
+    assert not is_valid("NM_004006.2:c.4375C>")
+
+
+def test_validate_many():
+    descriptions = ["NM_004006.2:c.4375C>T", "NM_004006.2:c.43x75C>T", "NM_004006.2:c.4375C>"]
+    assert list(validate_many(descriptions)) == [
+        Validation("valid"),
+        Validation("invalid", 20),
+        Validation("incomplete", 19),
+    ]
+
+
+def test_validate_no_tree(monkeypatch):
+    # Not in the LALR subset, so only the Earley parser recognizes it.
+    description = "NP_003997.1:p.(Trp24Cys)"
+    parser = get_parser()
+    monkeypatch.setattr(parser, "_parser", None)
+    assert is_valid(description)
+
+
+@pytest.mark.parametrize(
+    "description, expected",
+    [
+        ("R1:c.10_11ins[" + "ACGT" * 25000 + ";R2:c.10_20]", Validation("valid")),
+        ("R1:g.10_11ins" + "ACGT" * 25000 + "[3]", Validation("valid")),
+        ("R1:c.10_11ins[" + "ACGT" * 25000 + ";R2:c.10_x]", Validation("invalid", 100023)),
+    ],
+)
+def test_validate_long_sequence(description, expected, monkeypatch):
+    # Built on first use.
+    validate("NP_003997.1:p.(Trp24Cys)")
+    recognizer = get_parser()._recognizers["forest"]
+    recognized = []
+
+    class CountingRecognizer:
+        def parse(self, *args):
+            recognized.append(args)
+            return recognizer.parse(*args)
+
+    monkeypatch.setitem(get_parser()._recognizers, "forest", CountingRecognizer())
+    assert validate(description) == expected
+    # Shortened as for parsing, and only recognized as it is if not valid.
+    assert len(recognized) == (expected.status != "valid")